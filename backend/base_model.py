@@ -1,10 +1,33 @@
-import uuid
+import secrets
+import time
 from datetime import datetime
 
 from sqlalchemy import Column, DateTime, String, func
 from sqlalchemy.orm import DeclarativeBase, declared_attr
 
 
+def new_id() -> str:
+    """Return a new UUIDv7 as a 36-char hyphenated string.
+
+    UUIDv7 leads with a 48-bit millisecond timestamp, so ids are roughly
+    insert-ordered (B-tree appends instead of random page splits) while
+    keeping the String(36) format of existing uuid4 rows.  The random bits
+    come from the OS CSPRNG, so ids stay unpredictable and distinct across
+    forked workers (a private PRNG would be cloned by fork()).
+    """
+    ms = time.time_ns() // 1_000_000
+    rand = secrets.randbits(74)
+    value = (
+        (ms & 0xFFFF_FFFF_FFFF) << 80
+        | 0x7 << 76                       # version 7
+        | (rand >> 62) << 64              # rand_a (12 bits)
+        | 0b10 << 62                      # RFC 4122 variant
+        | (rand & ((1 << 62) - 1))        # rand_b (62 bits)
+    )
+    h = f"{value:032x}"
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+
 class Base(DeclarativeBase):
     """SQLAlchemy declarative base for all P2P models."""
     pass
@@ -27,12 +50,12 @@ class TimestampMixin:
 
 
 class IDMixin:
-    """Mixin that adds a UUID primary key stored as String(36) for SQLite compatibility."""
+    """Mixin that adds a UUIDv7 primary key stored as String(36) for SQLite compatibility."""
 
     id = Column(
         String(36),
         primary_key=True,
-        default=lambda: str(uuid.uuid4()),
+        default=new_id,
         nullable=False,
     )
 
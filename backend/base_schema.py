@@ -0,0 +1,18 @@
+from pydantic import BaseModel, ConfigDict
+
+
+class FastBase(BaseModel):
+    """Shared base for response schemas built from ORM objects or service dicts.
+
+    Centralises the ``from_attributes`` config every module used to repeat,
+    and pins the cheap validation settings explicitly so a subclass can't
+    silently opt into instance revalidation or default re-validation.
+    """
+
+    model_config = ConfigDict(
+        from_attributes=True,
+        revalidate_instances="never",
+        extra="ignore",
+        validate_default=False,
+        defer_build=False,
+    )
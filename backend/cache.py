@@ -0,0 +1,85 @@
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+# TTL tiers (seconds) for per-endpoint cache policies
+TTL_SHORT = 5
+TTL_NORMAL = 30
+TTL_LONG = 60
+
+
+class ResponseCache:
+    """In-process TTL cache for hot, read-mostly endpoints.
+
+    Entries are grouped by namespace (e.g. "gst-cache", "ebs-events") so a
+    write path can invalidate everything it affects with one ``clear()``.
+    Mirrors the Redis-backed cache planned for production the same way the
+    event bus mirrors future Kafka topics.
+
+    Expired entries are kept around as a stale fallback: if the loader
+    raises (e.g. DB unavailable), the last good value is served instead.
+
+    Writers must ``clear()`` after their transaction commits.  A load that
+    was already in flight when the namespace was cleared is returned to its
+    caller but not stored, so it can't repopulate the cache with rows read
+    before the write.
+    """
+
+    def __init__(self):
+        self._store: Dict[str, Dict[str, Tuple[float, Any]]] = {}
+        # Bumped by clear(); loads started under an older generation are dropped
+        self._generation: Dict[str, int] = {}
+
+    def get(self, namespace: str, key: str = "") -> Optional[Any]:
+        """Return a fresh cached value, or None if missing/expired."""
+        entry = self._store.get(namespace, {}).get(key)
+        if entry is None or entry[0] < time.monotonic():
+            return None
+        return entry[1]
+
+    def set(self, namespace: str, value: Any, expire: int, key: str = "") -> None:
+        """Store a value under namespace/key for ``expire`` seconds."""
+        self._store.setdefault(namespace, {})[key] = (time.monotonic() + expire, value)
+
+    def clear(self, namespace: str) -> None:
+        """Invalidate every entry in a namespace."""
+        self._store.pop(namespace, None)
+        self._generation[namespace] = self._generation.get(namespace, 0) + 1
+
+    async def get_or_load(
+        self,
+        namespace: str,
+        loader: Callable[[], Awaitable[Any]],
+        expire: int,
+        key: str = "",
+    ) -> Any:
+        """Return the cached value, calling ``loader`` on miss/expiry.
+
+        Serves the last (stale) value if the loader fails and one exists.
+        """
+        entry = self._store.get(namespace, {}).get(key)
+        if entry is not None and entry[0] >= time.monotonic():
+            return entry[1]
+
+        generation = self._generation.get(namespace, 0)
+        try:
+            value = await loader()
+        except Exception:
+            if entry is None:
+                raise
+            logger.warning(
+                "Serving stale cache for %s/%s after loader failure",
+                namespace, key, exc_info=True,
+            )
+            return entry[1]
+
+        if self._generation.get(namespace, 0) == generation:
+            self.set(namespace, value, expire, key)
+        return value
+
+
+# Singleton instance — import this wherever you need the response cache
+response_cache = ResponseCache()
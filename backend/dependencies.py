@@ -27,6 +27,9 @@ async def get_db() -> AsyncSession:  # type: ignore[misc]
 
 _bearer_scheme = HTTPBearer(auto_error=False)
 
+# ``sub`` of the stub user returned while AUTH_ENABLED is False
+DEV_USER_SUB = "dev-user"
+
 
 async def get_current_user(
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(_bearer_scheme),
@@ -38,7 +41,7 @@ async def get_current_user(
     """
     if not settings.AUTH_ENABLED:
         return {
-            "sub": "dev-user",
+            "sub": DEV_USER_SUB,
             "name": "Developer",
             "role": "admin",
         }
@@ -67,6 +70,19 @@ async def get_current_user(
     return payload
 
 
+async def get_current_user_id(
+    current_user: Dict[str, Any] = Depends(get_current_user),
+) -> Optional[str]:
+    """The current user's id for per-user filtering.
+
+    Returns None for the dev-mode stub user, meaning "all users", so routes
+    don't each repeat the ``sub == "dev-user"`` check.  Shares the request's
+    cached ``get_current_user`` result; the token is decoded once.
+    """
+    sub = current_user.get("sub")
+    return None if sub == DEV_USER_SUB else sub
+
+
 # ---------------------------------------------------------------------------
 # Role-based access control dependency
 # ---------------------------------------------------------------------------
@@ -1,7 +1,7 @@
 import asyncio
 import logging
 from datetime import datetime, timezone
-from typing import Any, Callable, Coroutine, Dict, List
+from typing import Any, Callable, Coroutine, Dict, List, Set
 
 logger = logging.getLogger(__name__)
 
@@ -41,6 +41,9 @@ class EventBus:
     def __init__(self):
         self._subscribers: Dict[str, List[EventHandler]] = {}
         self._event_log: List[Dict[str, Any]] = []
+        # Strong refs to in-flight handler tasks — the loop only keeps weak
+        # ones, so an unreferenced task can be garbage-collected mid-run
+        self._pending: Set[asyncio.Task] = set()
 
     def subscribe(self, event_name: str, handler: EventHandler) -> None:
         """Register an async handler for a specific event name."""
@@ -60,7 +63,9 @@ class EventBus:
         """Publish an event — dispatches to all registered handlers asynchronously.
 
         Each handler is invoked via asyncio.create_task so that a slow or
-        failing handler does not block the publisher or other handlers.
+        failing handler does not block the publisher or other handlers —
+        awaiting ``publish`` costs only the audit-log append, never the
+        subscribers' own work.  Tasks are held in ``_pending`` until done.
         """
         # Record in the audit log
         self._event_log.append(event.to_dict())
@@ -68,7 +73,9 @@ class EventBus:
 
         handlers = self._subscribers.get(event.name, [])
         for handler in handlers:
-            asyncio.create_task(self._safe_invoke(handler, event))
+            task = asyncio.create_task(self._safe_invoke(handler, event))
+            self._pending.add(task)
+            task.add_done_callback(self._pending.discard)
 
     async def _safe_invoke(self, handler: EventHandler, event: Event) -> None:
         """Invoke a handler and catch exceptions so one failure doesn't propagate."""
@@ -79,6 +86,16 @@ class EventBus:
                 "Handler %s failed for event '%s'", handler.__name__, event.name
             )
 
+    async def drain(self) -> None:
+        """Wait for all in-flight handler tasks to finish.
+
+        ``publish`` never waits for handlers, so call this where they must
+        have completed: at shutdown (so audit writes aren't cancelled with
+        the loop) or in tests before asserting on handler side effects.
+        """
+        while self._pending:
+            await asyncio.gather(*self._pending, return_exceptions=True)
+
     @property
     def event_log(self) -> List[Dict[str, Any]]:
         """Return a copy of the audit event log."""
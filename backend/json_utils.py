@@ -0,0 +1,29 @@
+"""
+JSON serialization helpers — orjson-backed encoding for API responses.
+
+orjson serializes ``datetime``, ``date``, ``UUID`` and dataclasses natively
+in C, replacing the stdlib ``json.dumps`` that FastAPI's default
+``JSONResponse`` uses.
+"""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+# Non-str dict keys (e.g. int counters) are stringified like stdlib json does.
+# OPT_NAIVE_UTC is deliberately not set: naive datetimes keep their existing
+# offset-less ISO form so the frontend contract is unchanged.
+_DUMPS_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+def fast_dumps(obj: Any) -> bytes:
+    """Serialize ``obj`` to JSON bytes with orjson."""
+    return orjson.dumps(obj, option=_DUMPS_OPTIONS)
+
+
+class FastORJSONResponse(JSONResponse):
+    """JSONResponse rendered with :func:`fast_dumps` — the app-wide default."""
+
+    def render(self, content: Any) -> bytes:
+        return fast_dumps(content)
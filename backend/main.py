@@ -38,19 +38,21 @@ from contextlib import asynccontextmanager
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional
 
-from fastapi import FastAPI, Depends, HTTPException
+from fastapi import FastAPI, Depends, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import FileResponse
 from fastapi.staticfiles import StaticFiles
 from sqlalchemy import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from backend.cache import TTL_LONG, TTL_SHORT, response_cache
 from backend.config import settings
 from backend.database import engine
 from backend.base_model import Base
 from backend.dependencies import get_db
 from backend.event_bus import Event, event_bus
 from backend.exceptions import register_exception_handlers
+from backend.json_utils import FastORJSONResponse, fast_dumps
 
 # ── Module routers (mounted directly — 14 routers) ──────────────────
 from backend.modules.auth.routes import router as auth_router
@@ -75,6 +77,7 @@ from backend.modules.reports.routes import router as reports_router
 from backend.modules.gst_cache import service as gst_service
 from backend.modules.msme_compliance import service as msme_service
 from backend.modules.ebs_integration import service as ebs_service
+from backend.modules.purchase_orders import service as po_service
 from backend.modules.ai_agents import service as ai_service
 from backend.modules.analytics import service as analytics_service
 from backend.modules.audit import service as audit_service
@@ -94,7 +97,7 @@ from backend.modules.workflow.models import ApprovalMatrix, ApprovalInstance, Ap
 from backend.modules.matching.models import MatchResult, MatchingException  # noqa: F401
 from backend.modules.notifications.models import Notification  # noqa: F401
 from backend.modules.audit.models import AuditLog  # noqa: F401
-from backend.modules.payments.models import Payment, PaymentRun  # noqa: F401
+from backend.modules.payments.models import Payment, PaymentCounter, PaymentRun  # noqa: F401
 from backend.modules.tds.models import TDSDeduction  # noqa: F401
 from backend.modules.documents.models import Document  # noqa: F401
 from backend.modules.contracts.models import Contract  # noqa: F401
@@ -185,13 +188,20 @@ async def lifespan(app: FastAPI):
         "payment.run_created", "payment.run_scheduled",
         "payment.run_processing", "payment.run_completed",
         "tds.deduction_created", "tds.deposited",
+        "supplier.updated",
     ]
     for event_name in _all_events:
         event_bus.subscribe(event_name, _log_event)
         event_bus.subscribe(event_name, _audit_event)
 
+    # Cross-module cache invalidation
+    event_bus.subscribe("supplier.updated", po_service.on_supplier_updated)
+
     yield
 
+    # Handlers run detached from requests; let in-flight ones finish
+    await event_bus.drain()
+
 
 # ─────────────────────────────────────────────────────────────────
 # App Factory
@@ -201,6 +211,7 @@ app = FastAPI(
     title="P2P Platform API",
     version="0.5.0",
     lifespan=lifespan,
+    default_response_class=FastORJSONResponse,
     docs_url="/docs" if settings.ENABLE_DOCS else None,
     redoc_url="/redoc" if settings.ENABLE_DOCS else None,
 )
@@ -472,8 +483,29 @@ async def get_dashboard(db: AsyncSession = Depends(get_db)):
 # ─────────────────────────────────────────────────────────────────
 
 @app.get("/api/gst-cache")
-async def get_gst_cache(db: AsyncSession = Depends(get_db)):
-    """List all GST cache records with summary stats (legacy shape)."""
+async def get_gst_cache(request: Request, db: AsyncSession = Depends(get_db)):
+    """List all GST cache records with summary stats (legacy shape).
+
+    Carries an ``ETag`` from the cache fingerprint (record count + latest
+    full sync); a matching ``If-None-Match`` gets a bare 304.  Otherwise
+    the serialized body is served from the response cache, keyed by the
+    fingerprint (long TTL; invalidated on sync).
+    """
+    etag = await gst_service.get_cache_fingerprint(db)
+    headers = {"ETag": etag}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+
+    async def _load() -> bytes:
+        return fast_dumps(await _load_gst_cache(db))
+
+    body = await response_cache.get_or_load(
+        "gst-cache", _load, expire=TTL_LONG, key=f"legacy:{etag}",
+    )
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+async def _load_gst_cache(db: AsyncSession) -> Dict[str, Any]:
     result = await db.execute(
         select(GSTRecord).order_by(GSTRecord.legal_name)
     )
@@ -617,7 +649,16 @@ async def get_msme_compliance(db: AsyncSession = Depends(get_db)):
 
 @app.get("/api/oracle-ebs/events")
 async def get_ebs_events(db: AsyncSession = Depends(get_db)):
-    """List EBS integration events with summary (legacy shape)."""
+    """List EBS integration events with summary (legacy shape).
+
+    Served from the response cache (short TTL); invalidated on retry.
+    """
+    return await response_cache.get_or_load(
+        "ebs-events", lambda: _load_ebs_events(db), expire=TTL_SHORT, key="legacy",
+    )
+
+
+async def _load_ebs_events(db: AsyncSession) -> Dict[str, Any]:
     events = await ebs_service.list_ebs_events(db)
 
     acknowledged = len([e for e in events if e["status"] == "ACKNOWLEDGED"])
@@ -0,0 +1,72 @@
+"""Store invoice money columns as integer paise
+
+Replaces the Float rupee columns on ``invoices`` with BigInteger ``*_paise``
+columns (the model exposes rupee views over them) and back-fills each from
+``ROUND(rupees * 100)``.  Also drops ``msme_days_remaining``, which is now
+derived from ``msme_due_date`` and never written.  Assumes the pre-paise
+``invoices`` table as ``create_all`` built it from the earlier models.
+
+Revision ID: a1fa41c52adf
+Revises:
+Create Date: 2026-10-16 04:40:00.000000
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a1fa41c52adf"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (rupee column, nullable) — the paise column keeps the same nullability
+_MONEY_COLUMNS = (
+    ("subtotal", False),
+    ("gst_amount", False),
+    ("tds_amount", False),
+    ("total_amount", False),
+    ("net_payable", False),
+    ("msme_penalty_amount", True),
+)
+
+
+def upgrade() -> None:
+    # Add nullable first so existing rows can be back-filled
+    with op.batch_alter_table("invoices") as batch:
+        for name, _ in _MONEY_COLUMNS:
+            batch.add_column(sa.Column(f"{name}_paise", sa.BigInteger(), nullable=True))
+
+    for name, _ in _MONEY_COLUMNS:
+        op.execute(
+            f"UPDATE invoices SET {name}_paise = CAST(ROUND({name} * 100) AS BIGINT)"
+        )
+
+    with op.batch_alter_table("invoices") as batch:
+        for name, nullable in _MONEY_COLUMNS:
+            if not nullable:
+                batch.alter_column(
+                    f"{name}_paise", existing_type=sa.BigInteger(), nullable=False,
+                )
+            batch.drop_column(name)
+        batch.drop_column("msme_days_remaining")
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("invoices") as batch:
+        for name, _ in _MONEY_COLUMNS:
+            batch.add_column(sa.Column(name, sa.Float(), nullable=True))
+        # Restored empty; the model computes it from msme_due_date on read
+        batch.add_column(sa.Column("msme_days_remaining", sa.Integer(), nullable=True))
+
+    for name, _ in _MONEY_COLUMNS:
+        op.execute(f"UPDATE invoices SET {name} = {name}_paise / 100.0")
+
+    with op.batch_alter_table("invoices") as batch:
+        for name, nullable in _MONEY_COLUMNS:
+            if not nullable:
+                batch.alter_column(name, existing_type=sa.Float(), nullable=False)
+            batch.drop_column(f"{name}_paise")
@@ -8,11 +8,9 @@ AI agents: InvoiceCodingAgent, FraudDetectionAgent, SLAPredictionAgent,
 Derived from the 7-record AI_INSIGHTS and the agents config in the prototype.
 """
 
-import uuid
-
 from sqlalchemy import Column, String, Boolean, Float, Text, DateTime, JSON, func
 
-from backend.base_model import Base, TimestampMixin
+from backend.base_model import Base, TimestampMixin, new_id
 
 
 class AIInsight(TimestampMixin, Base):
@@ -26,7 +24,7 @@ class AIInsight(TimestampMixin, Base):
 
     __tablename__ = "ai_insights"
 
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()), nullable=False)
+    id = Column(String(36), primary_key=True, default=new_id, nullable=False)
     insight_code = Column(String(20), nullable=True, index=True)  # e.g. "AI001"
     agent = Column(String(50), nullable=False)  # Agent name
     invoice_id = Column(String(36), nullable=True, index=True)  # FK conceptual to invoices
@@ -49,7 +47,7 @@ class AgentConfig(TimestampMixin, Base):
 
     __tablename__ = "agent_configs"
 
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()), nullable=False)
+    id = Column(String(36), primary_key=True, default=new_id, nullable=False)
     name = Column(String(50), unique=True, nullable=False)  # e.g. "InvoiceCodingAgent"
     display_name = Column(String(100), nullable=True)
     model = Column(String(100), nullable=True)  # e.g. "fine-tuned-bert-v2.1"
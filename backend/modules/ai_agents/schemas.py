@@ -17,22 +17,22 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Any, Optional
 
-from pydantic import BaseModel, ConfigDict, Field, model_validator
+from pydantic import Field, model_validator
+
+from backend.base_schema import FastBase
 
 
 # ---------------------------------------------------------------------------
 # AI insight response (list endpoint)
 # ---------------------------------------------------------------------------
 
-class AIInsightResponse(BaseModel):
+class AIInsightResponse(FastBase):
     """Single AI insight — uses legacy field names.
 
     ``id`` is always equal to ``insight_code`` (e.g. "AI001") and ``type``
     is always equal to ``insight_type`` — the frontend expects this.
     """
 
-    model_config = ConfigDict(from_attributes=True)
-
     id: str = Field(
         ...,
         description="Same as insight_code — the human-readable insight identifier.",
@@ -71,14 +71,12 @@ class AIInsightResponse(BaseModel):
 # AI insight apply response
 # ---------------------------------------------------------------------------
 
-class AIInsightApplyResponse(BaseModel):
+class AIInsightApplyResponse(FastBase):
     """Response returned by the apply endpoint.
 
     Confirms the insight was applied with the updated status and timestamp.
     """
 
-    model_config = ConfigDict(from_attributes=True)
-
     id: str = Field(
         ...,
         description="Same as insight_code — the human-readable insight identifier.",
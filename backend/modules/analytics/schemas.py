@@ -12,18 +12,16 @@ from __future__ import annotations
 
 from typing import List
 
-from pydantic import BaseModel, ConfigDict
+from backend.base_schema import FastBase
 
 
 # ---------------------------------------------------------------------------
 # Nested models for spend analytics response
 # ---------------------------------------------------------------------------
 
-class SpendSummary(BaseModel):
+class SpendSummary(FastBase):
     """Top-level KPI summary for month-to-date spend analytics."""
 
-    model_config = ConfigDict(from_attributes=True)
-
     total_spend_mtd: float
     total_invoices: int
     avg_cycle_days: float
@@ -32,30 +30,24 @@ class SpendSummary(BaseModel):
     early_payment_savings: float
 
 
-class SpendByCategory(BaseModel):
+class SpendByCategory(FastBase):
     """Spend breakdown by procurement category."""
 
-    model_config = ConfigDict(from_attributes=True)
-
     category: str
     amount: float
     pct: float
 
 
-class MonthlyTrend(BaseModel):
+class MonthlyTrend(FastBase):
     """Monthly spend trend data point."""
 
-    model_config = ConfigDict(from_attributes=True)
-
     month: str
     amount: float
 
 
-class TopSupplier(BaseModel):
+class TopSupplier(FastBase):
     """Top supplier by spend volume."""
 
-    model_config = ConfigDict(from_attributes=True)
-
     supplier: str
     amount: float
     invoices: int
@@ -65,7 +57,7 @@ class TopSupplier(BaseModel):
 # Top-level analytics response
 # ---------------------------------------------------------------------------
 
-class SpendAnalyticsResponse(BaseModel):
+class SpendAnalyticsResponse(FastBase):
     """Complete spend analytics payload returned by ``GET /api/analytics/spend``.
 
     Combines real-time summary KPIs (queried from the Invoice table) with
@@ -73,8 +65,6 @@ class SpendAnalyticsResponse(BaseModel):
     top suppliers.
     """
 
-    model_config = ConfigDict(from_attributes=True)
-
     summary: SpendSummary
     spend_by_category: List[SpendByCategory]
     monthly_trend: List[MonthlyTrend]
@@ -6,11 +6,9 @@ Append-only audit trail — NO UPDATE or DELETE operations allowed.
 RBI requires 7-year retention of all audit records.
 """
 
-import uuid
-
 from sqlalchemy import Column, String, Text, DateTime, JSON, func
 
-from backend.base_model import Base
+from backend.base_model import Base, new_id
 
 
 class AuditLog(Base):
@@ -30,7 +28,7 @@ class AuditLog(Base):
 
     __tablename__ = "audit_logs"
 
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()), nullable=False)
+    id = Column(String(36), primary_key=True, default=new_id, nullable=False)
     event_type = Column(String(100), nullable=False, index=True)
     source_module = Column(String(50), nullable=False)
     entity_type = Column(String(50), nullable=True)  # INVOICE, PR, PO, SUPPLIER, etc.
@@ -9,12 +9,12 @@ from __future__ import annotations
 
 from typing import Any, Dict, Optional
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel
 
+from backend.base_schema import FastBase
 
-class AuditLogResponse(BaseModel):
-    model_config = ConfigDict(from_attributes=True)
 
+class AuditLogResponse(FastBase):
     id: str
     event_type: str
     source_module: str
@@ -3,11 +3,9 @@ Auth Module — SQLAlchemy Models
 Table: users
 """
 
-import uuid
-
 from sqlalchemy import Column, String, Boolean, DateTime, func
 
-from backend.base_model import Base, TimestampMixin
+from backend.base_model import Base, TimestampMixin, new_id
 
 
 class User(TimestampMixin, Base):
@@ -18,7 +16,7 @@ class User(TimestampMixin, Base):
 
     __tablename__ = "users"
 
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()), nullable=False)
+    id = Column(String(36), primary_key=True, default=new_id, nullable=False)
     email = Column(String(255), unique=True, nullable=False, index=True)
     hashed_password = Column(String(255), nullable=False)
     full_name = Column(String(255), nullable=False)
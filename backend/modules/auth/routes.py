@@ -12,7 +12,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.config import settings
-from backend.dependencies import get_db, get_current_user, require_role, paginate
+from backend.dependencies import DEV_USER_SUB, get_db, get_current_user, require_role, paginate
 from backend.exceptions import AuthenticationError, AuthorizationError
 from backend.modules.auth.constants import ADMIN
 from backend.modules.auth.models import User
@@ -88,7 +88,7 @@ async def me(
     user_id = current_user.get("sub")
 
     # If auth is disabled but a real token was sent, decode it
-    if user_id == "dev-user":
+    if user_id == DEV_USER_SUB:
         auth_header = request.headers.get("authorization", "")
         if auth_header.startswith("Bearer "):
             from jose import jwt, JWTError
@@ -102,7 +102,7 @@ async def me(
             except JWTError:
                 pass
 
-    if user_id is None or user_id == "dev-user":
+    if user_id is None or user_id == DEV_USER_SUB:
         raise AuthenticationError("Invalid token payload")
 
     result = await db.execute(select(User).where(User.id == user_id))
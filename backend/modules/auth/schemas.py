@@ -7,12 +7,13 @@ Request / response models for authentication endpoints.
 from datetime import datetime
 from typing import Optional
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, Field
 
+from backend.base_schema import FastBase
 from backend.modules.auth.constants import ALL_ROLES, VIEWER
 
 
-class UserCreate(BaseModel):
+class UserCreate(FastBase):
     """Payload for user registration."""
 
     email: str
@@ -25,8 +26,6 @@ class UserCreate(BaseModel):
 class UserResponse(BaseModel):
     """Public representation of a user (no password)."""
 
-    model_config = ConfigDict(from_attributes=True)
-
     id: str
     email: str
     full_name: str
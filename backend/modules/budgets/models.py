@@ -5,11 +5,9 @@ Tables: budgets, budget_encumbrances
 Derived from the 6-record BUDGETS list in the prototype.
 """
 
-import uuid
-
 from sqlalchemy import Column, String, Integer, Float, DateTime, ForeignKey, func
 
-from backend.base_model import Base, TimestampMixin
+from backend.base_model import Base, TimestampMixin, new_id
 
 
 class Budget(TimestampMixin, Base):
@@ -21,7 +19,7 @@ class Budget(TimestampMixin, Base):
 
     __tablename__ = "budgets"
 
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()), nullable=False)
+    id = Column(String(36), primary_key=True, default=new_id, nullable=False)
     department_code = Column(String(10), nullable=False, index=True)  # e.g. TECH, OPS, FIN
     department_name = Column(String(100), nullable=False)
     gl_account = Column(String(20), nullable=True)
@@ -44,7 +42,7 @@ class BudgetEncumbrance(Base):
 
     __tablename__ = "budget_encumbrances"
 
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()), nullable=False)
+    id = Column(String(36), primary_key=True, default=new_id, nullable=False)
     budget_id = Column(String(36), ForeignKey("budgets.id"), nullable=False, index=True)
     reference_type = Column(String(10), nullable=False)  # PR / PO
     reference_id = Column(String(20), nullable=False)
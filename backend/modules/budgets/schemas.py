@@ -13,14 +13,16 @@ from __future__ import annotations
 
 from typing import Any, Optional
 
-from pydantic import BaseModel, ConfigDict, model_validator
+from pydantic import BaseModel, model_validator
+
+from backend.base_schema import FastBase
 
 
 # ---------------------------------------------------------------------------
 # Response schemas
 # ---------------------------------------------------------------------------
 
-class BudgetResponse(BaseModel):
+class BudgetResponse(FastBase):
     """Flat budget representation returned by the list endpoint.
 
     Maps DB column names to the legacy API shape:
@@ -32,8 +34,6 @@ class BudgetResponse(BaseModel):
         available_amount -> available
     """
 
-    model_config = ConfigDict(from_attributes=True)
-
     dept: str
     dept_name: str
     gl_account: Optional[str] = None
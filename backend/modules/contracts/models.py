@@ -6,11 +6,9 @@ Contract Lifecycle Management (CLM) for vendor agreements.
 Covers MSA, SOW, NDA, SLA, and amendment tracking.
 """
 
-import uuid
-
 from sqlalchemy import Column, String, Float, Boolean, Integer, Text, DateTime, func
 
-from backend.base_model import Base, TimestampMixin
+from backend.base_model import Base, TimestampMixin, new_id
 
 
 class Contract(TimestampMixin, Base):
@@ -21,7 +19,7 @@ class Contract(TimestampMixin, Base):
 
     __tablename__ = "contracts"
 
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()), nullable=False)
+    id = Column(String(36), primary_key=True, default=new_id, nullable=False)
     contract_number = Column(String(30), nullable=False, unique=True, index=True)
     title = Column(String(255), nullable=False)
     supplier_id = Column(String(36), nullable=True, index=True)
@@ -5,12 +5,12 @@ Contracts Module — Pydantic Schemas
 from __future__ import annotations
 
 from typing import Optional
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, Field
 
+from backend.base_schema import FastBase
 
-class ContractResponse(BaseModel):
-    model_config = ConfigDict(from_attributes=True)
 
+class ContractResponse(FastBase):
     id: str
     contract_number: str
     title: str
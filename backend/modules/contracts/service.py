@@ -4,13 +4,13 @@ Contracts Module — Business Logic
 
 from __future__ import annotations
 
-import uuid
 from datetime import datetime, timedelta
 from typing import List, Optional
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from backend.base_model import new_id
 from backend.modules.contracts.models import Contract
 
 
@@ -45,7 +45,7 @@ async def create_contract(db: AsyncSession, data: dict) -> Contract:
     count_result = await db.execute(select(Contract))
     count = len(list(count_result.scalars().all()))
     contract = Contract(
-        id=str(uuid.uuid4()),
+        id=new_id(),
         contract_number=_next_contract_number(count),
         **data,
     )
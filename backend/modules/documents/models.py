@@ -6,11 +6,9 @@ Stores document metadata (invoice PDFs, PO attachments, GRN photos, contracts).
 Actual files stored on filesystem or object storage — this table tracks metadata.
 """
 
-import uuid
-
 from sqlalchemy import Column, String, Integer, Text, DateTime, func
 
-from backend.base_model import Base, TimestampMixin
+from backend.base_model import Base, TimestampMixin, new_id
 
 
 class Document(TimestampMixin, Base):
@@ -24,7 +22,7 @@ class Document(TimestampMixin, Base):
 
     __tablename__ = "documents"
 
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()), nullable=False)
+    id = Column(String(36), primary_key=True, default=new_id, nullable=False)
     entity_type = Column(String(20), nullable=False, index=True)  # INVOICE, PO, PR, GRN, SUPPLIER, CONTRACT
     entity_id = Column(String(100), nullable=False, index=True)  # human-readable code (INV001, PO2024-001)
     document_type = Column(String(50), nullable=False)
@@ -6,12 +6,12 @@ from __future__ import annotations
 
 from typing import Optional
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel
 
+from backend.base_schema import FastBase
 
-class DocumentResponse(BaseModel):
-    model_config = ConfigDict(from_attributes=True)
 
+class DocumentResponse(FastBase):
     id: str
     entity_type: str
     entity_id: str
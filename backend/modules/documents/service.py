@@ -10,7 +10,7 @@ from __future__ import annotations
 import hashlib
 from typing import Any, Dict, List, Optional
 
-from sqlalchemy import func, select
+from sqlalchemy import func, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.modules.documents.models import Document
@@ -43,23 +43,27 @@ async def create_document(
     )
     current_version = ver_result.scalar() or 0
 
-    doc = Document(
-        entity_type=entity_type,
-        entity_id=entity_id,
-        document_type=document_type,
-        file_name=file_name,
-        file_size=file_size,
-        mime_type=mime_type,
-        storage_type="LOCAL",
-        storage_path=storage_path or f"/documents/{entity_type}/{entity_id}/{file_name}",
-        checksum=hashlib.sha256(f"{entity_id}:{file_name}:{current_version + 1}".encode()).hexdigest(),
-        version=current_version + 1,
-        uploaded_by=uploaded_by,
-        description=description,
+    # INSERT ... RETURNING hydrates server defaults (created_at) in the
+    # same round trip — no follow-up refresh SELECT
+    result = await db.scalars(
+        insert(Document).returning(Document),
+        [{
+            "entity_type": entity_type,
+            "entity_id": entity_id,
+            "document_type": document_type,
+            "file_name": file_name,
+            "file_size": file_size,
+            "mime_type": mime_type,
+            "storage_type": "LOCAL",
+            "storage_path": storage_path or f"/documents/{entity_type}/{entity_id}/{file_name}",
+            "checksum": hashlib.sha256(f"{entity_id}:{file_name}:{current_version + 1}".encode()).hexdigest(),
+            "version": current_version + 1,
+            "uploaded_by": uploaded_by,
+            "description": description,
+        }],
     )
-    db.add(doc)
+    doc = result.one()
     await db.commit()
-    await db.refresh(doc)
     return _doc_to_dict(doc)
 
 
@@ -9,11 +9,9 @@ Assets — all PR/PO/Invoice UI is handled by the P2P platform.
 Derived from the 8-record EBS_EVENTS list in the prototype.
 """
 
-import uuid
-
 from sqlalchemy import Column, String, Integer, Float, Text, DateTime, func
 
-from backend.base_model import Base, TimestampMixin
+from backend.base_model import Base, TimestampMixin, new_id
 
 
 class EBSEvent(TimestampMixin, Base):
@@ -26,7 +24,7 @@ class EBSEvent(TimestampMixin, Base):
 
     __tablename__ = "ebs_events"
 
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()), nullable=False)
+    id = Column(String(36), primary_key=True, default=new_id, nullable=False)
     event_code = Column(String(20), nullable=True, index=True)  # e.g. "EBS001"
     event_type = Column(String(30), nullable=False)
     entity_id = Column(String(50), nullable=True, index=True)
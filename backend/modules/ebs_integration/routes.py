@@ -16,6 +16,7 @@ from typing import Any, Dict, List
 from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from backend.cache import TTL_SHORT, response_cache
 from backend.dependencies import get_db, get_current_user, require_role
 from backend.modules.ebs_integration.schemas import EBSEventResponse, EBSRetryResponse
 from backend.modules.ebs_integration import service
@@ -35,10 +36,15 @@ async def list_ebs_events(
     """Return all Oracle EBS integration events.
 
     Each event's ``id`` field corresponds to the ``event_code`` column
-    (e.g. "EBS001") to match the legacy API contract.
+    (e.g. "EBS001") to match the legacy API contract.  Served from the
+    response cache (short TTL); invalidated on retry.
     """
-    events = await service.list_ebs_events(db)
-    return [EBSEventResponse.model_validate(e) for e in events]
+
+    async def _load() -> List[EBSEventResponse]:
+        events = await service.list_ebs_events(db)
+        return [EBSEventResponse.model_validate(e) for e in events]
+
+    return await response_cache.get_or_load("ebs-events", _load, expire=TTL_SHORT)
 
 
 # ---------------------------------------------------------------------------
@@ -17,22 +17,22 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Any, Optional
 
-from pydantic import BaseModel, ConfigDict, Field, model_validator
+from pydantic import Field, model_validator
+
+from backend.base_schema import FastBase
 
 
 # ---------------------------------------------------------------------------
 # EBS event response (list endpoint)
 # ---------------------------------------------------------------------------
 
-class EBSEventResponse(BaseModel):
+class EBSEventResponse(FastBase):
     """Single EBS integration event — uses legacy field names.
 
     ``id`` is always equal to ``event_code`` (e.g. "EBS001") — the
     frontend expects this.
     """
 
-    model_config = ConfigDict(from_attributes=True)
-
     id: str = Field(
         ...,
         description="Same as event_code — the human-readable event identifier.",
@@ -68,15 +68,13 @@ class EBSEventResponse(BaseModel):
 # EBS retry response
 # ---------------------------------------------------------------------------
 
-class EBSRetryResponse(BaseModel):
+class EBSRetryResponse(FastBase):
     """Response returned by the retry endpoint.
 
     Includes a human-readable ``message`` field alongside the core
     event fields.
     """
 
-    model_config = ConfigDict(from_attributes=True)
-
     id: str = Field(
         ...,
         description="Same as event_code — the human-readable event identifier.",
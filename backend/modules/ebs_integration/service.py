@@ -13,6 +13,7 @@ from typing import Any, Dict, List
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from backend.cache import response_cache
 from backend.event_bus import Event, event_bus
 from backend.exceptions import NotFoundError, ValidationError
 from backend.modules.ebs_integration.models import EBSEvent
@@ -67,6 +68,7 @@ async def retry_event(db: AsyncSession, event_code: str) -> Dict[str, Any]:
       raise a ``ValidationError``.
     - Resets ``status`` to ``PENDING``, increments ``retry_count`` by 1,
       and clears ``error_message``.
+    - Invalidates the ``ebs-events`` response cache.
     - Publishes an ``ebs.event_retried`` domain event on the event bus.
 
     Returns a dict suitable for serialisation as ``EBSRetryResponse``.
@@ -93,8 +95,11 @@ async def retry_event(db: AsyncSession, event_code: str) -> Dict[str, Any]:
     event.retry_count = (event.retry_count or 0) + 1
     event.error_message = None
 
-    await db.flush()
-    await db.refresh(event)
+    # All response fields were just set in Python — no refresh needed.
+    # Commit before invalidating so a concurrent reload can't re-cache the
+    # pre-retry rows (get_db would only commit after the response is sent).
+    await db.commit()
+    response_cache.clear("ebs-events")
 
     # Publish domain event
     await event_bus.publish(Event(
@@ -9,11 +9,9 @@ require live API calls. All other GST lookups are served from this cache.
 Derived from the 15-record GST_CACHE list in the prototype.
 """
 
-import uuid
-
 from sqlalchemy import Column, String, Boolean, Integer, Text, DateTime, func
 
-from backend.base_model import Base, TimestampMixin
+from backend.base_model import Base, TimestampMixin, new_id
 
 
 class GSTRecord(TimestampMixin, Base):
@@ -25,7 +23,7 @@ class GSTRecord(TimestampMixin, Base):
 
     __tablename__ = "gst_records"
 
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()), nullable=False)
+    id = Column(String(36), primary_key=True, default=new_id, nullable=False)
     gstin = Column(String(15), unique=True, nullable=False, index=True)
     legal_name = Column(String(500), nullable=False)
     status = Column(String(20), nullable=False, default="ACTIVE")  # ACTIVE / SUSPENDED / CANCELLED
@@ -48,7 +46,7 @@ class GSTSyncLog(Base):
 
     __tablename__ = "gst_sync_log"
 
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()), nullable=False)
+    id = Column(String(36), primary_key=True, default=new_id, nullable=False)
     synced_at = Column(DateTime, nullable=False, server_default=func.now())
     provider = Column(String(50), nullable=False, default="Cygnet GSP")
     records_updated = Column(Integer, nullable=False, default=0)
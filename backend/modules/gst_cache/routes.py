@@ -13,10 +13,12 @@ from __future__ import annotations
 
 from typing import Any, Dict
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from backend.cache import TTL_LONG, response_cache
 from backend.dependencies import get_db, get_current_user, require_role
+from backend.json_utils import fast_dumps
 from backend.modules.gst_cache.schemas import (
     GSTCacheListResponse,
     GSTCacheSummary,
@@ -34,15 +36,33 @@ router = APIRouter(prefix="/api/gst-cache", tags=["gst-cache"])
 
 @router.get("", response_model=GSTCacheListResponse)
 async def list_gst_cache(
+    request: Request,
     db: AsyncSession = Depends(get_db),
     _user: Dict[str, Any] = Depends(get_current_user),
-) -> GSTCacheListResponse:
-    """Return all cached GSTIN records with an aggregate summary."""
-    data = await service.list_gst_records(db)
-    return GSTCacheListResponse(
-        records=[GSTRecordResponse.model_validate(r) for r in data["records"]],
-        summary=GSTCacheSummary(**data["summary"]),
-    )
+) -> Response:
+    """Return all cached GSTIN records with an aggregate summary.
+
+    The response carries an ``ETag`` derived from the record count and the
+    latest full sync; a matching ``If-None-Match`` gets a bare 304.  The
+    serialized body is memoized per ETag (long TTL, invalidated on sync),
+    so repeat reads skip ORM hydration, validation and JSON encoding.
+    """
+    etag = await service.get_cache_fingerprint(db)
+    headers = {"ETag": etag}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+
+    cached = response_cache.get("gst-cache", key="json")
+    if cached is None or cached[0] != etag:
+        data = await service.list_gst_records(db)
+        payload = GSTCacheListResponse(
+            records=[GSTRecordResponse.model_validate(r) for r in data["records"]],
+            summary=GSTCacheSummary(**data["summary"]),
+        )
+        cached = (etag, fast_dumps(payload.model_dump()))
+        response_cache.set("gst-cache", cached, expire=TTL_LONG, key="json")
+
+    return Response(content=cached[1], media_type="application/json", headers=headers)
 
 
 # ---------------------------------------------------------------------------
@@ -11,22 +11,22 @@ from __future__ import annotations
 
 from typing import List, Optional
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel
+
+from backend.base_schema import FastBase
 
 
 # ---------------------------------------------------------------------------
 # Record-level response
 # ---------------------------------------------------------------------------
 
-class GSTRecordResponse(BaseModel):
+class GSTRecordResponse(FastBase):
     """Single cached GSTIN record returned by the list endpoint.
 
     Field names map 1-to-1 with the ``gst_records`` table columns that
     the legacy frontend consumes.
     """
 
-    model_config = ConfigDict(from_attributes=True)
-
     gstin: str
     legal_name: str
     status: str
@@ -15,6 +15,7 @@ from typing import Any, Dict, Optional
 from sqlalchemy import func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from backend.cache import response_cache
 from backend.modules.gst_cache.models import GSTRecord, GSTSyncLog
 
 
@@ -64,6 +65,28 @@ async def list_gst_records(db: AsyncSession) -> Dict[str, Any]:
     }
 
 
+async def get_cache_fingerprint(db: AsyncSession) -> str:
+    """Return a cheap version tag for the GST cache contents.
+
+    Combines the record count with the id of the latest FULL sync-log
+    entry — both change whenever the record list does, so the tag can be
+    used as an HTTP ETag without loading any records.
+    """
+
+    result = await db.execute(
+        select(
+            select(func.count(GSTRecord.id)).scalar_subquery(),
+            select(GSTSyncLog.id)
+            .where(GSTSyncLog.batch_type == "FULL")
+            .order_by(GSTSyncLog.synced_at.desc())
+            .limit(1)
+            .scalar_subquery(),
+        )
+    )
+    total, last_full_sync_id = result.one()
+    return f'"{total}:{last_full_sync_id or 0}"'
+
+
 async def get_gst_by_gstin(db: AsyncSession, gstin: str) -> Optional[GSTRecord]:
     """Look up a single GST record by its GSTIN (used by invoice detail)."""
 
@@ -88,7 +111,8 @@ async def sync_gst_cache(db: AsyncSession) -> Dict[str, Any]:
     """Simulate a batch sync of GSTIN data from Cygnet GSP.
 
     In production this would call the Cygnet batch API.  For now it
-    updates ``last_synced`` on every record and writes a sync-log entry.
+    updates ``last_synced`` on every record, writes a sync-log entry, and
+    invalidates the ``gst-cache`` response cache.
 
     Returns a dict matching the ``GSTSyncResponse`` shape.
     """
@@ -118,6 +142,7 @@ async def sync_gst_cache(db: AsyncSession) -> Dict[str, Any]:
     db.add(log_entry)
 
     await db.commit()
+    response_cache.clear("gst-cache")
 
     return {
         "status": "completed",
@@ -9,11 +9,61 @@ Covers: OCR extraction, GST validation, 2/3-way matching, MSME compliance,
 Derived from the 7-record INVOICES list in the prototype.
 """
 
-import uuid
+from datetime import date
+from functools import lru_cache
+from operator import attrgetter
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Final, List, Mapping, Optional, Tuple
 
-from sqlalchemy import Column, String, Boolean, Integer, Float, Text, DateTime, JSON, ForeignKey, func
+import orjson
+from sqlalchemy import BigInteger, Column, String, Boolean, Integer, Float, Text, DateTime, ForeignKey, Index, func, inspect, text
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy.orm import deferred, relationship
+from sqlalchemy.sql.functions import FunctionElement
 
-from backend.base_model import Base, TimestampMixin
+from backend.base_model import Base, TimestampMixin, new_id
+
+
+def _rupee_view(paise_attr: str) -> hybrid_property:
+    """Rupee (float) accessor over an integer paise column.
+
+    Reads divide by 100, writes round to the nearest paisa, and the SQL
+    expression divides in the database so ``func.sum(Invoice.net_payable)``
+    and friends keep working unchanged.
+    """
+
+    def fget(self) -> Optional[float]:
+        paise = getattr(self, paise_attr)
+        return None if paise is None else paise / 100
+
+    def fset(self, value: Optional[float]) -> None:
+        setattr(self, paise_attr, None if value is None else round(value * 100))
+
+    def expr(cls):
+        return getattr(cls, paise_attr) / 100.0
+
+    return hybrid_property(fget, fset, expr=expr)
+
+
+class _days_until(FunctionElement):
+    """Whole days from today to a ``YYYY-MM-DD`` string column (negative if past)."""
+
+    type = Integer()
+    inherit_cache = True
+    name = "days_until"
+
+
+@compiles(_days_until)
+def _days_until_sqlite(element, compiler, **kw):
+    arg = compiler.process(element.clauses, **kw)
+    return f"CAST(julianday({arg}) - julianday(date('now', 'localtime')) AS INTEGER)"
+
+
+@compiles(_days_until, "postgresql")
+def _days_until_postgresql(element, compiler, **kw):
+    arg = compiler.process(element.clauses, **kw)
+    return f"(CAST({arg} AS DATE) - CURRENT_DATE)"
 
 
 class Invoice(TimestampMixin, Base):
@@ -30,28 +80,56 @@ class Invoice(TimestampMixin, Base):
     """
 
     __tablename__ = "invoices"
+    __table_args__ = (
+        # List endpoint ?status= filter (optionally narrowed by supplier)
+        Index("ix_invoices_status_supplier", "status", "supplier_id"),
+        # MSME dashboards filter on msme_status
+        Index("ix_invoices_msme_status", "msme_status"),
+        # MSME compliance list: MSME invoices only, most urgent due date first.
+        # Predicates mirror what ``is_(True)`` renders on each dialect.
+        Index(
+            "ix_invoices_msme_due_date",
+            "msme_due_date",
+            postgresql_where=text("is_msme_supplier IS true"),
+            sqlite_where=text("is_msme_supplier IS 1"),
+        ),
+    )
 
     # ── Identity ──────────────────────────────────────────────
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()), nullable=False)
-    invoice_number = Column(String(50), nullable=False, index=True)
+    id = Column(String(36), primary_key=True, default=new_id, nullable=False)
+    invoice_number = Column(String(50), unique=True, nullable=False, index=True)  # public id, e.g. INV001
 
     # ── Relationships ─────────────────────────────────────────
     supplier_id = Column(String(36), ForeignKey("suppliers.id"), nullable=False, index=True)
     po_id = Column(String(36), ForeignKey("purchase_orders.id"), nullable=True, index=True)
     grn_id = Column(String(36), ForeignKey("goods_receipt_notes.id"), nullable=True)
 
+    # Many-to-one navigation for eager loading.  lazy="raise" because an
+    # implicit lazy load can't run under AsyncSession — load via options().
+    supplier = relationship("Supplier", lazy="raise")
+    purchase_order = relationship("PurchaseOrder", lazy="raise")
+    grn = relationship("GoodsReceiptNote", lazy="raise")
+    # Cached GST record for the supplier GSTIN (joined on the natural key)
+    gst_record = relationship(
+        "GSTRecord",
+        primaryjoin="foreign(Invoice.gstin_supplier) == GSTRecord.gstin",
+        viewonly=True,
+        lazy="raise",
+    )
+
     # ── Dates ─────────────────────────────────────────────────
     invoice_date = Column(String(20), nullable=True)  # date string for SQLite compat
     due_date = Column(String(20), nullable=True)
 
     # ── Financial amounts ─────────────────────────────────────
-    subtotal = Column(Float, nullable=False, default=0)
+    # Stored as integer paise (₹1 = 100 paise); rupee views are below
+    subtotal_paise = Column(BigInteger, nullable=False, default=0)
     gst_rate = Column(Float, nullable=True)
-    gst_amount = Column(Float, nullable=False, default=0)
+    gst_amount_paise = Column(BigInteger, nullable=False, default=0)
     tds_rate = Column(Float, nullable=True)
-    tds_amount = Column(Float, nullable=False, default=0)
-    total_amount = Column(Float, nullable=False, default=0)
-    net_payable = Column(Float, nullable=False, default=0)
+    tds_amount_paise = Column(BigInteger, nullable=False, default=0)
+    total_amount_paise = Column(BigInteger, nullable=False, default=0)
+    net_payable_paise = Column(BigInteger, nullable=False, default=0)
 
     # ── GST identifiers ──────────────────────────────────────
     gstin_supplier = Column(String(15), nullable=True)
@@ -60,7 +138,7 @@ class Invoice(TimestampMixin, Base):
     irn = Column(String(128), nullable=True)  # e-Invoice Reference Number
 
     # ── Status ────────────────────────────────────────────────
-    status = Column(String(30), nullable=False, default="CAPTURED")
+    status = Column(String(16), nullable=False, default="CAPTURED")  # sized to "PENDING_APPROVAL"
 
     # ── OCR extraction metadata ───────────────────────────────
     ocr_confidence = Column(Float, nullable=True)
@@ -84,13 +162,16 @@ class Invoice(TimestampMixin, Base):
 
     # ── Fraud detection ───────────────────────────────────────
     fraud_flag = Column(Boolean, nullable=False, default=False)
-    fraud_reasons = Column(JSON, nullable=True, default=list)  # list of reason strings
+    # orjson-encoded list of reason strings; read/write via ``fraud_reasons``.
+    # Deferred: only the detail view reads it, so whole-entity loads elsewhere
+    # (dashboard, payments, MSME) skip the blob — undefer() where needed.
+    fraud_reasons_json = deferred(Column("fraud_reasons", Text, nullable=True, default="[]"))
 
     # ── Cash optimization ─────────────────────────────────────
     cash_opt_suggestion = Column(Text, nullable=True)
 
     # ── Oracle EBS AP integration ─────────────────────────────
-    ebs_ap_status = Column(String(20), nullable=False, default="NOT_STARTED")  # NOT_STARTED / PENDING / POSTED / BLOCKED / FAILED
+    ebs_ap_status = Column(String(11), nullable=False, default="NOT_STARTED")  # NOT_STARTED / PENDING / POSTED / BLOCKED / FAILED
     ebs_ap_ref = Column(String(50), nullable=True)
     ebs_posted_at = Column(DateTime, nullable=True)
 
@@ -103,11 +184,93 @@ class Invoice(TimestampMixin, Base):
 
     # ── MSME Section 43B(h) compliance ────────────────────────
     is_msme_supplier = Column(Boolean, nullable=False, default=False)
-    msme_category = Column(String(10), nullable=True)  # MICRO / SMALL / MEDIUM
-    msme_days_remaining = Column(Integer, nullable=True)
+    msme_category = Column(String(6), nullable=True)  # MICRO / SMALL / MEDIUM
     msme_due_date = Column(String(20), nullable=True)  # date string
-    msme_status = Column(String(20), nullable=True)  # ON_TRACK / AT_RISK / BREACHED
-    msme_penalty_amount = Column(Float, nullable=True, default=0)
+    msme_status = Column(String(8), nullable=True)  # ON_TRACK / AT_RISK / BREACHED
+    msme_penalty_amount_paise = Column(BigInteger, nullable=True, default=0)
 
     # ── Upload metadata ───────────────────────────────────────
     uploaded_by = Column(String(255), nullable=True)
+
+    # ── Encoded-column accessors ──────────────────────────────
+
+    subtotal = _rupee_view("subtotal_paise")
+    gst_amount = _rupee_view("gst_amount_paise")
+    tds_amount = _rupee_view("tds_amount_paise")
+    total_amount = _rupee_view("total_amount_paise")
+    net_payable = _rupee_view("net_payable_paise")
+    msme_penalty_amount = _rupee_view("msme_penalty_amount_paise")
+
+    # ── Derived MSME fields ───────────────────────────────────
+
+    @hybrid_property
+    def msme_days_remaining(self) -> Optional[int]:
+        """Days until ``msme_due_date``; always current instead of a stored snapshot."""
+        if not self.msme_due_date:
+            return None
+        return (date.fromisoformat(self.msme_due_date) - date.today()).days
+
+    @msme_days_remaining.expression
+    def msme_days_remaining(cls):
+        return _days_until(cls.msme_due_date)
+
+    @hybrid_property
+    def fraud_reasons(self) -> List[str]:
+        """Decoded fraud reasons (orjson instead of the stdlib JSON type codec)."""
+        return orjson.loads(self.fraud_reasons_json or "[]")
+
+    @fraud_reasons.setter
+    def fraud_reasons(self, value: Optional[List[str]]) -> None:
+        self.fraud_reasons_json = orjson.dumps(value or []).decode()
+
+    @fraud_reasons.expression
+    def fraud_reasons(cls):
+        return cls.fraud_reasons_json
+
+
+# ── API serialization ─────────────────────────────────────────
+
+# Storage columns that the API exposes under their accessor's name: integer
+# paise behind the rupee views, the encoded blob behind ``fraud_reasons``
+_API_NAME_FOR_COLUMN: Final[Mapping[str, str]] = MappingProxyType({
+    "subtotal_paise": "subtotal",
+    "gst_amount_paise": "gst_amount",
+    "tds_amount_paise": "tds_amount",
+    "total_amount_paise": "total_amount",
+    "net_payable_paise": "net_payable",
+    "msme_penalty_amount_paise": "msme_penalty_amount",
+    "fraud_reasons_json": "fraud_reasons",
+})
+
+# Public fields computed on read rather than stored
+_DERIVED_API_FIELDS = ("msme_days_remaining",)
+
+
+@lru_cache(maxsize=None)
+def _invoice_api_fields() -> Tuple[Tuple[str, ...], Callable[[Invoice], Tuple[Any, ...]]]:
+    """Public invoice field names (column order) and a getter for them.
+
+    Resolved on first use: inspecting the mapper configures every mapper,
+    which has to wait until all model modules are imported.  Raises if a
+    paise column has no rupee view, so raw paise never reach a response.
+    """
+    fields: List[str] = []
+    for attr in inspect(Invoice).column_attrs:
+        name = _API_NAME_FOR_COLUMN.get(attr.key, attr.key)
+        if name.endswith("_paise"):
+            raise RuntimeError(
+                f"Invoice.{attr.key} has no rupee view in _API_NAME_FOR_COLUMN"
+            )
+        fields.append(name)
+    fields.extend(_DERIVED_API_FIELDS)
+    return tuple(fields), attrgetter(*fields)
+
+
+def invoice_to_dict(invoice: Invoice) -> Dict[str, Any]:
+    """Every public invoice field, read through the rupee/decoded accessors.
+
+    Use this (not the mapped columns) wherever a whole invoice is
+    serialized.  ``fraud_reasons_json`` must be loaded — ``undefer()`` it.
+    """
+    fields, get_fields = _invoice_api_fields()
+    return dict(zip(fields, get_fields(invoice)))
@@ -13,26 +13,45 @@ GET  /api/invoices/{inv_id}     - Invoice detail with PO, GRN, GST data
 PATCH /api/invoices/{inv_id}/approve           - Approve an invoice
 PATCH /api/invoices/{inv_id}/reject            - Reject an invoice
 POST  /api/invoices/{inv_id}/simulate-processing - Advance status one step
+
+Detail responses are dicts the service built from trusted DB state, so
+they are wrapped with ``model_construct`` (no validation) and dumped by the
+module-level ``INVOICE_DETAIL_ADAPTER`` serializer.  The latency-sensitive
+mutations skip even that and hand the dict straight to orjson; the schema
+stays in ``responses`` for the OpenAPI docs only.
 """
 
 from __future__ import annotations
 
 from typing import Any, Dict, List, Optional
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request, Response
+from fastapi.exceptions import RequestValidationError
+from pydantic import ValidationError as PydanticValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from backend.dependencies import get_db, get_current_user, require_role, paginate
+from backend.dependencies import get_db, get_current_user, require_role
 from backend.exceptions import NotFoundError
+from backend.json_utils import FastORJSONResponse
 from backend.modules.invoices.schemas import (
+    INVOICE_DETAIL_JSON,
+    INVOICE_LIST_PAGE_ADAPTER,
     InvoiceDetailResponse,
-    InvoiceListItem,
+    RejectInvoiceRequest,
 )
 from backend.modules.invoices import service
 
 router = APIRouter(prefix="/api/invoices", tags=["invoices"])
 
 
+def _detail_response(detail: Dict[str, Any]) -> Response:
+    """Serialize a trusted service detail dict with the cached adapter."""
+    return Response(
+        content=INVOICE_DETAIL_JSON(InvoiceDetailResponse.model_construct(**detail)),
+        media_type="application/json",
+    )
+
+
 # ---------------------------------------------------------------------------
 # GET  /api/invoices
 # ---------------------------------------------------------------------------
@@ -44,27 +63,33 @@ async def list_invoices(
     limit: int = Query(50, ge=1, le=200),
     db: AsyncSession = Depends(get_db),
     _user: Dict[str, Any] = Depends(get_current_user),
-):
+) -> Response:
     """Return all invoices with resolved supplier/PO/GRN codes.
 
-    Optionally filter by ``status`` query parameter.
+    Optionally filter by ``status`` query parameter.  The service pages in
+    SQL and its dicts already have the ``InvoiceListItem`` shape, so the
+    page is dumped to JSON in one pass by the cached ``TypeAdapter``.
     """
-    inv_dicts = await service.list_invoices(db)
-    if status:
-        inv_dicts = [d for d in inv_dicts if d.get("status") == status]
-    return paginate([InvoiceListItem.model_validate(d) for d in inv_dicts], skip, limit)
+    page = await service.list_invoices(db, status=status, skip=skip, limit=limit)
+    return Response(
+        content=INVOICE_LIST_PAGE_ADAPTER.dump_json(page),
+        media_type="application/json",
+    )
 
 
 # ---------------------------------------------------------------------------
 # GET  /api/invoices/{inv_id}
 # ---------------------------------------------------------------------------
 
-@router.get("/{inv_id}", response_model=InvoiceDetailResponse)
+@router.get(
+    "/{inv_id}",
+    responses={200: {"model": InvoiceDetailResponse}},
+)
 async def get_invoice(
     inv_id: str,
     db: AsyncSession = Depends(get_db),
     _user: Dict[str, Any] = Depends(get_current_user),
-) -> InvoiceDetailResponse:
+) -> Response:
     """Return a single invoice by its invoice_number (e.g. "INV001").
 
     Includes nested PO (with line items), GRN (with line items), and the
@@ -74,19 +99,22 @@ async def get_invoice(
     if detail is None:
         raise NotFoundError(f"Invoice {inv_id} not found")
 
-    return InvoiceDetailResponse.model_validate(detail)
+    return _detail_response(detail)
 
 
 # ---------------------------------------------------------------------------
 # PATCH  /api/invoices/{inv_id}/approve
 # ---------------------------------------------------------------------------
 
-@router.patch("/{inv_id}/approve", response_model=InvoiceDetailResponse)
+@router.patch(
+    "/{inv_id}/approve",
+    responses={200: {"model": InvoiceDetailResponse}},
+)
 async def approve_invoice(
     inv_id: str,
     db: AsyncSession = Depends(get_db),
     user: Dict[str, Any] = Depends(require_role("FINANCE_HEAD")),
-) -> InvoiceDetailResponse:
+) -> FastORJSONResponse:
     """Approve an invoice that is currently PENDING_APPROVAL or MATCHED.
 
     Sets status to APPROVED, records approver, and marks EBS AP as PENDING.
@@ -96,38 +124,71 @@ async def approve_invoice(
     detail = await service.approve_invoice(
         db, inv_id, approved_by=user.get("name", "Unknown"),
     )
-    return InvoiceDetailResponse.model_validate(detail)
+    return FastORJSONResponse(detail)
 
 
 # ---------------------------------------------------------------------------
 # PATCH  /api/invoices/{inv_id}/reject
 # ---------------------------------------------------------------------------
 
-@router.patch("/{inv_id}/reject", response_model=InvoiceDetailResponse)
+@router.patch(
+    "/{inv_id}/reject",
+    responses={200: {"model": InvoiceDetailResponse}},
+    openapi_extra={
+        "requestBody": {
+            "required": False,
+            "content": {"application/json": {
+                "schema": RejectInvoiceRequest.model_json_schema(),
+            }},
+        },
+    },
+)
 async def reject_invoice(
     inv_id: str,
+    request: Request,
     db: AsyncSession = Depends(get_db),
-    _user: Dict[str, Any] = Depends(require_role("FINANCE_HEAD")),
-) -> InvoiceDetailResponse:
+    user: Dict[str, Any] = Depends(require_role("FINANCE_HEAD")),
+) -> FastORJSONResponse:
     """Reject an invoice.
 
     Sets status to REJECTED, records rejection reason, and blocks EBS AP.
     Cannot reject invoices that are already POSTED_TO_EBS, PAID, or REJECTED.
+
+    Accepts an optional ``RejectInvoiceRequest`` body (``{"reason": ...}``).
+    The raw bytes go straight to ``model_validate_json`` rather than through
+    an intermediate dict; an empty body (what the frontend sends) keeps the
+    default reason.
     """
-    detail = await service.reject_invoice(db, inv_id)
-    return InvoiceDetailResponse.model_validate(detail)
+    raw = await request.body()
+    try:
+        body = (
+            RejectInvoiceRequest.model_validate_json(raw)
+            if raw else RejectInvoiceRequest()
+        )
+    except PydanticValidationError as exc:
+        raise RequestValidationError(exc.errors())
+
+    detail = await service.reject_invoice(
+        db, inv_id,
+        rejected_by=user.get("name", "Unknown"),
+        reason=body.reason,
+    )
+    return FastORJSONResponse(detail)
 
 
 # ---------------------------------------------------------------------------
 # POST  /api/invoices/{inv_id}/simulate-processing
 # ---------------------------------------------------------------------------
 
-@router.post("/{inv_id}/simulate-processing", response_model=InvoiceDetailResponse)
+@router.post(
+    "/{inv_id}/simulate-processing",
+    responses={200: {"model": InvoiceDetailResponse}},
+)
 async def simulate_processing(
     inv_id: str,
     db: AsyncSession = Depends(get_db),
     _user: Dict[str, Any] = Depends(require_role("FINANCE_HEAD")),
-) -> InvoiceDetailResponse:
+) -> FastORJSONResponse:
     """Simulate the invoice processing pipeline by advancing status one step.
 
     Progression: CAPTURED -> EXTRACTED -> VALIDATED -> MATCHED -> PENDING_APPROVAL
@@ -137,4 +198,4 @@ async def simulate_processing(
     cannot advance further.
     """
     detail = await service.simulate_processing(db, inv_id)
-    return InvoiceDetailResponse.model_validate(detail)
+    return FastORJSONResponse(detail)
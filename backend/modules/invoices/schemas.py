@@ -1,7 +1,7 @@
 """
 Invoices Module -- Pydantic Schemas
 
-Defines response models for the Invoices API.
+Defines response models (and the optional reject body) for the Invoices API.
 
 IMPORTANT: The legacy frontend uses ``invoice_number`` (e.g. "INV001") as the
 ``id`` field in all API calls.  InvoiceListItem therefore exposes an ``id``
@@ -17,66 +17,181 @@ FK resolution performed by the service layer:
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import List, Literal, Optional
 
-from pydantic import BaseModel, ConfigDict, Field, model_validator
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+from typing_extensions import TypedDict
+
+from backend.base_schema import FastBase
+
+
+# ---------------------------------------------------------------------------
+# Closed vocabularies for Invoice status columns
+# ---------------------------------------------------------------------------
+# ``match_status`` and ``gstin_cache_status`` are composed/extended by other
+# modules (e.g. "3WAY_MATCH_PASSED", "OVERRIDE_APPROVED") and stay ``str``.
+
+InvoiceStatus = Literal[
+    "CAPTURED", "EXTRACTED", "VALIDATED", "MATCHED", "PENDING_APPROVAL",
+    "APPROVED", "POSTED_TO_EBS", "PAID", "REJECTED",
+    # Invoices held at matching (seed data); outside the linear lifecycle
+    "EXCEPTION", "BLOCKED_FRAUD",
+]
+EBSAPStatus = Literal["NOT_STARTED", "PENDING", "POSTED", "BLOCKED", "FAILED"]
+MSMEStatus = Literal["ON_TRACK", "AT_RISK", "BREACHED"]
+MSMECategory = Literal["MICRO", "SMALL", "MEDIUM"]
 
 
 # ---------------------------------------------------------------------------
 # Invoice list item
 # ---------------------------------------------------------------------------
 
-class InvoiceListItem(BaseModel):
+class InvoiceListItem(TypedDict):
     """Shape for GET /api/invoices list endpoint.
 
     ``id`` is always equal to ``invoice_number`` (e.g. "INV001") -- the
     frontend expects this.  The service layer resolves FK UUIDs to
-    human-readable codes before validation.
-    """
+    human-readable codes (``supplier_id`` -> supplier code, ``po_id`` ->
+    PO number, ``grn_id`` -> GRN number) before serialization.
 
-    model_config = ConfigDict(from_attributes=True)
+    A TypedDict rather than a BaseModel: list rows are only ever
+    serialized, so no per-row model instance is built.
+    """
 
-    id: str = Field(..., description="Same as invoice_number (e.g. INV001)")
+    id: str
     invoice_number: str
-    supplier_id: str = Field(..., description="Supplier code (e.g. SUP001)")
-    supplier_name: str = Field(..., description="Supplier legal name")
-    po_id: Optional[str] = Field(None, description="PO number (e.g. PO2024-001)")
-    grn_id: Optional[str] = Field(None, description="GRN number (e.g. GRN2024-001)")
-    invoice_date: Optional[str] = None
-    due_date: Optional[str] = None
-    subtotal: float = 0
-    gst_rate: Optional[float] = None
-    gst_amount: float = 0
-    tds_rate: Optional[float] = None
-    tds_amount: float = 0
-    total_amount: float = 0
-    net_payable: float = 0
-    status: str = "CAPTURED"
-    match_status: Optional[str] = None
-    is_msme_supplier: bool = False
-    msme_status: Optional[str] = None
-    fraud_flag: bool = False
-    ebs_ap_status: str = "NOT_STARTED"
-    created_at: Optional[str] = None
-    uploaded_by: Optional[str] = None
+    supplier_id: str
+    supplier_name: str
+    po_id: Optional[str]
+    grn_id: Optional[str]
+    invoice_date: Optional[str]
+    due_date: Optional[str]
+    subtotal: float
+    gst_rate: Optional[float]
+    gst_amount: float
+    tds_rate: Optional[float]
+    tds_amount: float
+    total_amount: float
+    net_payable: float
+    status: InvoiceStatus
+    match_status: Optional[str]
+    is_msme_supplier: bool
+    msme_status: Optional[MSMEStatus]
+    fraud_flag: bool
+    ebs_ap_status: EBSAPStatus
+    created_at: Optional[datetime]
+    uploaded_by: Optional[str]
+
+
+class InvoiceListPage(TypedDict):
+    """Paginated envelope returned by GET /api/invoices."""
+
+    items: List[InvoiceListItem]
+    total: int
+    skip: int
+    limit: int
+
+
+# Built once at import; reused for every list response
+INVOICE_LIST_PAGE_ADAPTER = TypeAdapter(InvoiceListPage)
+
+
+# ---------------------------------------------------------------------------
+# Nested embeds for the detail response
+# ---------------------------------------------------------------------------
+
+class POLineItemEmbed(TypedDict):
+    """PO line item embedded in ``InvoiceDetailResponse.po.items``."""
+
+    desc: str
+    qty: float
+    unit: Optional[str]
+    unit_price: float
+    total: float
+    grn_qty: float
+
+
+class POEmbed(TypedDict):
+    """PO summary embedded in the invoice detail (``po``)."""
+
+    id: str
+    po_number: str
+    amount: float
+    currency: str
+    status: str
+    delivery_date: Optional[str]
+    items: List[POLineItemEmbed]
+
+
+class GRNLineItemEmbed(TypedDict):
+    """GRN line item embedded in ``InvoiceDetailResponse.grn.items``."""
+
+    desc: str
+    po_qty: float
+    received_qty: float
+    unit: Optional[str]
+
+
+class GRNEmbed(TypedDict):
+    """GRN summary embedded in the invoice detail (``grn``)."""
+
+    id: str
+    grn_number: str
+    po_id: Optional[str]
+    received_date: Optional[str]
+    received_by: Optional[str]
+    status: str
+    notes: Optional[str]
+    items: List[GRNLineItemEmbed]
+
+
+@dataclass(slots=True)
+class GSTEmbed:
+    """Cached GST record embedded in the invoice detail (``gst_record``).
+
+    A slotted dataclass rather than a TypedDict: the service fills it
+    positionally from the GSTRecord row, and both orjson and the pydantic
+    serializer read its slots directly, so no intermediate dict is built.
+    Field order is the JSON key order.
+    """
+
+    gstin: str
+    legal_name: str
+    status: str
+    state: Optional[str]
+    registration_type: Optional[str]
+    last_gstr1_filed: Optional[str]
+    gstr2b_available: bool
+    gstr2b_period: Optional[str]
+    gstr1_compliance: Optional[str]
+    itc_eligible: bool
+    last_synced: Optional[datetime]
+    sync_source: Optional[str]
+    cache_hit_count: int
+    gstr2b_alert: Optional[str]
+    itc_note: Optional[str]
 
 
 # ---------------------------------------------------------------------------
 # Invoice detail response
 # ---------------------------------------------------------------------------
 
-class InvoiceDetailResponse(BaseModel):
+class InvoiceDetailResponse(FastBase):
     """Full invoice detail with resolved FKs and nested subsystem data.
 
     Returned by the single-invoice GET endpoint.  Includes every column from
-    the Invoice model plus nested dicts for the related PO, GRN, GST record,
+    the Invoice model plus typed embeds for the related PO, GRN, GST record,
     and supplier name.
 
     ``id`` is always ``invoice_number``.
+
+    Instances are only ever built from trusted service dicts and dumped,
+    so on top of the shared ``FastBase`` config the model is frozen.
     """
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(frozen=True)
 
     # -- Identity --
     id: str = Field(..., description="Same as invoice_number")
@@ -106,7 +221,7 @@ class InvoiceDetailResponse(BaseModel):
     irn: Optional[str] = None
 
     # -- Status --
-    status: str = "CAPTURED"
+    status: InvoiceStatus = "CAPTURED"
 
     # -- OCR --
     ocr_confidence: Optional[float] = None
@@ -136,7 +251,7 @@ class InvoiceDetailResponse(BaseModel):
     cash_opt_suggestion: Optional[str] = None
 
     # -- EBS AP --
-    ebs_ap_status: str = "NOT_STARTED"
+    ebs_ap_status: EBSAPStatus = "NOT_STARTED"
     ebs_ap_ref: Optional[str] = None
     ebs_posted_at: Optional[datetime] = None
 
@@ -149,18 +264,34 @@ class InvoiceDetailResponse(BaseModel):
 
     # -- MSME --
     is_msme_supplier: bool = False
-    msme_category: Optional[str] = None
+    msme_category: Optional[MSMECategory] = None
     msme_days_remaining: Optional[int] = None
     msme_due_date: Optional[str] = None
-    msme_status: Optional[str] = None
+    msme_status: Optional[MSMEStatus] = None
     msme_penalty_amount: Optional[float] = 0
 
     # -- Upload --
     uploaded_by: Optional[str] = None
-    created_at: Optional[str] = None
-    updated_at: Optional[str] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
 
     # -- Nested related objects (populated by detail endpoint) --
-    po: Optional[Dict[str, Any]] = None
-    grn: Optional[Dict[str, Any]] = None
-    gst_record: Optional[Dict[str, Any]] = None
+    po: Optional[POEmbed] = None
+    grn: Optional[GRNEmbed] = None
+    gst_record: Optional[GSTEmbed] = None
+
+
+# Built once at import; the compiled serializer is reused for every
+# detail response instead of being resolved per call
+INVOICE_DETAIL_ADAPTER = TypeAdapter(InvoiceDetailResponse)
+INVOICE_DETAIL_JSON = INVOICE_DETAIL_ADAPTER.dump_json
+
+
+# ---------------------------------------------------------------------------
+# Request bodies
+# ---------------------------------------------------------------------------
+
+class RejectInvoiceRequest(BaseModel):
+    """Optional body for PATCH /api/invoices/{inv_id}/reject."""
+
+    reason: Optional[str] = Field(None, max_length=1000)
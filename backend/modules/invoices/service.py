@@ -11,26 +11,31 @@ translation.
 
 Public API
 ----------
-- list_invoices(db)                   -> List[dict]
-- get_invoice_by_id(db, inv_id)       -> Optional[dict]
-- approve_invoice(db, inv_id)         -> dict
-- reject_invoice(db, inv_id)          -> dict
-- simulate_processing(db, inv_id)     -> dict
+- list_invoices(db, status, skip, limit)  -> dict (one page)
+- get_invoice_by_id(db, inv_id)           -> Optional[dict]
+- approve_invoice(db, inv_id)             -> dict
+- reject_invoice(db, inv_id, ...)         -> dict
+- simulate_processing(db, inv_id)         -> dict
 """
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from dataclasses import fields
+from datetime import datetime
+from operator import attrgetter
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Final, List, Mapping, Optional
 
-from sqlalchemy import select
+from sqlalchemy import bindparam, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, undefer
 
 from backend.event_bus import Event, event_bus
 from backend.exceptions import NotFoundError, ValidationError
 from backend.state_machines import validate_transition, validate_maker_checker
 from backend.modules.gst_cache.models import GSTRecord
 from backend.modules.invoices.models import Invoice
+from backend.modules.invoices.schemas import GSTEmbed, InvoiceDetailResponse
 from backend.modules.purchase_orders.models import (
     GoodsReceiptNote,
     GRNLineItem,
@@ -44,81 +49,52 @@ from backend.modules.suppliers.models import Supplier
 # Internal helpers — entity loaders
 # ---------------------------------------------------------------------------
 
-async def _load_supplier(
-    db: AsyncSession,
-    supplier_id: str,
-) -> Optional[Supplier]:
-    """Fetch a supplier by its UUID primary key."""
-    result = await db.execute(
-        select(Supplier).where(Supplier.id == supplier_id)
-    )
-    return result.scalar_one_or_none()
-
-
-async def _load_po(
-    db: AsyncSession,
-    po_id: str,
-) -> Optional[PurchaseOrder]:
-    """Fetch a purchase order by its UUID primary key."""
-    result = await db.execute(
-        select(PurchaseOrder).where(PurchaseOrder.id == po_id)
-    )
-    return result.scalar_one_or_none()
-
-
-async def _load_po_line_items(
-    db: AsyncSession,
-    po_id: str,
-) -> List[POLineItem]:
-    """Fetch all line items for a PO, ordered by sort_order."""
-    result = await db.execute(
-        select(POLineItem)
-        .where(POLineItem.po_id == po_id)
-        .order_by(POLineItem.sort_order)
-    )
-    return list(result.scalars().all())
-
-
-async def _load_grn(
-    db: AsyncSession,
-    grn_id: str,
-) -> Optional[GoodsReceiptNote]:
-    """Fetch a GRN by its UUID primary key."""
-    result = await db.execute(
-        select(GoodsReceiptNote).where(GoodsReceiptNote.id == grn_id)
-    )
-    return result.scalar_one_or_none()
-
-
-async def _load_grn_line_items(
-    db: AsyncSession,
-    grn_id: str,
-) -> List[GRNLineItem]:
-    """Fetch all line items for a GRN."""
-    result = await db.execute(
-        select(GRNLineItem).where(GRNLineItem.grn_id == grn_id)
-    )
-    return list(result.scalars().all())
-
-
-async def _load_gst_record(
-    db: AsyncSession,
-    gstin: str,
-) -> Optional[GSTRecord]:
-    """Fetch a GST cache record by GSTIN."""
-    result = await db.execute(
-        select(GSTRecord).where(GSTRecord.gstin == gstin)
+# Built once at import and executed with a bound ``invoice_number`` — the
+# statement (and its eager-load option tree) isn't reconstructed per call,
+# and its cache key stays stable for SQLAlchemy's compiled-SQL cache.
+_INVOICE_BY_NUMBER_STMT = (
+    select(Invoice)
+    .options(
+        undefer(Invoice.fraud_reasons_json),
+        # Joined headers are projected to the fields the detail shape reads
+        joinedload(Invoice.supplier).load_only(Supplier.code, Supplier.legal_name),
+        joinedload(Invoice.purchase_order)
+        .load_only(
+            PurchaseOrder.po_number,
+            PurchaseOrder.amount,
+            PurchaseOrder.currency,
+            PurchaseOrder.status,
+            PurchaseOrder.delivery_date,
+        )
+        .selectinload(PurchaseOrder.line_items),
+        joinedload(Invoice.grn)
+        .load_only(
+            GoodsReceiptNote.grn_number,
+            GoodsReceiptNote.received_date,
+            GoodsReceiptNote.received_by,
+            GoodsReceiptNote.status,
+            GoodsReceiptNote.notes,
+        )
+        .selectinload(GoodsReceiptNote.line_items),
+        joinedload(Invoice.gst_record),
     )
-    return result.scalar_one_or_none()
+    .where(Invoice.invoice_number == bindparam("invoice_number"))
+)
 
 
 async def _load_invoice_by_number(
     db: AsyncSession,
     invoice_number: str,
 ) -> Optional[Invoice]:
-    """Look up an invoice by its ``invoice_number`` (e.g. "INV001")."""
+    """Look up an invoice by its ``invoice_number`` (e.g. "INV001").
+
+    Every caller builds the detail dict, so the whole graph it needs is
+    eager-loaded here: supplier, PO, GRN and GST record are joined into the
+    invoice query, and the PO / GRN line items follow in one SELECT ... IN
+    each.  Three round trips total, and ``fraud_reasons`` is undeferred.
+    """
     result = await db.execute(
-        select(Invoice).where(Invoice.invoice_number == invoice_number)
+        _INVOICE_BY_NUMBER_STMT, {"invoice_number": invoice_number},
     )
     return result.scalar_one_or_none()
 
@@ -127,15 +103,12 @@ async def _load_invoice_by_number(
 # Internal helpers — dict builders
 # ---------------------------------------------------------------------------
 
-def _dt_to_str(dt: Optional[datetime]) -> Optional[str]:
-    """Convert a datetime to ISO string, or return None."""
-    if dt is None:
-        return None
-    return dt.isoformat()
-
-
 def _build_po_line_items(line_items: List[POLineItem]) -> List[Dict[str, Any]]:
-    """Convert PO line items to legacy-shaped dicts."""
+    """Convert PO line items to legacy-shaped dicts.
+
+    Items arrive already ordered by ``sort_order`` (the relationship's
+    ORDER BY), so no Python-side sort is needed.
+    """
     return [
         {
             "desc": li.description,
@@ -145,7 +118,7 @@ def _build_po_line_items(line_items: List[POLineItem]) -> List[Dict[str, Any]]:
             "total": li.total,
             "grn_qty": li.grn_quantity,
         }
-        for li in sorted(line_items, key=lambda x: x.sort_order)
+        for li in line_items
     ]
 
 
@@ -162,235 +135,230 @@ def _build_grn_line_items(line_items: List[GRNLineItem]) -> List[Dict[str, Any]]
     ]
 
 
-def _build_gst_dict(gst: GSTRecord) -> Dict[str, Any]:
-    """Build a dict from a GSTRecord for embedding in the invoice detail."""
-    return {
-        "gstin": gst.gstin,
-        "legal_name": gst.legal_name,
-        "status": gst.status,
-        "state": gst.state,
-        "registration_type": gst.registration_type,
-        "last_gstr1_filed": gst.last_gstr1_filed,
-        "gstr2b_available": gst.gstr2b_available,
-        "gstr2b_period": gst.gstr2b_period,
-        "gstr1_compliance": gst.gstr1_compliance,
-        "itc_eligible": gst.itc_eligible,
-        "last_synced": _dt_to_str(gst.last_synced),
-        "sync_source": gst.sync_source,
-        "cache_hit_count": gst.cache_hit_count,
-        "gstr2b_alert": gst.gstr2b_alert,
-        "itc_note": gst.itc_note,
-    }
-
-
-async def _build_invoice_summary(
-    db: AsyncSession,
-    inv: Invoice,
-) -> Dict[str, Any]:
-    """Build the flat invoice summary dict used by the list endpoint.
+# GSTEmbed fields are same-named GSTRecord columns, read in one attrgetter call
+_get_gst_fields = attrgetter(*(f.name for f in fields(GSTEmbed)))
 
-    Resolves FK UUIDs to human-readable codes/names:
-      - supplier_id -> supplier.code  (+ supplier.legal_name)
-      - po_id       -> purchase_order.po_number
-      - grn_id      -> goods_receipt_note.grn_number
-    """
-    # Resolve supplier
-    supplier = await _load_supplier(db, inv.supplier_id)
-    supplier_code = supplier.code if supplier else inv.supplier_id
-    supplier_name = supplier.legal_name if supplier else "Unknown Supplier"
 
-    # Resolve PO number
-    po_number: Optional[str] = None
-    if inv.po_id:
-        po = await _load_po(db, inv.po_id)
-        po_number = po.po_number if po else None
+def _build_gst_embed(gst: GSTRecord) -> GSTEmbed:
+    """Build the ``gst_record`` embed for the invoice detail from a GSTRecord."""
+    return GSTEmbed(*_get_gst_fields(gst))
 
-    # Resolve GRN number
-    grn_number: Optional[str] = None
-    if inv.grn_id:
-        grn = await _load_grn(db, inv.grn_id)
-        grn_number = grn.grn_number if grn else None
 
-    return {
-        "id": inv.invoice_number,
-        "invoice_number": inv.invoice_number,
-        "supplier_id": supplier_code,
-        "supplier_name": supplier_name,
-        "po_id": po_number,
-        "grn_id": grn_number,
-        "invoice_date": inv.invoice_date,
-        "due_date": inv.due_date,
-        "subtotal": inv.subtotal,
-        "gst_rate": inv.gst_rate,
-        "gst_amount": inv.gst_amount,
-        "tds_rate": inv.tds_rate,
-        "tds_amount": inv.tds_amount,
-        "total_amount": inv.total_amount,
-        "net_payable": inv.net_payable,
-        "status": inv.status,
-        "match_status": inv.match_status,
-        "is_msme_supplier": inv.is_msme_supplier,
-        "msme_status": inv.msme_status,
-        "fraud_flag": inv.fraud_flag,
-        "ebs_ap_status": inv.ebs_ap_status,
-        "created_at": _dt_to_str(inv.created_at) if inv.created_at else None,
-        "uploaded_by": inv.uploaded_by,
-    }
+# Detail fields that are NOT a same-named Invoice attribute read verbatim:
+# FK UUIDs exposed as codes, the supplier name, and the nested embeds.
+_DETAIL_DERIVED_FIELDS = frozenset({
+    "id", "supplier_id", "supplier_name", "po_id", "grn_id",
+    "po", "grn", "gst_record",
+})
+# Every other InvoiceDetailResponse field is copied straight off the ORM
+# object, in one C-level attrgetter call instead of a hand-written copy.
+_DETAIL_COLUMNS = tuple(
+    name for name in InvoiceDetailResponse.model_fields
+    if name not in _DETAIL_DERIVED_FIELDS
+)
+_get_detail_columns = attrgetter(*_DETAIL_COLUMNS)
 
 
-async def _build_invoice_detail(
-    db: AsyncSession,
-    inv: Invoice,
-) -> Dict[str, Any]:
+def _build_invoice_detail(inv: Invoice) -> Dict[str, Any]:
     """Build the full invoice detail dict with nested PO, GRN, and GST data.
 
-    Extends the summary with every column from the model plus nested dicts.
+    Plain columns are copied by ``_DETAIL_COLUMNS`` (derived from the
+    response schema); only FK codes and nested embeds are built by hand.
+    Pure graph walk — ``_load_invoice_by_number`` eager-loaded everything.
     """
-    # Resolve supplier
-    supplier = await _load_supplier(db, inv.supplier_id)
+    supplier = inv.supplier
     supplier_code = supplier.code if supplier else inv.supplier_id
     supplier_name = supplier.legal_name if supplier else "Unknown Supplier"
 
     # Resolve PO
     po_number: Optional[str] = None
     po_dict: Optional[Dict[str, Any]] = None
-    if inv.po_id:
-        po = await _load_po(db, inv.po_id)
-        if po:
-            po_number = po.po_number
-            po_items = await _load_po_line_items(db, po.id)
-            po_dict = {
-                "id": po.po_number,
-                "po_number": po.po_number,
-                "amount": po.amount,
-                "currency": po.currency,
-                "status": po.status,
-                "delivery_date": po.delivery_date,
-                "items": _build_po_line_items(po_items),
-            }
+    po = inv.purchase_order
+    if po:
+        po_number = po.po_number
+        po_dict = {
+            "id": po.po_number,
+            "po_number": po.po_number,
+            "amount": po.amount,
+            "currency": po.currency,
+            "status": po.status,
+            "delivery_date": po.delivery_date,
+            "items": _build_po_line_items(po.line_items),
+        }
 
     # Resolve GRN
     grn_number: Optional[str] = None
     grn_dict: Optional[Dict[str, Any]] = None
-    if inv.grn_id:
-        grn = await _load_grn(db, inv.grn_id)
-        if grn:
-            grn_number = grn.grn_number
-            grn_items = await _load_grn_line_items(db, grn.id)
-            grn_dict = {
-                "id": grn.grn_number,
-                "grn_number": grn.grn_number,
-                "po_id": po_number,
-                "received_date": grn.received_date,
-                "received_by": grn.received_by,
-                "status": grn.status,
-                "notes": grn.notes,
-                "items": _build_grn_line_items(grn_items),
-            }
-
-    # Resolve GST record from cache
-    gst_dict: Optional[Dict[str, Any]] = None
-    if inv.gstin_supplier:
-        gst = await _load_gst_record(db, inv.gstin_supplier)
-        if gst:
-            gst_dict = _build_gst_dict(gst)
-
-    return {
-        # Identity
+    grn = inv.grn
+    if grn:
+        grn_number = grn.grn_number
+        grn_dict = {
+            "id": grn.grn_number,
+            "grn_number": grn.grn_number,
+            "po_id": po_number,
+            "received_date": grn.received_date,
+            "received_by": grn.received_by,
+            "status": grn.status,
+            "notes": grn.notes,
+            "items": _build_grn_line_items(grn.line_items),
+        }
+
+    # GST record from cache
+    gst_embed: Optional[GSTEmbed] = None
+    if inv.gst_record:
+        gst_embed = _build_gst_embed(inv.gst_record)
+
+    detail: Dict[str, Any] = {
         "id": inv.invoice_number,
-        "invoice_number": inv.invoice_number,
         "supplier_id": supplier_code,
         "supplier_name": supplier_name,
         "po_id": po_number,
         "grn_id": grn_number,
-        # Dates
-        "invoice_date": inv.invoice_date,
-        "due_date": inv.due_date,
-        # Financial
-        "subtotal": inv.subtotal,
-        "gst_rate": inv.gst_rate,
-        "gst_amount": inv.gst_amount,
-        "tds_rate": inv.tds_rate,
-        "tds_amount": inv.tds_amount,
-        "total_amount": inv.total_amount,
-        "net_payable": inv.net_payable,
-        # GST identifiers
-        "gstin_supplier": inv.gstin_supplier,
-        "gstin_buyer": inv.gstin_buyer,
-        "hsn_sac": inv.hsn_sac,
-        "irn": inv.irn,
-        # Status
-        "status": inv.status,
-        # OCR
-        "ocr_confidence": inv.ocr_confidence,
-        # GST cache validation
-        "gstin_cache_status": inv.gstin_cache_status,
-        "gstin_validated_from_cache": inv.gstin_validated_from_cache,
-        "gstr2b_itc_eligible": inv.gstr2b_itc_eligible,
-        "gstin_cache_age_hours": inv.gstin_cache_age_hours,
-        # Matching
-        "match_status": inv.match_status,
-        "match_variance": inv.match_variance,
-        "match_exception_reason": inv.match_exception_reason,
-        "match_note": inv.match_note,
-        # AI coding agent
-        "coding_agent_gl": inv.coding_agent_gl,
-        "coding_agent_confidence": inv.coding_agent_confidence,
-        "coding_agent_category": inv.coding_agent_category,
-        # Fraud
-        "fraud_flag": inv.fraud_flag,
-        "fraud_reasons": inv.fraud_reasons or [],
-        # Cash optimisation
-        "cash_opt_suggestion": inv.cash_opt_suggestion,
-        # EBS AP
-        "ebs_ap_status": inv.ebs_ap_status,
-        "ebs_ap_ref": inv.ebs_ap_ref,
-        "ebs_posted_at": inv.ebs_posted_at,
-        # Approval / rejection
-        "approved_by": inv.approved_by,
-        "approved_at": inv.approved_at,
-        "rejected_by": inv.rejected_by,
-        "rejected_at": inv.rejected_at,
-        "rejection_reason": inv.rejection_reason,
-        # MSME
-        "is_msme_supplier": inv.is_msme_supplier,
-        "msme_category": inv.msme_category,
-        "msme_days_remaining": inv.msme_days_remaining,
-        "msme_due_date": inv.msme_due_date,
-        "msme_status": inv.msme_status,
-        "msme_penalty_amount": inv.msme_penalty_amount,
-        # Upload
-        "uploaded_by": inv.uploaded_by,
-        "created_at": _dt_to_str(inv.created_at) if inv.created_at else None,
-        "updated_at": _dt_to_str(inv.updated_at) if inv.updated_at else None,
-        # Nested related objects
-        "po": po_dict,
-        "grn": grn_dict,
-        "gst_record": gst_dict,
     }
+    detail.update(zip(_DETAIL_COLUMNS, _get_detail_columns(inv)))
+    detail["po"] = po_dict
+    detail["grn"] = grn_dict
+    detail["gst_record"] = gst_embed
+    return detail
+
+
+# ---------------------------------------------------------------------------
+# Internal helpers — simulated pipeline steps
+# ---------------------------------------------------------------------------
+
+def _simulate_ocr(inv: Invoice) -> None:
+    """CAPTURED -> EXTRACTED: simulate OCR extraction."""
+    inv.ocr_confidence = 95.2
+
+
+def _simulate_gst_validation(inv: Invoice) -> None:
+    """EXTRACTED -> VALIDATED: simulate GST validation from cache."""
+    inv.gstin_cache_status = "VALID"
+    inv.gstin_validated_from_cache = True
+    inv.gstr2b_itc_eligible = True
+    inv.gstin_cache_age_hours = 1.5
+
+
+def _simulate_matching(inv: Invoice) -> None:
+    """VALIDATED -> MATCHED: simulate the matching engine."""
+    if inv.po_id and inv.grn_id:
+        inv.match_status = "3WAY_MATCH_PASSED"
+        inv.match_variance = 0.0
+        inv.match_note = (
+            "PO amount matches invoice. GRN confirms delivery. "
+            "3-way match passed."
+        )
+    elif inv.po_id:
+        inv.match_status = "2WAY_MATCH_PASSED"
+        inv.match_variance = 0.0
+        inv.match_note = "PO amount matches invoice. 2-way match passed."
+    else:
+        inv.match_status = "3WAY_MATCH_EXCEPTION"
+        inv.match_variance = 0.0
+        inv.match_exception_reason = (
+            "No matching PO found. Invoice submitted without "
+            "purchase order reference."
+        )
+        inv.match_note = (
+            "Non-PO invoice. Requires manual approval per policy."
+        )
+
+
+def _simulate_ai_coding(inv: Invoice) -> None:
+    """MATCHED -> PENDING_APPROVAL: simulate the AI coding agent."""
+    inv.coding_agent_gl = "6100"
+    inv.coding_agent_confidence = 0.92
+    inv.coding_agent_category = "General Services"
+
+
+# Keyed by the status being left; one O(1) lookup instead of an if/elif chain
+_SIMULATION_STEPS: Dict[str, Callable[[Invoice], None]] = {
+    "CAPTURED": _simulate_ocr,
+    "EXTRACTED": _simulate_gst_validation,
+    "VALIDATED": _simulate_matching,
+    "MATCHED": _simulate_ai_coding,
+}
 
 
 # ---------------------------------------------------------------------------
 # Public API — Read
 # ---------------------------------------------------------------------------
 
-async def list_invoices(db: AsyncSession) -> List[Dict[str, Any]]:
-    """Return all invoices as legacy-shaped dicts with resolved FK codes.
+# The list shape in one statement: only the needed columns, with FK UUIDs
+# resolved to codes by outer joins along the Invoice relationships.  Rows
+# map 1:1 onto ``InvoiceListItem`` so no per-row post-processing (or per-row
+# lookup query) is needed — one round trip, versus 1 + 3 for selectinload.
+_LIST_STMT = (
+    select(
+        Invoice.invoice_number.label("id"),
+        Invoice.invoice_number,
+        func.coalesce(Supplier.code, Invoice.supplier_id).label("supplier_id"),
+        func.coalesce(Supplier.legal_name, "Unknown Supplier").label("supplier_name"),
+        PurchaseOrder.po_number.label("po_id"),
+        GoodsReceiptNote.grn_number.label("grn_id"),
+        Invoice.invoice_date,
+        Invoice.due_date,
+        Invoice.subtotal.label("subtotal"),
+        Invoice.gst_rate,
+        Invoice.gst_amount.label("gst_amount"),
+        Invoice.tds_rate,
+        Invoice.tds_amount.label("tds_amount"),
+        Invoice.total_amount.label("total_amount"),
+        Invoice.net_payable.label("net_payable"),
+        Invoice.status,
+        Invoice.match_status,
+        Invoice.is_msme_supplier,
+        Invoice.msme_status,
+        Invoice.fraud_flag,
+        Invoice.ebs_ap_status,
+        Invoice.created_at,
+        Invoice.uploaded_by,
+    )
+    .outerjoin(Invoice.supplier)
+    .outerjoin(Invoice.purchase_order)
+    .outerjoin(Invoice.grn)
+    .order_by(Invoice.invoice_number)
+)
+
+
+async def list_invoices(
+    db: AsyncSession,
+    status: Optional[str] = None,
+    skip: int = 0,
+    limit: int = 50,
+) -> Dict[str, Any]:
+    """Return one page of invoices as legacy-shaped dicts with resolved FK codes.
 
     Each dict contains human-readable supplier code, PO number, and GRN
-    number instead of UUIDs.
+    number instead of UUIDs — resolved in the same query, not per row.
+    ``status`` filters in SQL (served by ``ix_invoices_status_supplier``).
+
+    Pagination is applied in SQL (OFFSET/LIMIT), so only the requested page
+    is ever materialised.  The total rides along on every row as a
+    ``COUNT(*) OVER ()`` window, so a page costs one round trip; a separate
+    COUNT only runs when the page is empty.  The return value has the same
+    ``{"items", "total", "skip", "limit"}`` shape as ``paginate()``.
     """
-    result = await db.execute(
-        select(Invoice).order_by(Invoice.invoice_number)
-    )
-    invoices = list(result.scalars().all())
+    stmt = _LIST_STMT.add_columns(func.count().over().label("total_count"))
+    if status:
+        stmt = stmt.where(Invoice.status == status)
+
+    result = await db.execute(stmt.offset(skip).limit(limit))
+    items: List[Dict[str, Any]] = []
+    total: Optional[int] = None
+    for row in result.mappings():
+        item = dict(row)
+        total = item.pop("total_count")
+        items.append(item)
 
-    summaries: List[Dict[str, Any]] = []
-    for inv in invoices:
-        summary = await _build_invoice_summary(db, inv)
-        summaries.append(summary)
+    if total is None:
+        # Empty page (no matches, or skip past the end) — count separately
+        count_stmt = select(func.count()).select_from(Invoice)
+        if status:
+            count_stmt = count_stmt.where(Invoice.status == status)
+        total = (await db.execute(count_stmt)).scalar_one()
 
-    return summaries
+    return {"items": items, "total": total, "skip": skip, "limit": limit}
 
 
 async def get_invoice_by_id(
@@ -408,13 +376,27 @@ async def get_invoice_by_id(
     if inv is None:
         return None
 
-    return await _build_invoice_detail(db, inv)
+    return _build_invoice_detail(inv)
 
 
 # ---------------------------------------------------------------------------
 # Public API — Write (state transitions)
 # ---------------------------------------------------------------------------
 
+# Status guards shared by every call — built once, not per request
+_APPROVABLE_STATUSES: Final = frozenset({"PENDING_APPROVAL", "MATCHED"})
+_APPROVABLE_STATUSES_TEXT: Final = ", ".join(sorted(_APPROVABLE_STATUSES))
+_NON_REJECTABLE: Final = frozenset({"POSTED_TO_EBS", "PAID", "REJECTED"})
+
+# Simulated pipeline: current status -> next status
+_PROGRESSION: Final[Mapping[str, str]] = MappingProxyType({
+    "CAPTURED": "EXTRACTED",
+    "EXTRACTED": "VALIDATED",
+    "VALIDATED": "MATCHED",
+    "MATCHED": "PENDING_APPROVAL",
+})
+
+
 async def approve_invoice(
     db: AsyncSession,
     inv_id: str,
@@ -437,24 +419,24 @@ async def approve_invoice(
     if inv is None:
         raise NotFoundError(f"Invoice {inv_id} not found")
 
-    approvable_statuses = {"PENDING_APPROVAL", "MATCHED"}
-    if inv.status not in approvable_statuses:
+    if inv.status not in _APPROVABLE_STATUSES:
         raise ValidationError(
             f"Cannot approve invoice {inv_id}: current status is {inv.status}, "
-            f"expected one of {', '.join(sorted(approvable_statuses))}"
+            f"expected one of {_APPROVABLE_STATUSES_TEXT}"
         )
 
     validate_transition("invoice", inv.status, "APPROVED")
     validate_maker_checker(inv.uploaded_by, approved_by, "invoice")
 
-    now = datetime.now(timezone.utc)
+    now = datetime.utcnow()
     inv.status = "APPROVED"
     inv.approved_by = approved_by or "Demo Approver"
     inv.approved_at = now
     inv.ebs_ap_status = "PENDING"
+    # Set explicitly so the onupdate default doesn't expire it on flush
+    inv.updated_at = now
 
     await db.flush()
-    await db.refresh(inv)
 
     # Publish event
     await event_bus.publish(Event(
@@ -468,12 +450,14 @@ async def approve_invoice(
         source="invoices",
     ))
 
-    return await _build_invoice_detail(db, inv)
+    return _build_invoice_detail(inv)
 
 
 async def reject_invoice(
     db: AsyncSession,
     inv_id: str,
+    rejected_by: Optional[str] = None,
+    reason: Optional[str] = None,
 ) -> Dict[str, Any]:
     """Reject an invoice.
 
@@ -490,23 +474,23 @@ async def reject_invoice(
     if inv is None:
         raise NotFoundError(f"Invoice {inv_id} not found")
 
-    non_rejectable = {"POSTED_TO_EBS", "PAID", "REJECTED"}
-    if inv.status in non_rejectable:
+    if inv.status in _NON_REJECTABLE:
         raise ValidationError(
             f"Cannot reject invoice {inv_id}: current status is {inv.status}"
         )
 
     validate_transition("invoice", inv.status, "REJECTED")
 
-    now = datetime.now(timezone.utc)
+    now = datetime.utcnow()
     inv.status = "REJECTED"
-    inv.rejected_by = "Demo Approver"
+    inv.rejected_by = rejected_by or "Demo Approver"
     inv.rejected_at = now
-    inv.rejection_reason = "Rejected via demo"
+    inv.rejection_reason = reason or "Rejected via demo"
     inv.ebs_ap_status = "BLOCKED"
+    # Set explicitly so the onupdate default doesn't expire it on flush
+    inv.updated_at = now
 
     await db.flush()
-    await db.refresh(inv)
 
     # Publish event
     await event_bus.publish(Event(
@@ -520,7 +504,7 @@ async def reject_invoice(
         source="invoices",
     ))
 
-    return await _build_invoice_detail(db, inv)
+    return _build_invoice_detail(inv)
 
 
 async def simulate_processing(
@@ -547,14 +531,7 @@ async def simulate_processing(
     if inv is None:
         raise NotFoundError(f"Invoice {inv_id} not found")
 
-    progression = {
-        "CAPTURED": "EXTRACTED",
-        "EXTRACTED": "VALIDATED",
-        "VALIDATED": "MATCHED",
-        "MATCHED": "PENDING_APPROVAL",
-    }
-
-    next_status = progression.get(inv.status)
+    next_status = _PROGRESSION.get(inv.status)
     if next_status is None:
         raise ValidationError(
             f"Invoice {inv_id} cannot advance further: current status is {inv.status}"
@@ -564,50 +541,13 @@ async def simulate_processing(
     validate_transition("invoice", old_status, next_status)
     inv.status = next_status
 
-    # Populate simulated metadata based on the transition
-    if old_status == "CAPTURED":
-        # Simulate OCR extraction
-        inv.ocr_confidence = 95.2
-
-    elif old_status == "EXTRACTED":
-        # Simulate GST validation from cache
-        inv.gstin_cache_status = "VALID"
-        inv.gstin_validated_from_cache = True
-        inv.gstr2b_itc_eligible = True
-        inv.gstin_cache_age_hours = 1.5
-
-    elif old_status == "VALIDATED":
-        # Simulate matching engine
-        if inv.po_id and inv.grn_id:
-            inv.match_status = "3WAY_MATCH_PASSED"
-            inv.match_variance = 0.0
-            inv.match_note = (
-                "PO amount matches invoice. GRN confirms delivery. "
-                "3-way match passed."
-            )
-        elif inv.po_id:
-            inv.match_status = "2WAY_MATCH_PASSED"
-            inv.match_variance = 0.0
-            inv.match_note = "PO amount matches invoice. 2-way match passed."
-        else:
-            inv.match_status = "3WAY_MATCH_EXCEPTION"
-            inv.match_variance = 0.0
-            inv.match_exception_reason = (
-                "No matching PO found. Invoice submitted without "
-                "purchase order reference."
-            )
-            inv.match_note = (
-                "Non-PO invoice. Requires manual approval per policy."
-            )
-
-    elif old_status == "MATCHED":
-        # Simulate AI coding agent
-        inv.coding_agent_gl = "6100"
-        inv.coding_agent_confidence = 0.92
-        inv.coding_agent_category = "General Services"
+    # Populate simulated metadata for the step being left
+    _SIMULATION_STEPS[old_status](inv)
+
+    # Set explicitly so the onupdate default doesn't expire it on flush
+    inv.updated_at = datetime.utcnow()
 
     await db.flush()
-    await db.refresh(inv)
 
     # Publish event
     event_name = f"invoice.{next_status.lower().replace('_', '-')}"
@@ -621,4 +561,4 @@ async def simulate_processing(
         source="invoices",
     ))
 
-    return await _build_invoice_detail(db, inv)
+    return _build_invoice_detail(inv)
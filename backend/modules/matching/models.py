@@ -6,11 +6,11 @@ Stores the outcome of 2-way and 3-way matching between invoices, POs, and GRNs,
 plus exception queue for manual resolution.
 """
 
-import uuid
+from sqlalchemy import Column, String, Float, Text, DateTime, ForeignKey, Index, func, text
 
-from sqlalchemy import Column, String, Float, Text, DateTime, ForeignKey, func
+from sqlalchemy.orm import relationship
 
-from backend.base_model import Base
+from backend.base_model import Base, new_id
 
 
 class MatchResult(Base):
@@ -22,7 +22,7 @@ class MatchResult(Base):
 
     __tablename__ = "match_results"
 
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()), nullable=False)
+    id = Column(String(36), primary_key=True, default=new_id, nullable=False)
     invoice_id = Column(String(36), ForeignKey("invoices.id"), nullable=False, index=True)
     match_type = Column(String(20), nullable=False)  # 2WAY / 3WAY
     status = Column(String(30), nullable=False, default="PENDING")  # PASSED / EXCEPTION / BLOCKED_FRAUD / PENDING
@@ -39,8 +39,18 @@ class MatchingException(Base):
     """
 
     __tablename__ = "matching_exceptions"
+    __table_args__ = (
+        # Open exception queue: WHERE resolution IS NULL ORDER BY created_at DESC.
+        # Partial, so it only grows with the open queue, not resolved history.
+        Index(
+            "ix_matching_exceptions_unresolved",
+            "created_at",
+            postgresql_where=text("resolution IS NULL"),
+            sqlite_where=text("resolution IS NULL"),
+        ),
+    )
 
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()), nullable=False)
+    id = Column(String(36), primary_key=True, default=new_id, nullable=False)
     match_result_id = Column(String(36), ForeignKey("match_results.id"), nullable=False, index=True)
     invoice_id = Column(String(36), ForeignKey("invoices.id"), nullable=False, index=True)
     exception_type = Column(String(50), nullable=False)  # PRICE_VARIANCE, QUANTITY_MISMATCH, NO_PO, DUPLICATE, OTHER
@@ -51,3 +61,7 @@ class MatchingException(Base):
     resolved_at = Column(DateTime, nullable=True)
     resolution_notes = Column(Text, nullable=True)
     created_at = Column(DateTime, nullable=False, server_default=func.now())
+
+    # Lets a new exception be linked to its not-yet-flushed result, and makes
+    # the unit of work INSERT the result first in the same flush
+    match_result = relationship("MatchResult", lazy="raise")
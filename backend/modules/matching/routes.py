@@ -8,16 +8,20 @@ Invoice matching engine: run matches, view results, manage exceptions.
 
 from __future__ import annotations
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.dependencies import get_db, get_current_user, require_role, paginate
 from backend.modules.matching.schemas import (
+    MATCH_RESULT_LIST_ADAPTER,
+    MATCHING_EXCEPTION_LIST_ADAPTER,
+    MatchBatchResponse,
     MatchResultResponse,
     MatchingExceptionResponse,
     MatchSummaryResponse,
+    RunMatchBatchRequest,
     RunMatchRequest,
     ResolveExceptionRequest,
 )
@@ -34,13 +38,16 @@ router = APIRouter(prefix="/api/matching", tags=["matching"])
 async def list_results(
     skip: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = Query(
+        None, description="next_cursor from the previous page (keyset; overrides skip)",
+    ),
     db: AsyncSession = Depends(get_db),
     _user: Dict[str, Any] = Depends(get_current_user),
 ) -> Dict[str, Any]:
-    """List all match results."""
-    items = await service.list_match_results(db)
-    results = [MatchResultResponse.model_validate(i) for i in items]
-    return paginate(results, skip, limit)
+    """List match results, newest first, one page at a time."""
+    page = await service.list_match_results(db, skip=skip, limit=limit, cursor=cursor)
+    page["items"] = MATCH_RESULT_LIST_ADAPTER.validate_python(page["items"])
+    return page
 
 
 # ---------------------------------------------------------------------------
@@ -76,6 +83,23 @@ async def run_match(
     return MatchResultResponse.model_validate(result)
 
 
+# ---------------------------------------------------------------------------
+# POST  /api/matching/run-batch
+# ---------------------------------------------------------------------------
+
+@router.post("/run-batch", response_model=MatchBatchResponse)
+async def run_match_batch(
+    body: RunMatchBatchRequest,
+    db: AsyncSession = Depends(get_db),
+    _user: Dict[str, Any] = Depends(require_role("PROCUREMENT_MANAGER")),
+) -> MatchBatchResponse:
+    """Run matching for many invoices at once (e.g. nightly pipeline runs)."""
+    result = await service.run_match_batch(
+        db, body.invoice_ids, match_type=body.match_type,
+    )
+    return MatchBatchResponse.model_validate(result)
+
+
 # ---------------------------------------------------------------------------
 # GET  /api/matching/exceptions
 # ---------------------------------------------------------------------------
@@ -90,8 +114,9 @@ async def list_exceptions(
 ) -> Dict[str, Any]:
     """List matching exceptions (exception queue)."""
     items = await service.list_exceptions(db, open_only=open_only)
-    results = [MatchingExceptionResponse.model_validate(i) for i in items]
-    return paginate(results, skip, limit)
+    page = paginate(items, skip, limit)
+    page["items"] = MATCHING_EXCEPTION_LIST_ADAPTER.validate_python(page["items"])
+    return page
 
 
 # ---------------------------------------------------------------------------
@@ -6,14 +6,14 @@ Request/response shapes for match results and exception handling.
 
 from __future__ import annotations
 
-from typing import Optional
+from typing import List, Optional
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, Field, TypeAdapter
 
+from backend.base_schema import FastBase
 
-class MatchResultResponse(BaseModel):
-    model_config = ConfigDict(from_attributes=True)
 
+class MatchResultResponse(FastBase):
     id: str
     invoice_id: str
     invoice_number: Optional[str] = None
@@ -26,9 +26,7 @@ class MatchResultResponse(BaseModel):
     created_at: Optional[str] = None
 
 
-class MatchingExceptionResponse(BaseModel):
-    model_config = ConfigDict(from_attributes=True)
-
+class MatchingExceptionResponse(FastBase):
     id: str
     match_result_id: str
     invoice_id: str
@@ -44,10 +42,25 @@ class MatchingExceptionResponse(BaseModel):
     created_at: Optional[str] = None
 
 
+# Built once at import; each list page is validated in a single call
+MATCH_RESULT_LIST_ADAPTER = TypeAdapter(List[MatchResultResponse])
+MATCHING_EXCEPTION_LIST_ADAPTER = TypeAdapter(List[MatchingExceptionResponse])
+
+
 class RunMatchRequest(BaseModel):
     match_type: str = "3WAY"  # 2WAY or 3WAY
 
 
+class RunMatchBatchRequest(BaseModel):
+    invoice_ids: List[str] = Field(..., min_length=1, max_length=500)  # invoice numbers
+    match_type: str = "3WAY"  # 2WAY or 3WAY
+
+
+class MatchBatchResponse(BaseModel):
+    results: List[MatchResultResponse]
+    skipped: List[str]  # unknown or already-matched invoice numbers
+
+
 class ResolveExceptionRequest(BaseModel):
     resolution: str  # APPROVED_OVERRIDE / REJECTED / ESCALATED
     resolution_notes: Optional[str] = None
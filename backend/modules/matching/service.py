@@ -8,10 +8,11 @@ Creates match results, raises exceptions, and supports manual resolution.
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-from sqlalchemy import func, select
+from sqlalchemy import and_, bindparam, case, exists, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased, load_only, raiseload
 
 from backend.event_bus import Event, event_bus
 from backend.modules.matching.models import MatchResult, MatchingException
@@ -24,32 +25,44 @@ from backend.modules.suppliers.models import Supplier
 # Run matching
 # ---------------------------------------------------------------------------
 
-async def run_match(
-    db: AsyncSession,
-    invoice_id: str,
-    match_type: str = "3WAY",
-) -> Dict[str, Any]:
-    """Run 2-way or 3-way matching for an invoice.
+# Everything a match run reads, in one round trip: the invoice, its PO and
+# GRN (outer-joined along the Invoice relationships) and whether a match
+# result already exists.  Line items are never read here, so their
+# selectin eager loads are switched off.
+_MATCH_INPUTS_STMT = (
+    select(
+        Invoice,
+        PurchaseOrder,
+        GoodsReceiptNote,
+        exists().where(MatchResult.invoice_id == Invoice.id).label("already_matched"),
+    )
+    .outerjoin(Invoice.purchase_order)
+    .outerjoin(Invoice.grn)
+    .options(
+        raiseload(PurchaseOrder.line_items),
+        raiseload(GoodsReceiptNote.line_items),
+    )
+)
+_RUN_MATCH_STMT = _MATCH_INPUTS_STMT.where(
+    Invoice.invoice_number == bindparam("invoice_number")
+)
+_RUN_MATCH_BATCH_STMT = _MATCH_INPUTS_STMT.where(
+    Invoice.invoice_number.in_(bindparam("invoice_numbers", expanding=True))
+)
+
+
+def _evaluate_match(
+    inv: Invoice,
+    po: Optional[PurchaseOrder],
+    grn: Optional[GoodsReceiptNote],
+    match_type: str,
+) -> Tuple[str, float, List[str]]:
+    """Apply the matching rules; returns (status, variance_pct, reasons).
 
     2WAY: Invoice total vs PO total — checks price variance.
     3WAY: Invoice vs PO vs GRN — checks price AND quantity.
     """
-    # Load invoice by invoice_number
-    result = await db.execute(
-        select(Invoice).where(Invoice.invoice_number == invoice_id)
-    )
-    inv = result.scalar_one_or_none()
-    if not inv:
-        raise ValueError(f"Invoice {invoice_id} not found")
-
-    # Check if already matched
-    existing = await db.execute(
-        select(MatchResult).where(MatchResult.invoice_id == inv.id)
-    )
-    if existing.scalar_one_or_none():
-        raise ValueError(f"Invoice {invoice_id} already has a match result")
-
-    exception_reasons = []
+    exception_reasons: List[str] = []
     variance_pct = 0.0
     status = "PASSED"
 
@@ -57,84 +70,123 @@ async def run_match(
     if not inv.po_id:
         status = "EXCEPTION"
         exception_reasons.append("No matching PO found")
-    else:
-        # Load PO
-        po_result = await db.execute(
-            select(PurchaseOrder).where(PurchaseOrder.id == inv.po_id)
-        )
-        po = po_result.scalar_one_or_none()
-
-        if po:
-            # 2-way: price variance
-            if po.amount and po.amount > 0:
-                variance_pct = abs(inv.subtotal - po.amount) / po.amount * 100
-                if variance_pct > 5.0:  # 5% tolerance
-                    status = "EXCEPTION"
-                    exception_reasons.append(
-                        f"Price variance {variance_pct:.1f}% exceeds 5% tolerance"
-                    )
-
-            # 3-way: quantity check
-            if match_type == "3WAY" and inv.grn_id:
-                grn_result = await db.execute(
-                    select(GoodsReceiptNote).where(GoodsReceiptNote.id == inv.grn_id)
+    elif po:
+        # 2-way: price variance
+        if po.amount and po.amount > 0:
+            variance_pct = abs(inv.subtotal - po.amount) / po.amount * 100
+            if variance_pct > 5.0:  # 5% tolerance
+                status = "EXCEPTION"
+                exception_reasons.append(
+                    f"Price variance {variance_pct:.1f}% exceeds 5% tolerance"
                 )
-                grn = grn_result.scalar_one_or_none()
-                if grn and grn.status == "PARTIAL":
-                    if status != "EXCEPTION":
-                        status = "EXCEPTION"
-                    exception_reasons.append(
-                        "GRN shows partial delivery — quantity mismatch"
-                    )
-            elif match_type == "3WAY" and not inv.grn_id:
+
+        # 3-way: quantity check
+        if match_type == "3WAY" and inv.grn_id:
+            if grn and grn.status == "PARTIAL":
                 if status != "EXCEPTION":
                     status = "EXCEPTION"
-                exception_reasons.append("No GRN found for 3-way match")
+                exception_reasons.append(
+                    "GRN shows partial delivery — quantity mismatch"
+                )
+        elif match_type == "3WAY" and not inv.grn_id:
+            if status != "EXCEPTION":
+                status = "EXCEPTION"
+            exception_reasons.append("No GRN found for 3-way match")
 
     # Fraud check
     if inv.fraud_flag:
         status = "BLOCKED_FRAUD"
         exception_reasons.append("Invoice flagged for fraud")
 
-    note = "; ".join(exception_reasons) if exception_reasons else f"{match_type} match passed"
+    return status, variance_pct, exception_reasons
+
+
+# Match statuses that open an entry in the exception queue
+_EXCEPTION_STATUSES = frozenset({"EXCEPTION", "BLOCKED_FRAUD"})
+
+
+def _classify_exception(inv: Invoice, variance_pct: float) -> Tuple[str, str]:
+    """Return (exception_type, severity) for a failed match."""
+    if inv.fraud_flag:
+        return "FRAUD_BLOCK", "CRITICAL"
+    severity = "HIGH" if variance_pct > 10 else "MEDIUM"
+    if variance_pct > 5.0:
+        return "PRICE_VARIANCE", severity
+    if not inv.po_id:
+        return "NO_PO", severity
+    return "QUANTITY_MISMATCH", severity
+
+
+def _record_match(
+    inv: Invoice,
+    match_type: str,
+    status: str,
+    variance_pct: float,
+    exception_reasons: List[str],
+) -> Tuple[MatchResult, Optional[MatchingException]]:
+    """Build the MatchResult (plus exception entry, if any) and stamp the
+    invoice's match fields.  Nothing is added or flushed here; the exception
+    is linked via its ``match_result`` relationship, so one flush inserts
+    both in FK order.
+    """
+    # Each derived value is computed once and shared by result and invoice
+    reason = "; ".join(exception_reasons) if exception_reasons else None
+    note = reason or f"{match_type} match passed"
+    variance = round(variance_pct, 2)
 
-    # Save match result
     mr = MatchResult(
         invoice_id=inv.id,
         match_type=match_type,
         status=status,
-        variance_pct=round(variance_pct, 2),
-        exception_reason="; ".join(exception_reasons) if exception_reasons else None,
+        variance_pct=variance,
+        exception_reason=reason,
         note=note,
     )
-    db.add(mr)
-    await db.flush()
-
-    # Create exception entry if needed
-    exception_dict = None
-    if status in ("EXCEPTION", "BLOCKED_FRAUD"):
-        exc_type = "PRICE_VARIANCE" if variance_pct > 5.0 else "NO_PO" if not inv.po_id else "QUANTITY_MISMATCH"
-        if inv.fraud_flag:
-            exc_type = "FRAUD_BLOCK"
-        severity = "CRITICAL" if inv.fraud_flag else "HIGH" if variance_pct > 10 else "MEDIUM"
 
+    me: Optional[MatchingException] = None
+    if status in _EXCEPTION_STATUSES:
+        exc_type, severity = _classify_exception(inv, variance_pct)
         me = MatchingException(
-            match_result_id=mr.id,
+            match_result=mr,
             invoice_id=inv.id,
             exception_type=exc_type,
             severity=severity,
-            description="; ".join(exception_reasons),
+            description=reason,
         )
-        db.add(me)
-        await db.flush()
-        exception_dict = _exception_to_dict(me)
 
     # Update invoice match fields
     inv.match_status = f"{match_type}_MATCH_{status}"
-    inv.match_variance = round(variance_pct, 2)
-    inv.match_exception_reason = "; ".join(exception_reasons) if exception_reasons else None
+    inv.match_variance = variance
+    inv.match_exception_reason = reason
     inv.match_note = note
 
+    return mr, me
+
+
+async def run_match(
+    db: AsyncSession,
+    invoice_id: str,
+    match_type: str = "3WAY",
+) -> Dict[str, Any]:
+    """Run 2-way or 3-way matching for an invoice.
+
+    2WAY: Invoice total vs PO total — checks price variance.
+    3WAY: Invoice vs PO vs GRN — checks price AND quantity.
+    """
+    row = (await db.execute(_RUN_MATCH_STMT, {"invoice_number": invoice_id})).first()
+    if row is None:
+        raise ValueError(f"Invoice {invoice_id} not found")
+    inv, po, grn, already_matched = row
+
+    if already_matched:
+        raise ValueError(f"Invoice {invoice_id} already has a match result")
+
+    status, variance_pct, exception_reasons = _evaluate_match(inv, po, grn, match_type)
+    mr, me = _record_match(inv, match_type, status, variance_pct, exception_reasons)
+    db.add(mr)
+    if me is not None:
+        db.add(me)
+
     await db.commit()
 
     await event_bus.publish(Event(
@@ -146,22 +198,130 @@ async def run_match(
     return _result_to_dict(mr, inv.invoice_number)
 
 
+async def run_match_batch(
+    db: AsyncSession,
+    invoice_ids: List[str],
+    match_type: str = "3WAY",
+) -> Dict[str, Any]:
+    """Run matching for many invoices with a constant number of statements.
+
+    All invoices, with their PO, GRN and existing-match flag, are loaded
+    in one query; results, exceptions and invoice updates are written in
+    one commit.  Invoice numbers that don't exist or are already matched
+    are returned under ``skipped`` instead of failing the whole batch.
+    """
+    result = await db.execute(
+        _RUN_MATCH_BATCH_STMT, {"invoice_numbers": list(set(invoice_ids))},
+    )
+    inputs = {row[0].invoice_number: row for row in result.all()}
+
+    matched: List[Tuple[MatchResult, str]] = []
+    skipped: List[str] = []
+    for invoice_id in dict.fromkeys(invoice_ids):
+        row = inputs.get(invoice_id)
+        if row is None or row.already_matched:
+            skipped.append(invoice_id)
+            continue
+        inv, po, grn, _ = row
+        status, variance_pct, exception_reasons = _evaluate_match(inv, po, grn, match_type)
+        mr, me = _record_match(inv, match_type, status, variance_pct, exception_reasons)
+        db.add(mr)
+        if me is not None:
+            db.add(me)
+        matched.append((mr, invoice_id))
+
+    # A single flush at commit batches every INSERT and invoice UPDATE
+    await db.commit()
+
+    for mr, invoice_id in matched:
+        await event_bus.publish(Event(
+            name=f"matching.{mr.status.lower()}",
+            data={"invoice_id": invoice_id, "match_type": match_type, "status": mr.status},
+            source="matching",
+        ))
+
+    return {
+        "results": [_result_to_dict(mr, invoice_id) for mr, invoice_id in matched],
+        "skipped": skipped,
+    }
+
+
 # ---------------------------------------------------------------------------
 # List & query
 # ---------------------------------------------------------------------------
 
-async def list_match_results(db: AsyncSession) -> List[Dict[str, Any]]:
-    """List all match results with invoice numbers."""
-    result = await db.execute(
-        select(MatchResult, Invoice.invoice_number, Supplier.legal_name)
-        .join(Invoice, Invoice.id == MatchResult.invoice_id)
-        .outerjoin(Supplier, Supplier.id == Invoice.supplier_id)
-        .order_by(MatchResult.created_at.desc())
+# Second handle on match_results for the cursor-row lookup
+_CursorResult = aliased(MatchResult)
+
+# Newest first, with ``id`` as tie-breaker so the (created_at, id) keyset
+# cursor is total even when several results share a timestamp.  The total
+# rides along on every row as an uncorrelated scalar subquery.
+_LIST_RESULTS_STMT = (
+    select(
+        MatchResult,
+        Invoice.invoice_number,
+        Supplier.legal_name,
+        select(func.count())
+        .select_from(MatchResult)
+        .correlate(None)
+        .scalar_subquery()
+        .label("total"),
     )
-    return [
-        {**_result_to_dict(mr, inv_num), "supplier_name": sup_name}
-        for mr, inv_num, sup_name in result.all()
-    ]
+    .join(Invoice, Invoice.id == MatchResult.invoice_id)
+    .outerjoin(Supplier, Supplier.id == Invoice.supplier_id)
+    .order_by(MatchResult.created_at.desc(), MatchResult.id.desc())
+)
+
+
+async def list_match_results(
+    db: AsyncSession,
+    skip: int = 0,
+    limit: int = 50,
+    cursor: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Return one page of match results with invoice numbers.
+
+    Pages are cut in SQL.  With ``cursor`` (the ``next_cursor`` of the
+    previous page: the id of its last row) the page starts right after
+    that row via a keyset predicate instead of OFFSET, so deep pages cost
+    the same as the first; ``skip`` is ignored then.  Returns the
+    ``paginate()`` envelope plus ``next_cursor`` (None on the last page).
+    """
+    stmt = _LIST_RESULTS_STMT
+    if cursor:
+        # Compare against the cursor row's stored timestamp rather than a
+        # round-tripped value, so dialect storage formats can't skew it
+        cursor_created_at = (
+            select(_CursorResult.created_at)
+            .where(_CursorResult.id == cursor)
+            .scalar_subquery()
+        )
+        stmt = stmt.where(or_(
+            MatchResult.created_at < cursor_created_at,
+            and_(MatchResult.created_at == cursor_created_at, MatchResult.id < cursor),
+        ))
+    else:
+        stmt = stmt.offset(skip)
+
+    result = await db.execute(stmt.limit(limit))
+    rows = result.all()
+
+    if rows:
+        total = rows[0].total
+    else:
+        total = (await db.execute(select(func.count()).select_from(MatchResult))).scalar_one()
+
+    next_cursor = rows[-1][0].id if len(rows) == limit else None
+    return {
+        "items": [
+            {**_result_to_dict(mr, inv_num), "supplier_name": sup_name}
+            for mr, inv_num, sup_name, _ in rows
+        ],
+        "total": total,
+        "skip": skip,
+        "limit": limit,
+        "next_cursor": next_cursor,
+    }
 
 
 async def list_exceptions(
@@ -175,7 +335,8 @@ async def list_exceptions(
         .outerjoin(Supplier, Supplier.id == Invoice.supplier_id)
     )
     if open_only:
-        q = q.where(MatchingException.resolution == None)  # noqa: E711
+        # Same predicate as ix_matching_exceptions_unresolved
+        q = q.where(MatchingException.resolution.is_(None))
     q = q.order_by(MatchingException.created_at.desc())
 
     result = await db.execute(q)
@@ -185,50 +346,50 @@ async def list_exceptions(
     ]
 
 
-async def get_match_summary(db: AsyncSession) -> Dict[str, Any]:
-    """Return summary statistics for matching."""
-    total_result = await db.execute(select(func.count(MatchResult.id)))
-    total = total_result.scalar() or 0
+def _count_status(status: str):
+    """COUNT of match results in ``status`` (CASE yields NULL otherwise)."""
+    return func.count(case((MatchResult.status == status, 1)))
 
-    passed_result = await db.execute(
-        select(func.count(MatchResult.id)).where(MatchResult.status == "PASSED")
-    )
-    passed = passed_result.scalar() or 0
 
-    exc_result = await db.execute(
-        select(func.count(MatchResult.id)).where(MatchResult.status == "EXCEPTION")
-    )
-    exceptions = exc_result.scalar() or 0
+# Whole summary in one round trip: conditional counts over match_results
+# plus the open-exception count as an uncorrelated scalar subquery.  With
+# no GROUP BY the aggregate always yields exactly one row, even when empty.
+_SUMMARY_STMT = select(
+    func.count().label("total_matches"),
+    _count_status("PASSED").label("passed"),
+    _count_status("EXCEPTION").label("exceptions"),
+    _count_status("BLOCKED_FRAUD").label("blocked_fraud"),
+    _count_status("PENDING").label("pending"),
+    select(func.count())
+    .select_from(MatchingException)
+    .where(MatchingException.resolution.is_(None))
+    .scalar_subquery()
+    .label("open_exceptions"),
+).select_from(MatchResult)
 
-    fraud_result = await db.execute(
-        select(func.count(MatchResult.id)).where(MatchResult.status == "BLOCKED_FRAUD")
-    )
-    blocked_fraud = fraud_result.scalar() or 0
-
-    pending_result = await db.execute(
-        select(func.count(MatchResult.id)).where(MatchResult.status == "PENDING")
-    )
-    pending = pending_result.scalar() or 0
 
-    open_exc_result = await db.execute(
-        select(func.count(MatchingException.id)).where(MatchingException.resolution == None)  # noqa: E711
-    )
-    open_exceptions = open_exc_result.scalar() or 0
-
-    return {
-        "total_matches": total,
-        "passed": passed,
-        "exceptions": exceptions,
-        "blocked_fraud": blocked_fraud,
-        "pending": pending,
-        "open_exceptions": open_exceptions,
-    }
+async def get_match_summary(db: AsyncSession) -> Dict[str, Any]:
+    """Return summary statistics for matching in a single query."""
+    row = (await db.execute(_SUMMARY_STMT)).one()
+    return dict(row._mapping)
 
 
 # ---------------------------------------------------------------------------
 # Resolve exception
 # ---------------------------------------------------------------------------
 
+# The exception with everything the resolution reads, in one round trip:
+# its invoice (only invoice_number is loaded; the override path just
+# assigns match fields) and the supplier name for the response.
+_RESOLVE_EXCEPTION_STMT = (
+    select(MatchingException, Invoice, Supplier.legal_name)
+    .outerjoin(Invoice, Invoice.id == MatchingException.invoice_id)
+    .outerjoin(Invoice.supplier)
+    .options(load_only(Invoice.invoice_number))
+    .where(MatchingException.id == bindparam("exception_id"))
+)
+
+
 async def resolve_exception(
     db: AsyncSession,
     exception_id: str,
@@ -236,13 +397,17 @@ async def resolve_exception(
     resolved_by: str,
     resolution_notes: Optional[str] = None,
 ) -> Dict[str, Any]:
-    """Resolve a matching exception."""
-    result = await db.execute(
-        select(MatchingException).where(MatchingException.id == exception_id)
-    )
-    exc = result.scalar_one_or_none()
-    if not exc:
+    """Resolve a matching exception.
+
+    One SELECT loads the exception, its invoice and supplier name up
+    front, so the response needs no re-read after the commit.
+    """
+    row = (
+        await db.execute(_RESOLVE_EXCEPTION_STMT, {"exception_id": exception_id})
+    ).first()
+    if row is None:
         raise ValueError(f"Exception {exception_id} not found")
+    exc, inv, sup_name = row
     if exc.resolution:
         raise ValueError(f"Exception already resolved as {exc.resolution}")
 
@@ -252,33 +417,19 @@ async def resolve_exception(
     exc.resolution_notes = resolution_notes
 
     # If approved override, update invoice match status
-    if resolution == "APPROVED_OVERRIDE":
-        inv_result = await db.execute(
-            select(Invoice).where(Invoice.id == exc.invoice_id)
-        )
-        inv = inv_result.scalar_one_or_none()
-        if inv:
-            inv.match_status = "OVERRIDE_APPROVED"
-            inv.match_note = f"Exception overridden by {resolved_by}: {resolution_notes or 'N/A'}"
+    if resolution == "APPROVED_OVERRIDE" and inv:
+        inv.match_status = "OVERRIDE_APPROVED"
+        inv.match_note = f"Exception overridden by {resolved_by}: {resolution_notes or 'N/A'}"
 
     await db.commit()
 
-    # Fetch invoice number for response
-    inv_result = await db.execute(
-        select(Invoice.invoice_number, Supplier.legal_name)
-        .outerjoin(Supplier, Supplier.id == Invoice.supplier_id)
-        .where(Invoice.id == exc.invoice_id)
-    )
-    row = inv_result.first()
-    inv_num = row[0] if row else None
-    sup_name = row[1] if row else None
-
     await event_bus.publish(Event(
         name="matching.exception_resolved",
         data={"exception_id": exception_id, "resolution": resolution},
         source="matching",
     ))
 
+    inv_num = inv.invoice_number if inv else None
     return {**_exception_to_dict(exc), "invoice_number": inv_num, "supplier_name": sup_name}
 
 
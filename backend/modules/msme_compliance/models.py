@@ -6,10 +6,10 @@ No separate database table is needed for MSME compliance tracking.
 All MSME-related data is stored directly on the Invoice model:
   - is_msme_supplier (Boolean)
   - msme_category (MICRO / SMALL / MEDIUM)
-  - msme_days_remaining (Integer)
+  - msme_days_remaining (derived from msme_due_date, not stored)
   - msme_due_date (date string)
   - msme_status (ON_TRACK / AT_RISK / BREACHED)
-  - msme_penalty_amount (Float)
+  - msme_penalty_amount (rupee view over msme_penalty_amount_paise)
 
 The MSME compliance service queries the invoices table to compute:
   - Section 43B(h) 45-day payment SLA status
@@ -11,11 +11,14 @@ from __future__ import annotations
 
 from typing import Any, Dict
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.dependencies import get_db, get_current_user
-from backend.modules.msme_compliance.schemas import MSMEComplianceResponse
+from backend.modules.msme_compliance.schemas import (
+    MSME_COMPLIANCE_ADAPTER,
+    MSMEComplianceResponse,
+)
 from backend.modules.msme_compliance import service
 
 router = APIRouter(prefix="/api/msme-compliance", tags=["msme-compliance"])
@@ -25,11 +28,11 @@ router = APIRouter(prefix="/api/msme-compliance", tags=["msme-compliance"])
 # GET  /api/msme-compliance
 # ---------------------------------------------------------------------------
 
-@router.get("", response_model=MSMEComplianceResponse)
+@router.get("", responses={200: {"model": MSMEComplianceResponse}})
 async def get_msme_compliance(
     db: AsyncSession = Depends(get_db),
     _user: Dict[str, Any] = Depends(get_current_user),
-) -> MSMEComplianceResponse:
+) -> Response:
     """Return the MSME Section 43B(h) compliance dashboard.
 
     Response includes:
@@ -37,4 +40,9 @@ async def get_msme_compliance(
     - **invoices**: individual MSME-flagged invoices sorted by days_remaining ascending
     """
     result = await service.get_msme_compliance(db)
-    return MSMEComplianceResponse(**result)
+    return Response(
+        content=MSME_COMPLIANCE_ADAPTER.dump_json(
+            MSME_COMPLIANCE_ADAPTER.validate_python(result)
+        ),
+        media_type="application/json",
+    )
@@ -12,7 +12,7 @@ from __future__ import annotations
 
 from typing import List, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 
 
 class MSMEInvoiceResponse(BaseModel):
@@ -50,3 +50,7 @@ class MSMEComplianceResponse(BaseModel):
 
     summary: MSMESummary
     invoices: List[MSMEInvoiceResponse]
+
+
+# Built once at import; the dashboard is validated and dumped in one call each
+MSME_COMPLIANCE_ADAPTER = TypeAdapter(MSMEComplianceResponse)
@@ -14,9 +14,9 @@ Public API
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List
 
-from sqlalchemy import select, case, asc
+from sqlalchemy import select, case, asc, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.modules.invoices.models import Invoice
@@ -27,34 +27,52 @@ from backend.modules.suppliers.models import Supplier
 # Internal helpers
 # ---------------------------------------------------------------------------
 
-async def _load_supplier(
-    db: AsyncSession,
-    supplier_id: str,
-) -> Optional[Supplier]:
-    """Fetch a supplier by its UUID primary key."""
-    result = await db.execute(
-        select(Supplier).where(Supplier.id == supplier_id)
+# Most urgent first.  Days remaining grows with msme_due_date, so ordering
+# by the stored due date gives the same order and can use
+# ix_invoices_msme_due_date, where ordering by the computed day count could
+# not.  The CASE pushes NULL due dates last on SQLite as well as PostgreSQL.
+_NULLS_LAST = case((Invoice.msme_due_date.is_(None), 1), else_=0)
+
+# Only the dashboard columns, labelled with their legacy API keys, so each
+# row maps straight onto an ``MSMEInvoiceResponse`` dict — no Invoice ORM
+# objects are built.  The supplier name comes from the same outer join.
+_INVOICES_STMT = (
+    select(
+        Invoice.invoice_number.label("id"),
+        Invoice.invoice_number,
+        func.coalesce(Supplier.legal_name, "Unknown Supplier").label("supplier_name"),
+        Invoice.msme_category,
+        Invoice.total_amount.label("amount"),
+        Invoice.due_date,
+        Invoice.msme_due_date,
+        Invoice.msme_days_remaining.label("days_remaining"),
+        Invoice.msme_status.label("status"),
+        func.coalesce(Invoice.msme_penalty_amount, 0).label("penalty_amount"),
     )
-    return result.scalar_one_or_none()
-
-
-def _build_msme_invoice_dict(
-    inv: Invoice,
-    supplier_name: str,
-) -> Dict[str, Any]:
-    """Build a single MSME invoice dict matching the legacy API shape."""
-    return {
-        "id": inv.invoice_number,
-        "invoice_number": inv.invoice_number,
-        "supplier_name": supplier_name,
-        "msme_category": inv.msme_category,
-        "amount": inv.total_amount,
-        "due_date": inv.due_date,
-        "msme_due_date": inv.msme_due_date,
-        "days_remaining": inv.msme_days_remaining,
-        "status": inv.msme_status,
-        "penalty_amount": inv.msme_penalty_amount or 0,
-    }
+    .outerjoin(Invoice.supplier)
+    .where(Invoice.is_msme_supplier.is_(True))
+    .order_by(_NULLS_LAST, asc(Invoice.msme_due_date))
+)
+
+
+def _count_status(status: str):
+    """COUNT of MSME invoices in ``status`` (CASE yields NULL otherwise)."""
+    return func.count(case((Invoice.msme_status == status, 1)))
+
+
+# Dashboard summary as a single aggregate row.  AVG skips NULL days
+# remaining, matching the previous Python average over non-null values.
+_SUMMARY_STMT = (
+    select(
+        func.count().label("total"),
+        _count_status("ON_TRACK").label("on_track"),
+        _count_status("AT_RISK").label("at_risk"),
+        _count_status("BREACHED").label("breached"),
+        func.coalesce(func.sum(Invoice.msme_penalty_amount_paise), 0).label("penalty_paise"),
+        func.avg(Invoice.msme_days_remaining).label("avg_days_remaining"),
+    )
+    .where(Invoice.is_msme_supplier.is_(True))
+)
 
 
 # ---------------------------------------------------------------------------
@@ -74,51 +92,25 @@ async def get_msme_compliance(db: AsyncSession) -> Dict[str, Any]:
     Invoices are sorted by ``msme_days_remaining`` ascending (most urgent
     first), with NULL values pushed to the end.
     """
-    # Fetch all invoices where is_msme_supplier = True, sorted by
-    # msme_days_remaining ascending with NULLs last.
-    # SQLAlchemy's ``asc(...).nullslast()`` works on PostgreSQL.
-    # For SQLite compatibility we use a CASE expression to sort NULLs last.
-    nulls_last_order = case(
-        (Invoice.msme_days_remaining.is_(None), 1),
-        else_=0,
-    )
-    result = await db.execute(
-        select(Invoice)
-        .where(Invoice.is_msme_supplier.is_(True))
-        .order_by(nulls_last_order, asc(Invoice.msme_days_remaining))
-    )
-    msme_invoices: List[Invoice] = list(result.scalars().all())
-
-    # Build per-invoice dicts, resolving supplier name via FK
-    invoices_out: List[Dict[str, Any]] = []
-    for inv in msme_invoices:
-        supplier = await _load_supplier(db, inv.supplier_id)
-        supplier_name = supplier.legal_name if supplier else "Unknown Supplier"
-        invoices_out.append(_build_msme_invoice_dict(inv, supplier_name))
-
-    # Compute summary statistics
-    total = len(invoices_out)
-    on_track = sum(1 for i in invoices_out if i["status"] == "ON_TRACK")
-    at_risk = sum(1 for i in invoices_out if i["status"] == "AT_RISK")
-    breached = sum(1 for i in invoices_out if i["status"] == "BREACHED")
-    total_penalty_exposure = sum(i["penalty_amount"] for i in invoices_out)
-
-    days_values = [
-        i["days_remaining"]
-        for i in invoices_out
-        if i["days_remaining"] is not None
-    ]
+    result = await db.execute(_INVOICES_STMT)
+    invoices_out: List[Dict[str, Any]] = [dict(row) for row in result.mappings()]
+
+    # Summary figures are aggregated by the database in one row rather
+    # than by re-walking the invoice dicts in Python.
+    summary = (await db.execute(_SUMMARY_STMT)).one()
     avg_days_remaining = (
-        round(sum(days_values) / len(days_values), 1) if days_values else 0
+        round(float(summary.avg_days_remaining), 1)
+        if summary.avg_days_remaining is not None
+        else 0
     )
 
     return {
         "summary": {
-            "total_msme_invoices": total,
-            "on_track": on_track,
-            "at_risk": at_risk,
-            "breached": breached,
-            "total_penalty_exposure": total_penalty_exposure,
+            "total_msme_invoices": summary.total,
+            "on_track": summary.on_track,
+            "at_risk": summary.at_risk,
+            "breached": summary.breached,
+            "total_penalty_exposure": summary.penalty_paise / 100,
             "avg_days_remaining": avg_days_remaining,
         },
         "invoices": invoices_out,
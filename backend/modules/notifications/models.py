@@ -6,11 +6,9 @@ Platform notifications for users — MSME alerts, EBS failures,
 approval requests, fraud warnings, etc.
 """
 
-import uuid
+from sqlalchemy import Column, String, Boolean, Text, DateTime, Index, func, text
 
-from sqlalchemy import Column, String, Boolean, Text, DateTime, func
-
-from backend.base_model import Base
+from backend.base_model import Base, new_id
 
 
 class Notification(Base):
@@ -22,9 +20,23 @@ class Notification(Base):
     """
 
     __tablename__ = "notifications"
-
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()), nullable=False)
-    user_id = Column(String(36), nullable=True, index=True)  # FK conceptual to users
+    __table_args__ = (
+        # Inbox listing: WHERE user_id = ? ORDER BY created_at DESC LIMIT n
+        # is an index range scan; also covers plain user_id lookups.
+        Index("ix_notifications_user_created", "user_id", "created_at"),
+        # Unread-only listing, unread-count polling and mark-all-read.
+        # Partial, so it only grows with unread notifications.
+        Index(
+            "ix_notifications_user_unread",
+            "user_id",
+            "created_at",
+            postgresql_where=text("is_read = false"),
+            sqlite_where=text("is_read = 0"),
+        ),
+    )
+
+    id = Column(String(36), primary_key=True, default=new_id, nullable=False)
+    user_id = Column(String(36), nullable=True)  # FK conceptual to users
     notification_type = Column(String(50), nullable=False)
     severity = Column(String(20), nullable=False, default="INFO")  # INFO / WARNING / CRITICAL
     title = Column(String(255), nullable=False)
@@ -10,11 +10,13 @@ from __future__ import annotations
 
 from typing import Any, Dict, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from backend.dependencies import get_db, get_current_user, require_role
+from backend.cache import TTL_SHORT, response_cache
+from backend.dependencies import get_db, get_current_user, get_current_user_id, require_role
 from backend.modules.notifications.schemas import (
+    NOTIFICATION_LIST_ADAPTER,
     NotificationResponse,
     NotificationCreate,
     UnreadCountResponse,
@@ -28,24 +30,31 @@ router = APIRouter(prefix="/api/notifications", tags=["notifications"])
 # GET  /api/notifications
 # ---------------------------------------------------------------------------
 
-@router.get("", response_model=List[NotificationResponse])
+@router.get("", responses={200: {"model": List[NotificationResponse]}})
 async def list_notifications(
     unread_only: bool = Query(False, description="Only return unread notifications"),
     limit: int = Query(50, ge=1, le=200),
     db: AsyncSession = Depends(get_db),
-    user: Dict[str, Any] = Depends(get_current_user),
-) -> List[NotificationResponse]:
-    """List notifications for the current user (all in dev mode)."""
-    user_id = user.get("sub")
-    if user_id == "dev-user":
-        user_id = None  # show all notifications in dev mode
+    user_id: Optional[str] = Depends(get_current_user_id),
+) -> Response:
+    """List notifications for the current user (all in dev mode).
+
+    The list is validated and dumped to JSON by the cached ``TypeAdapter``
+    in one call each, instead of per-item ``model_validate`` followed by
+    FastAPI's own response_model pass.
+    """
     items = await service.list_notifications(
         db,
         user_id=user_id,
         unread_only=unread_only,
         limit=limit,
     )
-    return [NotificationResponse.model_validate(i) for i in items]
+    return Response(
+        content=NOTIFICATION_LIST_ADAPTER.dump_json(
+            NOTIFICATION_LIST_ADAPTER.validate_python(items)
+        ),
+        media_type="application/json",
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -55,14 +64,20 @@ async def list_notifications(
 @router.get("/unread-count", response_model=UnreadCountResponse)
 async def unread_count(
     db: AsyncSession = Depends(get_db),
-    user: Dict[str, Any] = Depends(get_current_user),
+    user_id: Optional[str] = Depends(get_current_user_id),
 ) -> UnreadCountResponse:
-    """Return count of unread notifications."""
-    user_id = user.get("sub")
-    if user_id == "dev-user":
-        user_id = None
-    count = await service.get_unread_count(db, user_id=user_id)
-    return UnreadCountResponse(count=count)
+    """Return count of unread notifications.
+
+    Polled by every open dashboard, so it is served from the response
+    cache per user (short TTL); every notification write invalidates it.
+    """
+    async def _load() -> UnreadCountResponse:
+        count = await service.get_unread_count(db, user_id=user_id)
+        return UnreadCountResponse(count=count)
+
+    return await response_cache.get_or_load(
+        "notif-unread", _load, expire=TTL_SHORT, key=user_id or "",
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -112,8 +127,8 @@ async def mark_read(
 @router.post("/mark-all-read")
 async def mark_all_read(
     db: AsyncSession = Depends(get_db),
-    user: Dict[str, Any] = Depends(get_current_user),
+    user_id: Optional[str] = Depends(get_current_user_id),
 ) -> Dict[str, Any]:
-    """Mark all notifications as read for the current user."""
-    count = await service.mark_all_read(db, user_id=user.get("sub"))
+    """Mark all notifications as read for the current user (all in dev mode)."""
+    count = await service.mark_all_read(db, user_id=user_id)
     return {"marked_read": count}
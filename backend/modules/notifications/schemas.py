@@ -4,14 +4,14 @@ Notifications Module — Pydantic Schemas
 
 from __future__ import annotations
 
-from typing import Optional
+from typing import List, Optional
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, TypeAdapter
 
+from backend.base_schema import FastBase
 
-class NotificationResponse(BaseModel):
-    model_config = ConfigDict(from_attributes=True)
 
+class NotificationResponse(FastBase):
     id: str
     user_id: Optional[str] = None
     notification_type: str
@@ -23,6 +23,10 @@ class NotificationResponse(BaseModel):
     created_at: Optional[str] = None
 
 
+# Built once at import; a list response is validated and dumped in one call
+NOTIFICATION_LIST_ADAPTER = TypeAdapter(List[NotificationResponse])
+
+
 class NotificationCreate(BaseModel):
     user_id: Optional[str] = None
     notification_type: str
@@ -10,9 +10,10 @@ from __future__ import annotations
 
 from typing import Any, Dict, List, Optional
 
-from sqlalchemy import func, select, update
+from sqlalchemy import bindparam, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from backend.cache import response_cache
 from backend.modules.notifications.models import Notification
 
 
@@ -40,6 +41,7 @@ async def create_notification(
     )
     db.add(notif)
     await db.commit()
+    response_cache.clear("notif-unread")
     await db.refresh(notif)
     return _notif_to_dict(notif)
 
@@ -48,6 +50,32 @@ async def create_notification(
 # Read
 # ---------------------------------------------------------------------------
 
+def _list_stmt(by_user: bool, unread_only: bool):
+    q = select(Notification)
+    if by_user:
+        q = q.where(Notification.user_id == bindparam("user_id"))
+    if unread_only:
+        q = q.where(Notification.is_read == False)  # noqa: E712
+    return q.order_by(Notification.created_at.desc()).limit(bindparam("limit"))
+
+
+def _unread_count_stmt(by_user: bool):
+    q = select(func.count(Notification.id)).where(Notification.is_read == False)  # noqa: E712
+    if by_user:
+        q = q.where(Notification.user_id == bindparam("user_id"))
+    return q
+
+
+# Every filter combination is built once at import and executed with bound
+# parameters; nothing is reconstructed per request (unread-count is polled).
+_LIST_STMTS = {
+    (by_user, unread_only): _list_stmt(by_user, unread_only)
+    for by_user in (False, True)
+    for unread_only in (False, True)
+}
+_UNREAD_COUNT_STMTS = {by_user: _unread_count_stmt(by_user) for by_user in (False, True)}
+
+
 async def list_notifications(
     db: AsyncSession,
     user_id: Optional[str] = None,
@@ -55,14 +83,10 @@ async def list_notifications(
     limit: int = 50,
 ) -> List[Dict[str, Any]]:
     """List notifications, optionally filtered by user and read status."""
-    q = select(Notification)
-    if user_id:
-        q = q.where(Notification.user_id == user_id)
-    if unread_only:
-        q = q.where(Notification.is_read == False)  # noqa: E712
-    q = q.order_by(Notification.created_at.desc()).limit(limit)
-
-    result = await db.execute(q)
+    result = await db.execute(
+        _LIST_STMTS[bool(user_id), unread_only],
+        {"user_id": user_id, "limit": limit},
+    )
     return [_notif_to_dict(n) for n in result.scalars().all()]
 
 
@@ -71,10 +95,7 @@ async def get_unread_count(
     user_id: Optional[str] = None,
 ) -> int:
     """Count unread notifications."""
-    q = select(func.count(Notification.id)).where(Notification.is_read == False)  # noqa: E712
-    if user_id:
-        q = q.where(Notification.user_id == user_id)
-    result = await db.execute(q)
+    result = await db.execute(_UNREAD_COUNT_STMTS[bool(user_id)], {"user_id": user_id})
     return result.scalar() or 0
 
 
@@ -91,6 +112,7 @@ async def mark_read(
         return None
     notif.is_read = True
     await db.commit()
+    response_cache.clear("notif-unread")
     await db.refresh(notif)
     return _notif_to_dict(notif)
 
@@ -99,12 +121,17 @@ async def mark_all_read(
     db: AsyncSession,
     user_id: Optional[str] = None,
 ) -> int:
-    """Mark all notifications as read. Returns count of updated rows."""
+    """Mark all notifications as read. Returns count of updated rows.
+
+    One UPDATE, no rows loaded.  The session isn't synchronised: nothing in
+    this request holds Notification objects that could go stale.
+    """
     q = update(Notification).where(Notification.is_read == False).values(is_read=True)  # noqa: E712
     if user_id:
         q = q.where(Notification.user_id == user_id)
-    result = await db.execute(q)
+    result = await db.execute(q.execution_options(synchronize_session=False))
     await db.commit()
+    response_cache.clear("notif-unread")
     return result.rowcount
 
 
@@ -1,16 +1,16 @@
 """
 Payments Module — SQLAlchemy Models
-Tables: payments, payment_runs
+Tables: payments, payment_runs, payment_counters
 
 Tracks individual invoice payments and batch payment runs.
 Supports NEFT/RTGS/IMPS bank file generation.
 """
 
-import uuid
+from sqlalchemy import Column, String, Float, Integer, Text, DateTime, ForeignKey, Index
 
-from sqlalchemy import Column, String, Float, Integer, Text, DateTime, ForeignKey, func
+from sqlalchemy.orm import relationship
 
-from backend.base_model import Base, TimestampMixin
+from backend.base_model import Base, TimestampMixin, new_id
 
 
 class PaymentRun(TimestampMixin, Base):
@@ -21,8 +21,15 @@ class PaymentRun(TimestampMixin, Base):
     """
 
     __tablename__ = "payment_runs"
+    # Fetch created_at/updated_at via RETURNING at INSERT so callers don't
+    # need a refresh round-trip
+    __mapper_args__ = {"eager_defaults": True}
+    __table_args__ = (
+        # Run list: ORDER BY created_at DESC, id DESC plus the keyset cursor
+        Index("ix_payment_runs_created_id", "created_at", "id"),
+    )
 
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()), nullable=False)
+    id = Column(String(36), primary_key=True, default=new_id, nullable=False)
     run_number = Column(String(50), unique=True, nullable=False, index=True)
     payment_method = Column(String(20), nullable=False, default="NEFT")
     status = Column(String(20), nullable=False, default="DRAFT")
@@ -35,6 +42,9 @@ class PaymentRun(TimestampMixin, Base):
     completed_at = Column(DateTime, nullable=True)
     notes = Column(Text, nullable=True)
 
+    # Loaded explicitly (selectinload) by the run list; never lazily
+    payments = relationship("Payment", back_populates="payment_run", lazy="raise")
+
 
 class Payment(TimestampMixin, Base):
     """Individual invoice payment record.
@@ -43,8 +53,16 @@ class Payment(TimestampMixin, Base):
     """
 
     __tablename__ = "payments"
+    __table_args__ = (
+        # Payment list/stream: ORDER BY created_at DESC, id DESC plus the
+        # keyset cursor is a backward range scan
+        Index("ix_payments_created_id", "created_at", "id"),
+        # Summary aggregates (status buckets + SUM(net_amount)) can be
+        # answered from this index alone instead of the heap
+        Index("ix_payments_status_net_amount", "status", "net_amount"),
+    )
 
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()), nullable=False)
+    id = Column(String(36), primary_key=True, default=new_id, nullable=False)
     payment_number = Column(String(50), unique=True, nullable=False, index=True)
     invoice_id = Column(String(36), ForeignKey("invoices.id"), nullable=False, index=True)
     supplier_id = Column(String(36), ForeignKey("suppliers.id"), nullable=False, index=True)
@@ -60,3 +78,17 @@ class Payment(TimestampMixin, Base):
     ebs_voucher_ref = Column(String(50), nullable=True)  # EBS AP payment voucher
     remittance_sent = Column(String(10), nullable=False, default="NO")  # YES/NO
     notes = Column(Text, nullable=True)
+
+    payment_run = relationship("PaymentRun", back_populates="payments", lazy="raise")
+
+
+class PaymentCounter(Base):
+    """Monotonic counter backing run/payment number generation.
+
+    name: "payment_run", "payment"
+    """
+
+    __tablename__ = "payment_counters"
+
+    name = Column(String(50), primary_key=True)
+    value = Column(Integer, nullable=False, default=0)
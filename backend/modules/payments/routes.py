@@ -8,14 +8,17 @@ Payment runs, individual payments, and bank file management.
 
 from __future__ import annotations
 
-from typing import Any, Dict, List
+from typing import Any, AsyncIterator, Dict, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from backend.dependencies import get_db, get_current_user, require_role, paginate
+from backend.dependencies import get_db, get_current_user, require_role
+from backend.json_utils import fast_dumps
 from backend.modules.payments.schemas import (
-    PaymentResponse,
+    PAYMENT_LIST_PAGE_ADAPTER,
+    PAYMENT_RUN_LIST_PAGE_ADAPTER,
     PaymentRunResponse,
     PaymentSummaryResponse,
     CreatePaymentRunRequest,
@@ -33,12 +36,40 @@ router = APIRouter(prefix="/api/payments", tags=["payments"])
 async def list_payments(
     skip: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = Query(
+        None, description="next_cursor from the previous page (keyset; overrides skip)",
+    ),
     db: AsyncSession = Depends(get_db),
     _user: Dict[str, Any] = Depends(get_current_user),
-):
-    """List all individual payments."""
-    items = await service.list_payments(db)
-    return paginate([PaymentResponse.model_validate(i) for i in items], skip, limit)
+) -> Response:
+    """List individual payments, newest first, one page at a time.
+
+    The service dicts already have the ``PaymentListItem`` shape, so the
+    page is dumped to JSON in one pass by the cached ``TypeAdapter``.
+    """
+    page = await service.list_payments(db, skip=skip, limit=limit, cursor=cursor)
+    return Response(
+        content=PAYMENT_LIST_PAGE_ADAPTER.dump_json(page),
+        media_type="application/json",
+    )
+
+
+# ---------------------------------------------------------------------------
+# GET  /api/payments/stream
+# ---------------------------------------------------------------------------
+
+@router.get("/stream")
+async def stream_payments(
+    db: AsyncSession = Depends(get_db),
+    _user: Dict[str, Any] = Depends(get_current_user),
+) -> StreamingResponse:
+    """Stream every payment as NDJSON (one PaymentListItem per line)."""
+
+    async def lines() -> AsyncIterator[bytes]:
+        async for batch in service.stream_payments(db):
+            yield b"".join(fast_dumps(p) + b"\n" for p in batch)
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
 
 
 # ---------------------------------------------------------------------------
@@ -63,12 +94,21 @@ async def payment_summary(
 async def list_runs(
     skip: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = Query(
+        None, description="next_cursor from the previous page (keyset; overrides skip)",
+    ),
     db: AsyncSession = Depends(get_db),
     _user: Dict[str, Any] = Depends(get_current_user),
-):
-    """List all payment runs."""
-    items = await service.list_payment_runs(db)
-    return paginate([PaymentRunResponse.model_validate(i) for i in items], skip, limit)
+) -> Response:
+    """List payment runs, newest first, one page at a time.
+
+    Dumped straight from the service dicts like ``list_payments``.
+    """
+    page = await service.list_payment_runs(db, skip=skip, limit=limit, cursor=cursor)
+    return Response(
+        content=PAYMENT_RUN_LIST_PAGE_ADAPTER.dump_json(page),
+        media_type="application/json",
+    )
 
 
 # ---------------------------------------------------------------------------
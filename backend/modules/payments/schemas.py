@@ -4,14 +4,16 @@ Payments Module — Pydantic Schemas
 
 from __future__ import annotations
 
+from datetime import datetime
 from typing import List, Optional
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, TypeAdapter
+from typing_extensions import TypedDict
 
+from backend.base_schema import FastBase
 
-class PaymentResponse(BaseModel):
-    model_config = ConfigDict(from_attributes=True)
 
+class PaymentResponse(FastBase):
     id: str
     payment_number: str
     invoice_id: Optional[str] = None
@@ -25,16 +27,14 @@ class PaymentResponse(BaseModel):
     payment_method: str
     status: str
     bank_reference: Optional[str] = None
-    payment_date: Optional[str] = None
+    payment_date: Optional[datetime] = None
     ebs_voucher_ref: Optional[str] = None
     remittance_sent: str
     notes: Optional[str] = None
-    created_at: Optional[str] = None
+    created_at: Optional[datetime] = None
 
 
-class PaymentRunResponse(BaseModel):
-    model_config = ConfigDict(from_attributes=True)
-
+class PaymentRunResponse(FastBase):
     id: str
     run_number: str
     payment_method: str
@@ -44,11 +44,87 @@ class PaymentRunResponse(BaseModel):
     bank_file_ref: Optional[str] = None
     initiated_by: Optional[str] = None
     approved_by: Optional[str] = None
-    approved_at: Optional[str] = None
-    completed_at: Optional[str] = None
+    approved_at: Optional[datetime] = None
+    completed_at: Optional[datetime] = None
     notes: Optional[str] = None
     payments: List[PaymentResponse] = []
-    created_at: Optional[str] = None
+    created_at: Optional[datetime] = None
+
+
+# ---------------------------------------------------------------------------
+# List pages
+# ---------------------------------------------------------------------------
+
+class PaymentListItem(TypedDict):
+    """Row shape for the payment list endpoints (mirrors PaymentResponse).
+
+    A TypedDict rather than a BaseModel: the service dicts already have
+    this shape and list rows are only ever serialized, so no per-row
+    model instance is built.
+    """
+
+    id: str
+    payment_number: str
+    invoice_id: Optional[str]
+    invoice_number: Optional[str]
+    supplier_id: Optional[str]
+    supplier_name: Optional[str]
+    amount: float
+    tds_deducted: float
+    net_amount: float
+    currency: str
+    payment_method: str
+    status: str
+    bank_reference: Optional[str]
+    payment_date: Optional[datetime]
+    ebs_voucher_ref: Optional[str]
+    remittance_sent: str
+    notes: Optional[str]
+    created_at: Optional[datetime]
+
+
+class PaymentRunListItem(TypedDict):
+    """Row shape for GET /api/payments/runs (mirrors PaymentRunResponse)."""
+
+    id: str
+    run_number: str
+    payment_method: str
+    status: str
+    total_amount: float
+    invoice_count: int
+    bank_file_ref: Optional[str]
+    initiated_by: Optional[str]
+    approved_by: Optional[str]
+    approved_at: Optional[datetime]
+    completed_at: Optional[datetime]
+    notes: Optional[str]
+    payments: List[PaymentListItem]
+    created_at: Optional[datetime]
+
+
+class PaymentListPage(TypedDict):
+    """Paginated envelope returned by GET /api/payments."""
+
+    items: List[PaymentListItem]
+    total: int
+    skip: int
+    limit: int
+    next_cursor: Optional[str]
+
+
+class PaymentRunListPage(TypedDict):
+    """Paginated envelope returned by GET /api/payments/runs."""
+
+    items: List[PaymentRunListItem]
+    total: int
+    skip: int
+    limit: int
+    next_cursor: Optional[str]
+
+
+# Built once at import; reused for every list response
+PAYMENT_LIST_PAGE_ADAPTER = TypeAdapter(PaymentListPage)
+PAYMENT_RUN_LIST_PAGE_ADAPTER = TypeAdapter(PaymentRunListPage)
 
 
 class CreatePaymentRunRequest(BaseModel):
@@ -7,13 +7,19 @@ Payment run creation, individual payment tracking, bank file generation stubs.
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from operator import attrgetter
+from types import MappingProxyType
+from typing import Any, AsyncIterator, Dict, Final, List, Mapping, Optional, Tuple
 
-from sqlalchemy import func, select
+from sqlalchemy import (
+    DateTime, Select, String, and_, bindparam, case, exists, func, insert, or_, select, update,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased, selectinload
 
+from backend.base_model import new_id
 from backend.event_bus import Event, event_bus
-from backend.modules.payments.models import Payment, PaymentRun
+from backend.modules.payments.models import Payment, PaymentCounter, PaymentRun
 from backend.state_machines import validate_transition, validate_maker_checker
 from backend.modules.invoices.models import Invoice
 from backend.modules.suppliers.models import Supplier
@@ -23,22 +29,102 @@ from backend.modules.suppliers.models import Supplier
 # Counter for run/payment numbers
 # ---------------------------------------------------------------------------
 
+_BUMP_COUNTER_STMT = (
+    update(PaymentCounter)
+    .where(PaymentCounter.name == bindparam("counter_name"))
+    .values(value=PaymentCounter.value + bindparam("n"))
+    .returning(PaymentCounter.value)
+    .execution_options(synchronize_session=False)
+)
+
+
+_RUN_COUNT_STMT = select(func.count(PaymentRun.id))
+_PAYMENT_COUNT_STMT = select(func.count(Payment.id))
+
+
+async def _reserve_numbers(
+    db: AsyncSession, name: str, count_stmt: Select, n: int = 1,
+) -> int:
+    """Atomically reserve ``n`` numbers from a counter; return the first.
+
+    The UPDATE row-locks the counter until commit, so concurrent runs can't
+    hand out the same number. A missing counter is seeded from the current
+    row count so existing databases keep their numbering.
+    """
+    result = await db.execute(_BUMP_COUNTER_STMT, {"counter_name": name, "n": n})
+    last = result.scalar()
+    if last is None:
+        count_result = await db.execute(count_stmt)
+        last = (count_result.scalar() or 0) + n
+        db.add(PaymentCounter(name=name, value=last))
+        await db.flush()
+    return last - n + 1
+
+
 async def _next_run_number(db: AsyncSession) -> str:
-    result = await db.execute(select(func.count(PaymentRun.id)))
-    count = (result.scalar() or 0) + 1
-    return f"PAYRUN-{count:04d}"
+    start = await _reserve_numbers(db, "payment_run", _RUN_COUNT_STMT)
+    return f"PAYRUN-{start:04d}"
 
 
-async def _next_payment_number(db: AsyncSession) -> str:
-    result = await db.execute(select(func.count(Payment.id)))
-    count = (result.scalar() or 0) + 1
-    return f"PAY-{count:06d}"
+async def _next_payment_numbers(db: AsyncSession, n: int) -> List[str]:
+    start = await _reserve_numbers(db, "payment", _PAYMENT_COUNT_STMT, n)
+    return [f"PAY-{i:06d}" for i in range(start, start + n)]
+
+
+# ---------------------------------------------------------------------------
+# Keyset pagination
+# ---------------------------------------------------------------------------
+
+# Second handles for the cursor-row lookups
+_CursorRun = aliased(PaymentRun)
+_CursorPayment = aliased(Payment)
+
+
+def _page_after(
+    stmt: Select,
+    model: Any,
+    cursor_alias: Any,
+    cursor: Optional[str],
+    skip: int,
+) -> Select:
+    """Start ``stmt`` after the ``cursor`` row, or at OFFSET ``skip`` without one.
+
+    Compares against the cursor row's stored ``created_at`` rather than a
+    round-tripped value, so dialect storage formats can't skew the keyset.
+    """
+    if not cursor:
+        return stmt.offset(skip)
+    cursor_created_at = (
+        select(cursor_alias.created_at)
+        .where(cursor_alias.id == cursor)
+        .scalar_subquery()
+    )
+    return stmt.where(or_(
+        model.created_at < cursor_created_at,
+        and_(model.created_at == cursor_created_at, model.id < cursor),
+    ))
 
 
 # ---------------------------------------------------------------------------
 # Payment Runs
 # ---------------------------------------------------------------------------
 
+_PAYABLE_STATUSES = ("APPROVED", "POSTED_TO_EBS")
+
+# Invoice numbers are looked up in IN lists of at most this many bound
+# parameters, well under SQLite's limit and small enough for good plans
+_IN_CHUNK_SIZE = 500
+
+_PAYABLE_INVOICES_STMT = select(Invoice).where(
+    Invoice.invoice_number.in_(bindparam("invoice_numbers", expanding=True)),
+    Invoice.status.in_(_PAYABLE_STATUSES),
+)
+
+_INVOICES_EXIST_STMT = select(
+    exists().where(Invoice.invoice_number.in_(bindparam("invoice_numbers", expanding=True)))
+)
+
+
 async def create_payment_run(
     db: AsyncSession,
     invoice_numbers: List[str],
@@ -47,23 +133,31 @@ async def create_payment_run(
     notes: Optional[str] = None,
 ) -> Dict[str, Any]:
     """Create a payment run for a batch of approved invoices."""
-    # Validate invoices
-    result = await db.execute(
-        select(Invoice).where(Invoice.invoice_number.in_(invoice_numbers))
-    )
-    invoices = list(result.scalars().all())
-    if not invoices:
-        raise ValueError("No valid invoices found")
-
-    # Only process APPROVED or POSTED_TO_EBS invoices
-    payable = [inv for inv in invoices if inv.status in ("APPROVED", "POSTED_TO_EBS")]
+    # Only APPROVED or POSTED_TO_EBS invoices are fetched, in chunks
+    numbers = list(dict.fromkeys(invoice_numbers))
+    chunks = [
+        numbers[i:i + _IN_CHUNK_SIZE] for i in range(0, len(numbers), _IN_CHUNK_SIZE)
+    ]
+    payable: List[Invoice] = []
+    for chunk in chunks:
+        result = await db.scalars(_PAYABLE_INVOICES_STMT, {"invoice_numbers": chunk})
+        payable.extend(result.all())
     if not payable:
-        raise ValueError("No invoices in payable status (APPROVED or POSTED_TO_EBS)")
+        # Error path only: tell unknown invoices apart from non-payable ones
+        for chunk in chunks:
+            if await db.scalar(_INVOICES_EXIST_STMT, {"invoice_numbers": chunk}):
+                raise ValueError("No invoices in payable status (APPROVED or POSTED_TO_EBS)")
+        raise ValueError("No valid invoices found")
 
     run_number = await _next_run_number(db)
+    pay_numbers = await _next_payment_numbers(db, len(payable))
     total_amount = sum(inv.net_payable for inv in payable)
 
+    # The run's id is assigned client-side so the payment rows can reference
+    # it without an intermediate flush; the payment INSERT's autoflush
+    # writes the run first, in the same transaction
     run = PaymentRun(
+        id=new_id(),
         run_number=run_number,
         payment_method=payment_method,
         status="DRAFT",
@@ -73,31 +167,28 @@ async def create_payment_run(
         notes=notes,
     )
     db.add(run)
-    await db.flush()
-
-    # Create individual payments
-    payments = []
-    for inv in payable:
-        pay_num = await _next_payment_number(db)
-        payment = Payment(
-            payment_number=pay_num,
-            invoice_id=inv.id,
-            supplier_id=inv.supplier_id,
-            payment_run_id=run.id,
-            amount=inv.total_amount,
-            tds_deducted=inv.tds_amount,
-            net_amount=inv.net_payable,
-            currency="INR",
-            payment_method=payment_method,
-            status="PENDING",
-        )
-        db.add(payment)
-        payments.append(payment)
 
+    # Create individual payments in one INSERT ... RETURNING
+    result = await db.scalars(
+        insert(Payment).returning(Payment, sort_by_parameter_order=True),
+        [
+            {
+                "payment_number": pay_num,
+                "invoice_id": inv.id,
+                "supplier_id": inv.supplier_id,
+                "payment_run_id": run.id,
+                "amount": inv.total_amount,
+                "tds_deducted": inv.tds_amount,
+                "net_amount": inv.net_payable,
+                "currency": "INR",
+                "payment_method": payment_method,
+                "status": "PENDING",
+            }
+            for inv, pay_num in zip(payable, pay_numbers)
+        ],
+    )
+    payments = list(result.all())
     await db.commit()
-    await db.refresh(run)
-    for p in payments:
-        await db.refresh(p)
 
     await event_bus.publish(Event(
         name="payment.run_created",
@@ -108,20 +199,88 @@ async def create_payment_run(
     return await _run_to_dict(db, run, payments)
 
 
-async def list_payment_runs(db: AsyncSession) -> List[Dict[str, Any]]:
-    """List all payment runs."""
-    result = await db.execute(
-        select(PaymentRun).order_by(PaymentRun.created_at.desc())
+# Newest first with ``id`` as tie-breaker so the (created_at, id) keyset
+# cursor is total; the row count rides along as a scalar subquery.
+_LIST_RUNS_STMT = (
+    select(
+        PaymentRun,
+        select(func.count(PaymentRun.id)).correlate(None).scalar_subquery().label("total"),
+    )
+    .options(selectinload(PaymentRun.payments))
+    .order_by(PaymentRun.created_at.desc(), PaymentRun.id.desc())
+)
+
+
+async def list_payment_runs(
+    db: AsyncSession,
+    skip: int = 0,
+    limit: int = 50,
+    cursor: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Return one page of payment runs with their payments.
+
+    ``cursor`` is the ``next_cursor`` of the previous page (the id of its
+    last run) and overrides ``skip``.
+    """
+    stmt = _page_after(_LIST_RUNS_STMT, PaymentRun, _CursorRun, cursor, skip)
+    rows = (await db.execute(stmt.limit(limit))).all()
+    runs = [run for run, _ in rows]
+    if rows:
+        total = rows[0].total
+    else:
+        total = (await db.execute(_RUN_COUNT_STMT)).scalar_one()
+
+    inv_map, sup_map = await _resolve_names(db, [p for run in runs for p in run.payments])
+    return {
+        "items": [
+            await _run_to_dict(db, run, run.payments, inv_map, sup_map)
+            for run in runs
+        ],
+        "total": total,
+        "skip": skip,
+        "limit": limit,
+        "next_cursor": runs[-1].id if len(runs) == limit else None,
+    }
+
+
+_RUN_BY_NUMBER_STMT = select(PaymentRun).where(
+    PaymentRun.run_number == bindparam("run_number")
+)
+
+# populate_existing: payments already in the session are refreshed after
+# the bulk COMPLETED update below
+_RUN_PAYMENTS_STMT = (
+    select(Payment)
+    .where(Payment.payment_run_id == bindparam("run_id"))
+    .execution_options(populate_existing=True)
+)
+
+_RUN_PAYMENT_STATUSES_STMT = (
+    select(Payment.status)
+    .where(Payment.payment_run_id == bindparam("run_id"))
+    .distinct()
+)
+
+# bank_reference = UTR + last 4 of the run number + last 6 of the payment
+# number; substr(x, length(x) - 5) is the portable "last 6 characters"
+_COMPLETE_RUN_PAYMENTS_STMT = (
+    update(Payment)
+    .where(Payment.payment_run_id == bindparam("run_id"))
+    .values(
+        status="COMPLETED",
+        payment_date=bindparam("paid_at", type_=DateTime),
+        bank_reference=bindparam("utr_prefix", type_=String) + func.substr(
+            Payment.payment_number, func.length(Payment.payment_number) - 5,
+        ),
     )
-    runs = result.scalars().all()
-    out = []
-    for run in runs:
-        pay_result = await db.execute(
-            select(Payment).where(Payment.payment_run_id == run.id)
-        )
-        payments = list(pay_result.scalars().all())
-        out.append(await _run_to_dict(db, run, payments))
-    return out
+    .execution_options(synchronize_session=False)
+)
+
+_RUN_PROGRESSION: Final[Mapping[str, str]] = MappingProxyType({
+    "DRAFT": "SCHEDULED",
+    "SCHEDULED": "PROCESSING",
+    "PROCESSING": "COMPLETED",
+})
 
 
 async def process_payment_run(
@@ -130,47 +289,41 @@ async def process_payment_run(
     approved_by: Optional[str] = None,
 ) -> Dict[str, Any]:
     """Advance a payment run from DRAFT → SCHEDULED → PROCESSING → COMPLETED."""
-    result = await db.execute(
-        select(PaymentRun).where(PaymentRun.run_number == run_number)
-    )
+    result = await db.execute(_RUN_BY_NUMBER_STMT, {"run_number": run_number})
     run = result.scalar_one_or_none()
     if not run:
         raise ValueError(f"Payment run {run_number} not found")
 
-    transitions = {
-        "DRAFT": "SCHEDULED",
-        "SCHEDULED": "PROCESSING",
-        "PROCESSING": "COMPLETED",
-    }
-    next_status = transitions.get(run.status)
+    next_status = _RUN_PROGRESSION.get(run.status)
     if not next_status:
         raise ValueError(f"Cannot advance run from {run.status}")
 
     validate_transition("payment_run", run.status, next_status)
     validate_maker_checker(run.initiated_by, approved_by, "payment_run")
     run.status = next_status
+    # One timestamp for the whole step, so the run and its payments agree
+    now = datetime.utcnow()
     if next_status == "SCHEDULED":
         run.approved_by = approved_by
-        run.approved_at = datetime.utcnow()
+        run.approved_at = now
     elif next_status == "COMPLETED":
-        run.completed_at = datetime.utcnow()
-        run.bank_file_ref = f"NEFT-{run.run_number}-{datetime.utcnow().strftime('%Y%m%d')}"
-        # Mark all payments as completed
-        pay_result = await db.execute(
-            select(Payment).where(Payment.payment_run_id == run.id)
-        )
-        for pay in pay_result.scalars().all():
-            validate_transition("payment", pay.status, "COMPLETED")
-            pay.status = "COMPLETED"
-            pay.payment_date = datetime.utcnow()
-            pay.bank_reference = f"UTR{run.run_number[-4:]}{pay.payment_number[-6:]}"
+        run.completed_at = now
+        run.bank_file_ref = f"NEFT-{run.run_number}-{now:%Y%m%d}"
+        # Mark all payments as completed: validate each distinct current
+        # status once, then one UPDATE for the whole run
+        status_result = await db.execute(_RUN_PAYMENT_STATUSES_STMT, {"run_id": run.id})
+        for status in status_result.scalars().all():
+            validate_transition("payment", status, "COMPLETED")
+        await db.execute(_COMPLETE_RUN_PAYMENTS_STMT, {
+            "run_id": run.id,
+            "paid_at": now,
+            "utr_prefix": f"UTR{run.run_number[-4:]}",
+        })
 
     await db.commit()
     await db.refresh(run)
 
-    pay_result = await db.execute(
-        select(Payment).where(Payment.payment_run_id == run.id)
-    )
+    pay_result = await db.execute(_RUN_PAYMENTS_STMT, {"run_id": run.id})
     payments = list(pay_result.scalars().all())
 
     await event_bus.publish(Event(
@@ -186,100 +339,161 @@ async def process_payment_run(
 # Individual Payments
 # ---------------------------------------------------------------------------
 
-async def list_payments(db: AsyncSession) -> List[Dict[str, Any]]:
-    """List all payments with invoice/supplier details."""
-    result = await db.execute(
-        select(Payment, Invoice.invoice_number, Supplier.legal_name)
-        .join(Invoice, Invoice.id == Payment.invoice_id)
-        .outerjoin(Supplier, Supplier.id == Payment.supplier_id)
-        .order_by(Payment.created_at.desc())
+_LIST_PAYMENTS_STMT = (
+    select(
+        Payment,
+        Invoice.invoice_number,
+        Supplier.legal_name,
+        select(func.count(Payment.id)).correlate(None).scalar_subquery().label("total"),
     )
-    return [
-        {**_payment_to_dict(p), "invoice_number": inv_num, "supplier_name": sup_name}
-        for p, inv_num, sup_name in result.all()
-    ]
+    .join(Invoice, Invoice.id == Payment.invoice_id)
+    .outerjoin(Supplier, Supplier.id == Payment.supplier_id)
+    .order_by(Payment.created_at.desc(), Payment.id.desc())
+)
 
 
-async def get_payment_summary(db: AsyncSession) -> Dict[str, Any]:
-    """Payment summary statistics."""
-    total_result = await db.execute(select(func.count(Payment.id)))
-    total = total_result.scalar() or 0
+async def list_payments(
+    db: AsyncSession,
+    skip: int = 0,
+    limit: int = 50,
+    cursor: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Return one page of payments with invoice/supplier details.
+
+    ``cursor`` is the ``next_cursor`` of the previous page (the id of its
+    last payment) and overrides ``skip``.
+    """
+    stmt = _page_after(_LIST_PAYMENTS_STMT, Payment, _CursorPayment, cursor, skip)
+    rows = (await db.execute(stmt.limit(limit))).all()
+    if rows:
+        total = rows[0].total
+    else:
+        total = (await db.execute(_PAYMENT_COUNT_STMT)).scalar_one()
+
+    return {
+        "items": [
+            {**_payment_to_dict(p), "invoice_number": inv_num, "supplier_name": sup_name}
+            for p, inv_num, sup_name, _ in rows
+        ],
+        "total": total,
+        "skip": skip,
+        "limit": limit,
+        "next_cursor": rows[-1][0].id if len(rows) == limit else None,
+    }
 
-    amount_result = await db.execute(select(func.sum(Payment.net_amount)))
-    total_amount = amount_result.scalar() or 0
 
-    pending_result = await db.execute(
-        select(func.count(Payment.id)).where(Payment.status == "PENDING")
-    )
-    pending = pending_result.scalar() or 0
+# Rows are pulled off the DB cursor in batches of this size while streaming
+_STREAM_BATCH_SIZE = 1000
 
-    completed_result = await db.execute(
-        select(func.count(Payment.id)).where(Payment.status == "COMPLETED")
-    )
-    completed = completed_result.scalar() or 0
+_STREAM_PAYMENTS_STMT = (
+    select(Payment, Invoice.invoice_number, Supplier.legal_name)
+    .join(Invoice, Invoice.id == Payment.invoice_id)
+    .outerjoin(Supplier, Supplier.id == Payment.supplier_id)
+    .order_by(Payment.created_at.desc(), Payment.id.desc())
+    .execution_options(yield_per=_STREAM_BATCH_SIZE)
+)
 
-    failed_result = await db.execute(
-        select(func.count(Payment.id)).where(Payment.status == "FAILED")
-    )
-    failed = failed_result.scalar() or 0
 
-    runs_result = await db.execute(select(func.count(PaymentRun.id)))
-    total_runs = runs_result.scalar() or 0
+async def stream_payments(db: AsyncSession) -> AsyncIterator[List[Dict[str, Any]]]:
+    """Yield every payment, newest first, one DB batch at a time.
 
-    return {
-        "total_payments": total,
-        "total_amount": total_amount,
-        "pending": pending,
-        "completed": completed,
-        "failed": failed,
-        "total_runs": total_runs,
-    }
+    Uses a server-side cursor so memory stays flat however large the
+    table grows; the session must stay open until iteration finishes.
+    """
+    result = await db.stream(_STREAM_PAYMENTS_STMT)
+    async for batch in result.partitions():
+        yield [
+            {**_payment_to_dict(p), "invoice_number": inv_num, "supplier_name": sup_name}
+            for p, inv_num, sup_name in batch
+        ]
+
+
+def _count_status(status: str):
+    """COUNT of payments in ``status`` (CASE yields NULL otherwise)."""
+    return func.count(case((Payment.status == status, 1)))
+
+
+# Summary as a single aggregate row; the run count rides along as a
+# scalar subquery so the whole dashboard is one round-trip.
+_SUMMARY_STMT = select(
+    func.count(Payment.id).label("total_payments"),
+    func.coalesce(func.sum(Payment.net_amount), 0).label("total_amount"),
+    _count_status("PENDING").label("pending"),
+    _count_status("COMPLETED").label("completed"),
+    _count_status("FAILED").label("failed"),
+    select(func.count(PaymentRun.id)).scalar_subquery().label("total_runs"),
+)
+
+
+async def get_payment_summary(db: AsyncSession) -> Dict[str, Any]:
+    """Payment summary statistics."""
+    row = (await db.execute(_SUMMARY_STMT)).one()
+    return dict(row._mapping)
 
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
+# Payment dict keys are same-named Payment columns, read in one C-level
+# attrgetter call instead of a hand-written per-field copy
+_PAYMENT_COLUMNS = (
+    "id", "payment_number", "invoice_id", "supplier_id", "amount",
+    "tds_deducted", "net_amount", "currency", "payment_method", "status",
+    "bank_reference", "payment_date", "ebs_voucher_ref", "remittance_sent",
+    "notes", "created_at",
+)
+_get_payment_columns = attrgetter(*_PAYMENT_COLUMNS)
+
+
 def _payment_to_dict(p: Payment) -> Dict[str, Any]:
-    return {
-        "id": p.id,
-        "payment_number": p.payment_number,
-        "invoice_id": p.invoice_id,
-        "supplier_id": p.supplier_id,
-        "amount": p.amount,
-        "tds_deducted": p.tds_deducted,
-        "net_amount": p.net_amount,
-        "currency": p.currency,
-        "payment_method": p.payment_method,
-        "status": p.status,
-        "bank_reference": p.bank_reference,
-        "payment_date": p.payment_date.isoformat() if p.payment_date else None,
-        "ebs_voucher_ref": p.ebs_voucher_ref,
-        "remittance_sent": p.remittance_sent,
-        "notes": p.notes,
-        "created_at": p.created_at.isoformat() if p.created_at else None,
-    }
+    return dict(zip(_PAYMENT_COLUMNS, _get_payment_columns(p)))
+
+
+_INVOICE_NUMBERS_STMT = select(Invoice.id, Invoice.invoice_number).where(
+    Invoice.id.in_(bindparam("ids", expanding=True))
+)
+
+_SUPPLIER_NAMES_STMT = select(Supplier.id, Supplier.legal_name).where(
+    Supplier.id.in_(bindparam("ids", expanding=True))
+)
+
+
+async def _resolve_names(
+    db: AsyncSession, payments: List[Payment],
+) -> Tuple[Dict[str, str], Dict[str, str]]:
+    """Batch-load invoice numbers and supplier names for a set of payments."""
+    inv_ids = {p.invoice_id for p in payments}
+    sup_ids = {p.supplier_id for p in payments}
+    inv_map: Dict[str, str] = {}
+    sup_map: Dict[str, str] = {}
+    if inv_ids:
+        inv_result = await db.execute(_INVOICE_NUMBERS_STMT, {"ids": list(inv_ids)})
+        inv_map = dict(inv_result.all())
+    if sup_ids:
+        sup_result = await db.execute(_SUPPLIER_NAMES_STMT, {"ids": list(sup_ids)})
+        sup_map = dict(sup_result.all())
+    return inv_map, sup_map
 
 
 async def _run_to_dict(
-    db: AsyncSession, run: PaymentRun, payments: List[Payment],
+    db: AsyncSession,
+    run: PaymentRun,
+    payments: List[Payment],
+    inv_map: Optional[Dict[str, str]] = None,
+    sup_map: Optional[Dict[str, str]] = None,
 ) -> Dict[str, Any]:
-    # Resolve invoice numbers and supplier names
-    pay_dicts = []
-    for p in payments:
-        inv_result = await db.execute(
-            select(Invoice.invoice_number).where(Invoice.id == p.invoice_id)
-        )
-        inv_num = inv_result.scalar()
-        sup_result = await db.execute(
-            select(Supplier.legal_name).where(Supplier.id == p.supplier_id)
-        )
-        sup_name = sup_result.scalar()
-        pay_dicts.append({
+    # Resolve invoice numbers and supplier names unless the caller prefetched them
+    if inv_map is None or sup_map is None:
+        inv_map, sup_map = await _resolve_names(db, payments)
+    pay_dicts = [
+        {
             **_payment_to_dict(p),
-            "invoice_number": inv_num,
-            "supplier_name": sup_name,
-        })
+            "invoice_number": inv_map.get(p.invoice_id),
+            "supplier_name": sup_map.get(p.supplier_id),
+        }
+        for p in payments
+    ]
 
     return {
         "id": run.id,
@@ -291,9 +505,9 @@ async def _run_to_dict(
         "bank_file_ref": run.bank_file_ref,
         "initiated_by": run.initiated_by,
         "approved_by": run.approved_by,
-        "approved_at": run.approved_at.isoformat() if run.approved_at else None,
-        "completed_at": run.completed_at.isoformat() if run.completed_at else None,
+        "approved_at": run.approved_at,
+        "completed_at": run.completed_at,
         "notes": run.notes,
         "payments": pay_dicts,
-        "created_at": run.created_at.isoformat() if run.created_at else None,
+        "created_at": run.created_at,
     }
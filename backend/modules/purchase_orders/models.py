@@ -5,11 +5,10 @@ Tables: purchase_orders, po_line_items, goods_receipt_notes, grn_line_items
 Derived from the 3-record PURCHASE_ORDERS and 3-record GRNS lists in the prototype.
 """
 
-import uuid
-
 from sqlalchemy import Column, String, Integer, Float, Text, DateTime, ForeignKey, func
+from sqlalchemy.orm import relationship
 
-from backend.base_model import Base, TimestampMixin
+from backend.base_model import Base, TimestampMixin, new_id
 
 
 class PurchaseOrder(TimestampMixin, Base):
@@ -20,7 +19,7 @@ class PurchaseOrder(TimestampMixin, Base):
 
     __tablename__ = "purchase_orders"
 
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()), nullable=False)
+    id = Column(String(36), primary_key=True, default=new_id, nullable=False)
     po_number = Column(String(20), unique=True, nullable=False, index=True)  # e.g. PO2024-001
     pr_id = Column(String(36), ForeignKey("purchase_requests.id"), nullable=True, index=True)
     supplier_id = Column(String(36), ForeignKey("suppliers.id"), nullable=False, index=True)
@@ -33,13 +32,19 @@ class PurchaseOrder(TimestampMixin, Base):
     ebs_commitment_status = Column(String(20), nullable=True)  # POSTED / PENDING / FAILED
     ebs_commitment_ref = Column(String(50), nullable=True)
 
+    # Read-only (writes go through po_id).  lazy="selectin": items are wanted
+    # almost every time a PO is, and are batched for all POs in one IN query.
+    line_items = relationship(
+        "POLineItem", order_by="POLineItem.sort_order", viewonly=True, lazy="selectin",
+    )
+
 
 class POLineItem(Base):
     """Individual line item within a Purchase Order."""
 
     __tablename__ = "po_line_items"
 
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()), nullable=False)
+    id = Column(String(36), primary_key=True, default=new_id, nullable=False)
     po_id = Column(String(36), ForeignKey("purchase_orders.id"), nullable=False, index=True)
     description = Column(String(500), nullable=False)
     quantity = Column(Float, nullable=False, default=1)
@@ -55,7 +60,7 @@ class GoodsReceiptNote(TimestampMixin, Base):
 
     __tablename__ = "goods_receipt_notes"
 
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()), nullable=False)
+    id = Column(String(36), primary_key=True, default=new_id, nullable=False)
     grn_number = Column(String(20), unique=True, nullable=False, index=True)  # e.g. GRN2024-001
     po_id = Column(String(36), ForeignKey("purchase_orders.id"), nullable=False, index=True)
     received_date = Column(String(20), nullable=True)  # date string for SQLite compat
@@ -63,13 +68,16 @@ class GoodsReceiptNote(TimestampMixin, Base):
     status = Column(String(20), nullable=False, default="PARTIAL")  # PARTIAL / COMPLETE
     notes = Column(Text, nullable=True)
 
+    # Read-only (writes go through grn_id); batched like PurchaseOrder.line_items
+    line_items = relationship("GRNLineItem", viewonly=True, lazy="selectin")
+
 
 class GRNLineItem(Base):
     """Individual line item within a GRN."""
 
     __tablename__ = "grn_line_items"
 
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()), nullable=False)
+    id = Column(String(36), primary_key=True, default=new_id, nullable=False)
     grn_id = Column(String(36), ForeignKey("goods_receipt_notes.id"), nullable=False, index=True)
     description = Column(String(500), nullable=False)
     po_quantity = Column(Float, nullable=False, default=0)
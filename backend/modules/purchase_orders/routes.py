@@ -9,18 +9,20 @@ identifier, matching what the frontend sends.
 
 from __future__ import annotations
 
-from typing import Any, Dict, List
+from typing import Any, Dict, Optional
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from backend.dependencies import get_db, get_current_user, require_role, paginate
+from backend.cache import TTL_NORMAL, response_cache
+from backend.dependencies import get_db, get_current_user, require_role
 from backend.exceptions import NotFoundError
 from backend.modules.purchase_orders.schemas import (
+    PO_LIST_ADAPTER,
+    PO_LIST_PAGE_ADAPTER,
     GRNCreate,
     GRNResponse,
     PODetailResponse,
-    POResponse,
 )
 from backend.modules.purchase_orders import service
 
@@ -35,12 +37,28 @@ router = APIRouter(prefix="/api/purchase-orders", tags=["purchase-orders"])
 async def list_purchase_orders(
     skip: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = Query(
+        None, description="next_cursor from the previous page (keyset; overrides skip)",
+    ),
     db: AsyncSession = Depends(get_db),
     _user: Dict[str, Any] = Depends(get_current_user),
-):
-    """Return all purchase orders with line items and resolved codes."""
-    po_dicts = await service.list_pos(db)
-    return paginate([POResponse.model_validate(d) for d in po_dicts], skip, limit)
+) -> Response:
+    """Return purchase orders with line items and resolved codes, one page at a time.
+
+    The serialized page is served from the response cache (normal TTL),
+    keyed by the paging parameters; GRN creation and supplier updates
+    (via ``supplier.updated``) invalidate it.
+    """
+
+    async def _load() -> bytes:
+        page = await service.list_pos(db, skip=skip, limit=limit, cursor=cursor)
+        page["items"] = PO_LIST_ADAPTER.validate_python(page["items"])
+        return PO_LIST_PAGE_ADAPTER.dump_json(page)
+
+    body = await response_cache.get_or_load(
+        "po-list", _load, expire=TTL_NORMAL, key=f"{skip}:{limit}:{cursor or ''}",
+    )
+    return Response(content=body, media_type="application/json")
 
 
 # ---------------------------------------------------------------------------
@@ -21,90 +21,70 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, ConfigDict, Field, model_validator
+from pydantic import AliasChoices, BaseModel, Field, TypeAdapter
+from typing_extensions import TypedDict
+
+from backend.base_schema import FastBase
 
 
 # ---------------------------------------------------------------------------
 # Line-item response schemas
 # ---------------------------------------------------------------------------
 
-class POLineItemResponse(BaseModel):
-    """Single PO line item — field names match the legacy API contract."""
+class POLineItemResponse(FastBase):
+    """Single PO line item — field names match the legacy API contract.
 
-    model_config = ConfigDict(from_attributes=True)
+    Accepts either the legacy short names or the ORM/dict column names
+    (``description``, ``quantity``, ``grn_quantity``); the rename happens
+    in pydantic-core via ``AliasChoices``.
+    """
 
-    desc: str = Field(..., description="Line item description")
-    qty: float = Field(..., description="Ordered quantity")
+    desc: str = Field(
+        ..., description="Line item description",
+        validation_alias=AliasChoices("desc", "description"),
+    )
+    qty: float = Field(
+        ..., description="Ordered quantity",
+        validation_alias=AliasChoices("qty", "quantity"),
+    )
     unit: Optional[str] = None
     unit_price: float = 0
     total: float = 0
-    grn_qty: float = Field(0, description="Quantity received via GRN")
-
-    @model_validator(mode="before")
-    @classmethod
-    def _rename_fields(cls, data: Any) -> Any:
-        """Map ORM/dict field names to the legacy API short names."""
-        if hasattr(data, "__dict__"):
-            d = {k: v for k, v in data.__dict__.items() if not k.startswith("_")}
-        elif isinstance(data, dict):
-            d = dict(data)
-        else:
-            return data
-
-        # description → desc
-        if "description" in d and "desc" not in d:
-            d["desc"] = d.pop("description")
-        # quantity → qty
-        if "quantity" in d and "qty" not in d:
-            d["qty"] = d.pop("quantity")
-        # grn_quantity → grn_qty
-        if "grn_quantity" in d and "grn_qty" not in d:
-            d["grn_qty"] = d.pop("grn_quantity")
-
-        return d
-
-
-class GRNLineItemResponse(BaseModel):
-    """Single GRN line item — field names match the legacy API contract."""
+    grn_qty: float = Field(
+        0, description="Quantity received via GRN",
+        validation_alias=AliasChoices("grn_qty", "grn_quantity"),
+    )
 
-    model_config = ConfigDict(from_attributes=True)
-
-    desc: str = Field(..., description="Line item description")
-    po_qty: float = Field(0, description="Original PO quantity")
-    received_qty: float = Field(0, description="Quantity actually received")
-    unit: Optional[str] = None
 
-    @model_validator(mode="before")
-    @classmethod
-    def _rename_fields(cls, data: Any) -> Any:
-        """Map ORM/dict field names to the legacy API short names."""
-        if hasattr(data, "__dict__"):
-            d = {k: v for k, v in data.__dict__.items() if not k.startswith("_")}
-        elif isinstance(data, dict):
-            d = dict(data)
-        else:
-            return data
-
-        if "description" in d and "desc" not in d:
-            d["desc"] = d.pop("description")
-        if "po_quantity" in d and "po_qty" not in d:
-            d["po_qty"] = d.pop("po_quantity")
-        if "received_quantity" in d and "received_qty" not in d:
-            d["received_qty"] = d.pop("received_quantity")
+class GRNLineItemResponse(FastBase):
+    """Single GRN line item — field names match the legacy API contract."""
 
-        return d
+    desc: str = Field(
+        ..., description="Line item description",
+        validation_alias=AliasChoices("desc", "description"),
+    )
+    po_qty: float = Field(
+        0, description="Original PO quantity",
+        validation_alias=AliasChoices("po_qty", "po_quantity"),
+    )
+    received_qty: float = Field(
+        0, description="Quantity actually received",
+        validation_alias=AliasChoices("received_qty", "received_quantity"),
+    )
+    unit: Optional[str] = None
 
 
 # ---------------------------------------------------------------------------
 # GRN response schema
 # ---------------------------------------------------------------------------
 
-class GRNResponse(BaseModel):
+class GRNResponse(FastBase):
     """Goods Receipt Note — ``id`` is the human-readable ``grn_number``."""
 
-    model_config = ConfigDict(from_attributes=True)
-
-    id: str = Field(..., description="grn_number (e.g. GRN2024-001)")
+    id: str = Field(
+        ..., description="grn_number (e.g. GRN2024-001)",
+        validation_alias=AliasChoices("grn_number", "id"),
+    )
     po_id: str = Field(..., description="po_number of the parent PO")
     grn_number: str
     received_date: Optional[str] = None
@@ -113,23 +93,6 @@ class GRNResponse(BaseModel):
     notes: Optional[str] = None
     items: List[GRNLineItemResponse] = Field(default_factory=list)
 
-    @model_validator(mode="before")
-    @classmethod
-    def _translate_ids(cls, data: Any) -> Any:
-        """Ensure ``id`` equals ``grn_number`` and ``po_id`` is the po_number."""
-        if hasattr(data, "__dict__"):
-            d = {k: v for k, v in data.__dict__.items() if not k.startswith("_")}
-        elif isinstance(data, dict):
-            d = dict(data)
-        else:
-            return data
-
-        # id → grn_number
-        if "grn_number" in d:
-            d["id"] = d["grn_number"]
-
-        return d
-
 
 # ---------------------------------------------------------------------------
 # PO response schemas
@@ -139,7 +102,7 @@ class GRNResponse(BaseModel):
 # GRN creation schemas
 # ---------------------------------------------------------------------------
 
-class GRNLineItemCreate(BaseModel):
+class GRNLineItemCreate(FastBase):
     """Input for a single GRN line item."""
     description: str
     po_quantity: float
@@ -170,8 +133,6 @@ class POResponse(BaseModel):
     human-readable codes already in place.
     """
 
-    model_config = ConfigDict(from_attributes=True)
-
     id: str = Field(..., description="Same as po_number (e.g. PO2024-001)")
     po_number: str
     pr_id: Optional[str] = Field(None, description="PR number (e.g. PR2024-001)")
@@ -189,6 +150,22 @@ class POResponse(BaseModel):
     items: List[POLineItemResponse] = Field(default_factory=list)
 
 
+class POListPage(TypedDict):
+    """Paginated envelope returned by GET /api/purchase-orders."""
+
+    items: List[POResponse]
+    total: int
+    skip: int
+    limit: int
+    next_cursor: Optional[str]
+
+
+# Built once at import; validate a whole list page / dump it in one
+# pydantic-core call each
+PO_LIST_ADAPTER = TypeAdapter(List[POResponse])
+PO_LIST_PAGE_ADAPTER = TypeAdapter(POListPage)
+
+
 class PODetailResponse(POResponse):
     """Extended PO response — includes full GRN, PR, and invoices data.
 
@@ -11,11 +11,16 @@ the Pydantic schemas can serialise them directly without extra translation.
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from operator import attrgetter
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
-from sqlalchemy import select, func as sa_func
+from sqlalchemy import Row, select, func as sa_func, inspect as sa_inspect
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import lazyload, undefer
 
+from backend.cache import response_cache
+from backend.event_bus import Event
 from backend.modules.purchase_orders.models import (
     GoodsReceiptNote,
     GRNLineItem,
@@ -24,7 +29,7 @@ from backend.modules.purchase_orders.models import (
 )
 from backend.modules.purchase_requests.models import PurchaseRequest
 from backend.modules.suppliers.models import Supplier
-from backend.modules.invoices.models import Invoice
+from backend.modules.invoices.models import Invoice, invoice_to_dict
 
 
 # ---------------------------------------------------------------------------
@@ -32,7 +37,11 @@ from backend.modules.invoices.models import Invoice
 # ---------------------------------------------------------------------------
 
 def _build_po_line_items(line_items: List[POLineItem]) -> List[Dict[str, Any]]:
-    """Convert a list of POLineItem ORM objects to legacy-shaped dicts."""
+    """Convert a list of POLineItem ORM objects to legacy-shaped dicts.
+
+    Items arrive already ordered by ``sort_order`` from
+    ``_load_po_line_items``, so no Python-side sort is needed.
+    """
     return [
         {
             "desc": li.description,
@@ -42,7 +51,7 @@ def _build_po_line_items(line_items: List[POLineItem]) -> List[Dict[str, Any]]:
             "total": li.total,
             "grn_qty": li.grn_quantity,
         }
-        for li in sorted(line_items, key=lambda x: x.sort_order)
+        for li in line_items
     ]
 
 
@@ -77,6 +86,22 @@ def _build_grn_dict(
     }
 
 
+@lru_cache(maxsize=None)
+def _pr_columns() -> Tuple[Tuple[str, ...], Callable[[PurchaseRequest], Tuple[Any, ...]]]:
+    """PR column keys and a getter for them, resolved on first use.
+
+    Not at import: inspecting the mapper configures every mapper, which
+    has to wait until all model modules are imported.
+    """
+    keys = tuple(c.key for c in sa_inspect(PurchaseRequest).column_attrs)
+    return keys, attrgetter(*keys)
+
+
+def _pr_to_dict(pr: PurchaseRequest) -> Dict[str, Any]:
+    keys, get_columns = _pr_columns()
+    return dict(zip(keys, get_columns(pr)))
+
+
 async def _load_po_line_items(
     db: AsyncSession,
     po_id: str,
@@ -112,71 +137,103 @@ async def _load_grn_line_items(
     return list(result.scalars().all())
 
 
-async def _load_supplier(
-    db: AsyncSession,
-    supplier_id: str,
-) -> Optional[Supplier]:
-    """Fetch a supplier by its UUID primary key."""
-    result = await db.execute(
-        select(Supplier).where(Supplier.id == supplier_id)
-    )
-    return result.scalar_one_or_none()
-
-
 async def _load_pr(
     db: AsyncSession,
     pr_id: str,
 ) -> Optional[PurchaseRequest]:
-    """Fetch a purchase request by its UUID primary key."""
-    result = await db.execute(
-        select(PurchaseRequest).where(PurchaseRequest.id == pr_id)
+    """Fetch a purchase request by its UUID primary key (identity map first).
+
+    Line items are left unloaded — the PO detail embeds only the PR's own
+    columns.
+    """
+    return await db.get(
+        PurchaseRequest, pr_id, options=[lazyload(PurchaseRequest.items)],
     )
-    return result.scalar_one_or_none()
 
 
 async def _load_invoices_for_po(
     db: AsyncSession,
     po_id: str,
 ) -> List[Invoice]:
-    """Fetch all invoices linked to a PO."""
+    """Fetch all invoices linked to a PO, with ``fraud_reasons`` loaded."""
     result = await db.execute(
-        select(Invoice).where(Invoice.po_id == po_id)
+        select(Invoice)
+        .where(Invoice.po_id == po_id)
+        .options(undefer(Invoice.fraud_reasons_json))
     )
     return list(result.scalars().all())
 
 
-async def _build_po_summary(
+async def _bulk_load_suppliers(
     db: AsyncSession,
+    supplier_ids: Iterable[str],
+) -> Dict[str, Row]:
+    """Fetch ``(id, code, legal_name)`` for many suppliers in one IN query."""
+    ids = set(supplier_ids)
+    if not ids:
+        return {}
+    result = await db.execute(
+        select(Supplier.id, Supplier.code, Supplier.legal_name)
+        .where(Supplier.id.in_(ids))
+    )
+    return {row.id: row for row in result.all()}
+
+
+async def _bulk_load_prs(
+    db: AsyncSession,
+    pr_ids: Iterable[Optional[str]],
+) -> Dict[str, str]:
+    """Map PR UUID → pr_number for many PRs in one IN query."""
+    ids = {pr_id for pr_id in pr_ids if pr_id}
+    if not ids:
+        return {}
+    result = await db.execute(
+        select(PurchaseRequest.id, PurchaseRequest.pr_number)
+        .where(PurchaseRequest.id.in_(ids))
+    )
+    return dict(result.all())
+
+
+async def _bulk_load_grns_for_pos(
+    db: AsyncSession,
+    po_ids: Iterable[str],
+) -> Dict[str, str]:
+    """Map PO UUID → grn_number of its first GRN, for many POs in one IN query."""
+    ids = set(po_ids)
+    if not ids:
+        return {}
+    result = await db.execute(
+        select(GoodsReceiptNote.po_id, GoodsReceiptNote.grn_number)
+        .where(GoodsReceiptNote.po_id.in_(ids))
+    )
+    grn_by_po: Dict[str, str] = {}
+    for po_id, grn_number in result.all():
+        grn_by_po.setdefault(po_id, grn_number)
+    return grn_by_po
+
+
+def _assemble_po_summary(
     po: PurchaseOrder,
+    supplier: Optional[Row],
+    pr_number: Optional[str],
+    grn_number: Optional[str],
 ) -> Dict[str, Any]:
     """Build the flat PO summary dict used by the list endpoint.
 
-    Resolves FK UUIDs to human-readable codes/names:
+    Takes pre-loaded related data (see the ``_bulk_load_*`` helpers) so
+    it does no I/O; FK UUIDs are resolved to human-readable codes/names:
       - supplier_id → supplier.code
       - pr_id → purchase_request.pr_number
       - grn_id → goods_receipt_note.grn_number
+    Line items come from the ``line_items`` relationship, which is
+    selectin-loaded with the PO.
     """
-    # Load related entities
-    supplier = await _load_supplier(db, po.supplier_id)
-    supplier_code = supplier.code if supplier else po.supplier_id
-    supplier_name = supplier.legal_name if supplier else "Unknown Supplier"
-
-    pr_number: Optional[str] = None
-    if po.pr_id:
-        pr = await _load_pr(db, po.pr_id)
-        pr_number = pr.pr_number if pr else None
-
-    grn = await _load_grn_for_po(db, po.id)
-    grn_number: Optional[str] = grn.grn_number if grn else None
-
-    line_items = await _load_po_line_items(db, po.id)
-
     return {
         "id": po.po_number,
         "po_number": po.po_number,
         "pr_id": pr_number,
-        "supplier_id": supplier_code,
-        "supplier_name": supplier_name,
+        "supplier_id": supplier.code if supplier else po.supplier_id,
+        "supplier_name": supplier.legal_name if supplier else "Unknown Supplier",
         "amount": po.amount,
         "currency": po.currency,
         "status": po.status,
@@ -186,10 +243,29 @@ async def _build_po_summary(
         "grn_id": grn_number,
         "ebs_commitment_status": po.ebs_commitment_status,
         "ebs_commitment_ref": po.ebs_commitment_ref,
-        "items": _build_po_line_items(line_items),
+        "items": _build_po_line_items(po.line_items),
     }
 
 
+async def _build_po_summaries(
+    db: AsyncSession,
+    pos: List[PurchaseOrder],
+) -> List[Dict[str, Any]]:
+    """Build summaries for many POs with one query per related table."""
+    suppliers = await _bulk_load_suppliers(db, (po.supplier_id for po in pos))
+    pr_numbers = await _bulk_load_prs(db, (po.pr_id for po in pos))
+    grn_numbers = await _bulk_load_grns_for_pos(db, (po.id for po in pos))
+    return [
+        _assemble_po_summary(
+            po,
+            suppliers.get(po.supplier_id),
+            pr_numbers.get(po.pr_id) if po.pr_id else None,
+            grn_numbers.get(po.id),
+        )
+        for po in pos
+    ]
+
+
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
@@ -279,29 +355,45 @@ async def create_grn(
         po.status = "PARTIALLY_RECEIVED"
 
     await db.commit()
+    response_cache.clear("po-list")
 
     # Build response
     grn_items = await _load_grn_line_items(db, grn.id)
     return _build_grn_dict(grn, grn_items, po.po_number)
 
 
-async def list_pos(db: AsyncSession) -> List[Dict[str, Any]]:
-    """Return all Purchase Orders as legacy-shaped dicts.
+async def list_pos(
+    db: AsyncSession,
+    skip: int = 0,
+    limit: int = 50,
+    cursor: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Return one page of Purchase Orders as legacy-shaped dicts.
 
     Each PO dict contains resolved human-readable codes for supplier,
-    PR, and GRN — plus the nested ``items`` array.
+    PR, and GRN — plus the nested ``items`` array.  Pages are ordered by
+    ``po_number``; ``cursor`` (the ``next_cursor`` of the previous page,
+    i.e. its last po_number) starts the page after it and overrides
+    ``skip``.
     """
-    result = await db.execute(
-        select(PurchaseOrder).order_by(PurchaseOrder.po_number)
-    )
+    stmt = select(PurchaseOrder).order_by(PurchaseOrder.po_number)
+    if cursor:
+        stmt = stmt.where(PurchaseOrder.po_number > cursor)
+    else:
+        stmt = stmt.offset(skip)
+    result = await db.execute(stmt.limit(limit))
     pos = list(result.scalars().all())
 
-    summaries: List[Dict[str, Any]] = []
-    for po in pos:
-        summary = await _build_po_summary(db, po)
-        summaries.append(summary)
+    total_result = await db.execute(select(sa_func.count(PurchaseOrder.id)))
+    total = total_result.scalar() or 0
 
-    return summaries
+    return {
+        "items": await _build_po_summaries(db, pos),
+        "total": total,
+        "skip": skip,
+        "limit": limit,
+        "next_cursor": pos[-1].po_number if len(pos) == limit else None,
+    }
 
 
 async def get_po_by_number(
@@ -322,32 +414,40 @@ async def get_po_by_number(
     if po is None:
         return None
 
-    # Build the base summary (resolves codes, loads line items)
-    detail = await _build_po_summary(db, po)
+    # The GRN and PR are needed in full below, so load each once and take
+    # their numbers for the summary from them instead of a second lookup.
+    # (One AsyncSession runs statements serially; these stay sequential.)
+    grn = await _load_grn_for_po(db, po.id)
+    pr = await _load_pr(db, po.pr_id) if po.pr_id else None
+    suppliers = await _bulk_load_suppliers(db, [po.supplier_id])
+    detail = _assemble_po_summary(
+        po,
+        suppliers.get(po.supplier_id),
+        pr.pr_number if pr else None,
+        grn.grn_number if grn else None,
+    )
 
     # ── GRN with line items ────────────────────────────────────
-    grn = await _load_grn_for_po(db, po.id)
     grn_dict: Optional[Dict[str, Any]] = None
     if grn:
-        grn_items = await _load_grn_line_items(db, grn.id)
-        grn_dict = _build_grn_dict(grn, grn_items, po.po_number)
+        # line_items is selectin-loaded with the GRN
+        grn_dict = _build_grn_dict(grn, grn.line_items, po.po_number)
     detail["grn"] = grn_dict
 
     # ── Purchase Request ───────────────────────────────────────
-    pr_dict: Optional[Dict[str, Any]] = None
-    if po.pr_id:
-        pr = await _load_pr(db, po.pr_id)
-        if pr:
-            pr_dict = {
-                k: v for k, v in pr.__dict__.items() if not k.startswith("_")
-            }
-    detail["pr"] = pr_dict
+    detail["pr"] = _pr_to_dict(pr) if pr else None
 
     # ── Invoices linked to this PO ─────────────────────────────
     invoices = await _load_invoices_for_po(db, po.id)
-    detail["invoices"] = [
-        {k: v for k, v in inv.__dict__.items() if not k.startswith("_")}
-        for inv in invoices
-    ]
+    detail["invoices"] = [invoice_to_dict(inv) for inv in invoices]
 
     return detail
+
+
+# ---------------------------------------------------------------------------
+# Event handlers
+# ---------------------------------------------------------------------------
+
+async def on_supplier_updated(event: Event) -> None:
+    """Drop cached PO list pages; they embed supplier codes and names."""
+    response_cache.clear("po-list")
@@ -5,11 +5,10 @@ Tables: purchase_requests, pr_line_items
 Derived from the 8-record PURCHASE_REQUESTS list in the prototype.
 """
 
-import uuid
-
 from sqlalchemy import Column, String, Integer, Float, Text, DateTime, ForeignKey, func
+from sqlalchemy.orm import relationship
 
-from backend.base_model import Base, TimestampMixin
+from backend.base_model import Base, TimestampMixin, new_id
 
 
 class PurchaseRequest(TimestampMixin, Base):
@@ -20,8 +19,11 @@ class PurchaseRequest(TimestampMixin, Base):
     """
 
     __tablename__ = "purchase_requests"
+    # Fetch created_at/updated_at via RETURNING on flush so the write paths
+    # don't need a refresh round-trip
+    __mapper_args__ = {"eager_defaults": True}
 
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()), nullable=False)
+    id = Column(String(36), primary_key=True, default=new_id, nullable=False)
     pr_number = Column(String(20), unique=True, nullable=False, index=True)  # e.g. PR2024-001
     title = Column(String(500), nullable=False)
     department = Column(String(10), nullable=False)
@@ -43,13 +45,19 @@ class PurchaseRequest(TimestampMixin, Base):
     rejection_reason = Column(Text, nullable=True)
     rejected_at = Column(DateTime, nullable=True)
 
+    # Read-only (writes go through pr_id).  lazy="selectin": items are part
+    # of every PR response, and are batched for all PRs in one IN query.
+    items = relationship(
+        "PRLineItem", order_by="PRLineItem.sort_order", viewonly=True, lazy="selectin",
+    )
+
 
 class PRLineItem(Base):
     """Individual line item within a Purchase Request."""
 
     __tablename__ = "pr_line_items"
 
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()), nullable=False)
+    id = Column(String(36), primary_key=True, default=new_id, nullable=False)
     pr_id = Column(String(36), ForeignKey("purchase_requests.id"), nullable=False, index=True)
     description = Column(String(500), nullable=False)
     quantity = Column(Float, nullable=False, default=1)
@@ -9,19 +9,20 @@ identifier, matching what the legacy frontend sends.
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict
 
-from fastapi import APIRouter, Depends, Query
-from sqlalchemy import select
+from fastapi import APIRouter, Depends, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from backend.cache import TTL_NORMAL, response_cache
 from backend.dependencies import get_db, get_current_user, require_role, paginate
 from backend.exceptions import NotFoundError
-from backend.modules.budgets.models import Budget
 from backend.modules.purchase_requests.schemas import (
     PRCreate,
     PRDetailResponse,
     PRResponse,
+    PR_LIST_ADAPTER,
+    PR_LIST_PAGE_ADAPTER,
 )
 from backend.modules.purchase_requests import service
 
@@ -38,10 +39,23 @@ async def list_purchase_requests(
     limit: int = Query(50, ge=1, le=200),
     db: AsyncSession = Depends(get_db),
     _user: Dict[str, Any] = Depends(get_current_user),
-):
-    """Return all purchase requests with their line items."""
-    prs = await service.list_prs(db)
-    return paginate([PRResponse.model_validate(pr) for pr in prs], skip, limit)
+) -> Response:
+    """Return all purchase requests with their line items.
+
+    The serialized page is served from the response cache (normal TTL),
+    keyed by the paging parameters; PR create/approve/reject invalidate it.
+    """
+
+    async def _load() -> bytes:
+        prs = await service.list_prs(db)
+        page = paginate(prs, skip, limit)
+        page["items"] = PR_LIST_ADAPTER.validate_python(page["items"])
+        return PR_LIST_PAGE_ADAPTER.dump_json(page)
+
+    body = await response_cache.get_or_load(
+        "pr-list", _load, expire=TTL_NORMAL, key=f"{skip}:{limit}",
+    )
+    return Response(content=body, media_type="application/json")
 
 
 # ---------------------------------------------------------------------------
@@ -58,18 +72,12 @@ async def get_purchase_request(
 
     Includes budget information for the PR's department.
     """
-    pr = await service.get_pr_by_number(db, pr_id)
+    pr, budget_row = await service.get_pr_with_budget(db, pr_id)
     if pr is None:
         raise NotFoundError(f"Purchase Request {pr_id} not found")
 
     detail = PRDetailResponse.model_validate(pr)
 
-    # Fetch budget data for the department
-    result = await db.execute(
-        select(Budget).where(Budget.department_code == pr.department)
-    )
-    budget_row: Optional[Budget] = result.scalar_one_or_none()
-
     if budget_row is not None:
         detail.budget = {
             "dept": budget_row.department_code,
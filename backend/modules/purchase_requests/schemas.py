@@ -17,58 +17,51 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, ConfigDict, Field, model_validator
+from pydantic import AliasChoices, BaseModel, Field, TypeAdapter
+from typing_extensions import TypedDict
+
+from backend.base_schema import FastBase
 
 
 # ---------------------------------------------------------------------------
 # Line-item response
 # ---------------------------------------------------------------------------
 
-class PRLineItemResponse(BaseModel):
-    """Single line item within a PR — uses legacy field names."""
+class PRLineItemResponse(FastBase):
+    """Single line item within a PR — uses legacy field names.
 
-    model_config = ConfigDict(from_attributes=True)
+    Accepts either the legacy short names or the ORM column names
+    (``description``, ``quantity``); the rename happens in pydantic-core
+    via ``AliasChoices``.
+    """
 
-    desc: str = Field(..., description="Line-item description")
-    qty: float = Field(..., description="Quantity")
+    desc: str = Field(
+        ..., description="Line-item description",
+        validation_alias=AliasChoices("desc", "description"),
+    )
+    qty: float = Field(
+        ..., description="Quantity",
+        validation_alias=AliasChoices("qty", "quantity"),
+    )
     unit: Optional[str] = None
     unit_price: float = Field(..., description="Unit price")
 
-    @model_validator(mode="before")
-    @classmethod
-    def _remap_fields(cls, data: Any) -> Any:
-        """Map ORM column names → legacy short names expected by the frontend."""
-        if hasattr(data, "__dict__"):
-            d = {k: v for k, v in data.__dict__.items() if not k.startswith("_")}
-        elif isinstance(data, dict):
-            d = dict(data)
-        else:
-            return data
-        # description → desc
-        if "description" in d and "desc" not in d:
-            d["desc"] = d.pop("description")
-        # quantity → qty
-        if "quantity" in d and "qty" not in d:
-            d["qty"] = d.pop("quantity")
-        return d
-
 
 # ---------------------------------------------------------------------------
 # PR response (list / create)
 # ---------------------------------------------------------------------------
 
-class PRResponse(BaseModel):
+class PRResponse(FastBase):
     """Purchase Request returned by list / create endpoints.
 
     ``id`` is always equal to ``pr_number`` (e.g. "PR2024-001") — the
     frontend expects this.
     """
 
-    model_config = ConfigDict(from_attributes=True)
-
     id: str = Field(
         ...,
         description="Same as pr_number — the human-readable PR identifier.",
+        validation_alias=AliasChoices("pr_number", "id"),
     )
     title: str
     department: str
@@ -92,18 +85,20 @@ class PRResponse(BaseModel):
     rejected_at: Optional[datetime] = None
     items: List[PRLineItemResponse] = Field(default_factory=list)
 
-    @model_validator(mode="before")
-    @classmethod
-    def _set_id_to_pr_number(cls, data: Any) -> Any:
-        """Ensure ``id`` in the JSON output equals the ``pr_number`` column."""
-        if hasattr(data, "__dict__"):
-            d = {k: v for k, v in data.__dict__.items() if not k.startswith("_")}
-            d["id"] = d.get("pr_number", d.get("id"))
-            return d
-        if isinstance(data, dict):
-            data["id"] = data.get("pr_number", data.get("id"))
-            return data
-        return data
+
+class PRListPage(TypedDict):
+    """Paginated envelope returned by GET /api/purchase-requests."""
+
+    items: List[PRResponse]
+    total: int
+    skip: int
+    limit: int
+
+
+# Built once at import; validate the list / dump a page in one
+# pydantic-core call each
+PR_LIST_ADAPTER = TypeAdapter(List[PRResponse])
+PR_LIST_PAGE_ADAPTER = TypeAdapter(PRListPage)
 
 
 # ---------------------------------------------------------------------------
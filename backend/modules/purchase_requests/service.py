@@ -10,16 +10,18 @@ consumers) share one code-path.
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+from typing import List, Optional, Tuple
 
-from sqlalchemy import func, select
+from sqlalchemy import Integer, cast, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import set_committed_value
 
+from backend.cache import response_cache
 from backend.event_bus import Event, event_bus
 from backend.exceptions import NotFoundError, ValidationError
 from backend.modules.budgets.models import Budget
 from backend.state_machines import validate_transition, validate_maker_checker
-from backend.modules.purchase_requests.models import PRLineItem, PurchaseRequest
+from backend.modules.purchase_requests.models import PurchaseRequest
 from backend.modules.purchase_requests.schemas import PRCreate
 
 
@@ -27,73 +29,28 @@ from backend.modules.purchase_requests.schemas import PRCreate
 # Internal helpers
 # ---------------------------------------------------------------------------
 
-async def _load_items(db: AsyncSession, pr_id: str) -> List[PRLineItem]:
-    """Load all line items for a given PR, ordered by sort_order."""
-    result = await db.execute(
-        select(PRLineItem)
-        .where(PRLineItem.pr_id == pr_id)
-        .order_by(PRLineItem.sort_order)
-    )
-    return list(result.scalars().all())
-
-
-async def _attach_items(db: AsyncSession, pr: PurchaseRequest) -> PurchaseRequest:
-    """Attach line items as a transient ``items`` attribute on the PR object."""
-    items = await _load_items(db, pr.id)
-    # Set items as a non-column attribute so the Pydantic schema can read it
-    pr.items = items  # type: ignore[attr-defined]
-    return pr
-
-
-async def _attach_items_bulk(
-    db: AsyncSession, prs: List[PurchaseRequest]
-) -> List[PurchaseRequest]:
-    """Attach line items to every PR in the list (batched query)."""
-    if not prs:
-        return prs
+_PR_PREFIX = "PR2024-"
 
-    pr_ids = [pr.id for pr in prs]
-    result = await db.execute(
-        select(PRLineItem)
-        .where(PRLineItem.pr_id.in_(pr_ids))
-        .order_by(PRLineItem.sort_order)
+# Largest numeric suffix, compared as an integer so PR2024-1000 outranks
+# PR2024-999 (a lexical ORDER BY on pr_number would not)
+_MAX_PR_SUFFIX_STMT = select(
+    func.coalesce(
+        func.max(
+            cast(func.substr(PurchaseRequest.pr_number, len(_PR_PREFIX) + 1), Integer)
+        ),
+        0,
     )
-    all_items = list(result.scalars().all())
-
-    # Group items by pr_id
-    items_by_pr: Dict[str, List[PRLineItem]] = {}
-    for item in all_items:
-        items_by_pr.setdefault(item.pr_id, []).append(item)
-
-    for pr in prs:
-        pr.items = items_by_pr.get(pr.id, [])  # type: ignore[attr-defined]
-
-    return prs
+).where(PurchaseRequest.pr_number.like(f"{_PR_PREFIX}%"))
 
 
 async def _generate_next_pr_number(db: AsyncSession) -> str:
     """Generate the next sequential PR number (e.g. "PR2024-004").
 
-    Finds the current maximum numeric suffix among existing pr_numbers that
+    Takes the current maximum numeric suffix among existing pr_numbers that
     match the ``PR2024-nnn`` pattern and increments by one.
     """
-    result = await db.execute(
-        select(PurchaseRequest.pr_number)
-        .where(PurchaseRequest.pr_number.like("PR2024-%"))
-        .order_by(PurchaseRequest.pr_number.desc())
-    )
-    existing = result.scalars().first()
-
-    if existing is None:
-        return "PR2024-001"
-
-    # Extract numeric suffix from e.g. "PR2024-008"
-    try:
-        suffix = int(existing.split("-")[-1])
-    except (ValueError, IndexError):
-        suffix = 0
-
-    return f"PR2024-{suffix + 1:03d}"
+    suffix = (await db.execute(_MAX_PR_SUFFIX_STMT)).scalar_one()
+    return f"{_PR_PREFIX}{suffix + 1:03d}"
 
 
 async def _find_budget_for_department(
@@ -111,12 +68,14 @@ async def _find_budget_for_department(
 # ---------------------------------------------------------------------------
 
 async def list_prs(db: AsyncSession) -> List[PurchaseRequest]:
-    """Return all Purchase Requests with line items, ordered by created_at descending."""
+    """Return all Purchase Requests with line items, ordered by created_at descending.
+
+    ``items`` is selectin-loaded: one IN query covers every PR's line items.
+    """
     result = await db.execute(
         select(PurchaseRequest).order_by(PurchaseRequest.created_at.desc())
     )
-    prs = list(result.scalars().all())
-    return await _attach_items_bulk(db, prs)
+    return list(result.scalars().all())
 
 
 async def get_pr_by_number(
@@ -124,15 +83,32 @@ async def get_pr_by_number(
 ) -> Optional[PurchaseRequest]:
     """Look up a PR by its human-readable ``pr_number`` (e.g. "PR2024-001").
 
-    Returns the PR with line items attached, or None if not found.
+    Returns the PR with line items loaded, or None if not found.
     """
     result = await db.execute(
         select(PurchaseRequest).where(PurchaseRequest.pr_number == pr_number)
     )
-    pr = result.scalar_one_or_none()
-    if pr is not None:
-        await _attach_items(db, pr)
-    return pr
+    return result.scalar_one_or_none()
+
+
+async def get_pr_with_budget(
+    db: AsyncSession, pr_number: str
+) -> Tuple[Optional[PurchaseRequest], Optional[Budget]]:
+    """Look up a PR together with its department's budget in one query.
+
+    The budget is outer-joined on ``department_code``, so a PR without a
+    budget row comes back as ``(pr, None)``; an unknown PR as
+    ``(None, None)``.
+    """
+    result = await db.execute(
+        select(PurchaseRequest, Budget)
+        .outerjoin(Budget, Budget.department_code == PurchaseRequest.department)
+        .where(PurchaseRequest.pr_number == pr_number)
+    )
+    row = result.one_or_none()
+    if row is None:
+        return None, None
+    return row[0], row[1]
 
 
 # ---------------------------------------------------------------------------
@@ -179,11 +155,11 @@ async def create_pr(db: AsyncSession, data: PRCreate) -> PurchaseRequest:
         budget_available_at_time=budget_available,
     )
     db.add(pr)
-    await db.flush()
-    await db.refresh(pr)
+    await db.commit()
+    response_cache.clear("pr-list")
 
-    # Attach empty items list (newly created PR has no line items yet)
-    pr.items = []  # type: ignore[attr-defined]
+    # A new PR has no line items yet; mark the collection loaded and empty
+    set_committed_value(pr, "items", [])
 
     # Publish event
     await event_bus.publish(Event(
@@ -221,9 +197,8 @@ async def approve_pr(
     pr.approved_at = datetime.utcnow()
     pr.approver = approved_by or "Demo Approver"
 
-    await db.flush()
-    await db.refresh(pr)
-    await _attach_items(db, pr)
+    await db.commit()
+    response_cache.clear("pr-list")
 
     # Publish event
     await event_bus.publish(Event(
@@ -249,9 +224,8 @@ async def reject_pr(db: AsyncSession, pr_number: str) -> PurchaseRequest:
     pr.rejected_at = datetime.utcnow()
     pr.rejection_reason = "Rejected via demo"
 
-    await db.flush()
-    await db.refresh(pr)
-    await _attach_items(db, pr)
+    await db.commit()
+    response_cache.clear("pr-list")
 
     # Publish event
     await event_bus.publish(Event(
@@ -9,6 +9,7 @@ from __future__ import annotations
 import csv
 import io
 from datetime import datetime
+from typing import AsyncIterator
 
 from fastapi import APIRouter, Depends
 from fastapi.responses import StreamingResponse
@@ -33,51 +34,88 @@ def _csv_response(output: io.StringIO, filename: str) -> StreamingResponse:
     )
 
 
+# Export rows are pulled off the DB cursor in batches of this size and each
+# batch is sent as one CSV chunk, so memory stays flat as the table grows.
+_EXPORT_BATCH_SIZE = 500
+
+
 @router.get("/invoices/csv")
 async def export_invoices_csv(db: AsyncSession = Depends(get_db)):
-    result = await db.execute(select(Invoice).order_by(Invoice.invoice_number))
-    invoices = list(result.scalars().all())
+    result = await db.stream_scalars(
+        select(Invoice)
+        .order_by(Invoice.invoice_number)
+        .execution_options(yield_per=_EXPORT_BATCH_SIZE)
+    )
 
-    output = io.StringIO()
-    writer = csv.writer(output)
-    writer.writerow([
-        "Invoice Number", "Supplier GSTIN", "Invoice Date", "Due Date",
-        "Subtotal", "GST Amount", "TDS Amount", "Total Amount", "Net Payable",
-        "Status", "Match Status", "MSME Status", "EBS AP Status", "Created At",
-    ])
-    for inv in invoices:
+    async def chunks() -> AsyncIterator[str]:
+        output = io.StringIO()
+        writer = csv.writer(output)
         writer.writerow([
-            inv.invoice_number, inv.gstin_supplier, inv.invoice_date, inv.due_date,
-            inv.subtotal, inv.gst_amount, inv.tds_amount, inv.total_amount, inv.net_payable,
-            inv.status, inv.match_status, inv.msme_status, inv.ebs_ap_status,
-            inv.created_at.isoformat() if inv.created_at else "",
+            "Invoice Number", "Supplier GSTIN", "Invoice Date", "Due Date",
+            "Subtotal", "GST Amount", "TDS Amount", "Total Amount", "Net Payable",
+            "Status", "Match Status", "MSME Status", "EBS AP Status", "Created At",
         ])
+        async for batch in result.partitions():
+            for inv in batch:
+                writer.writerow([
+                    inv.invoice_number, inv.gstin_supplier, inv.invoice_date, inv.due_date,
+                    inv.subtotal, inv.gst_amount, inv.tds_amount, inv.total_amount, inv.net_payable,
+                    inv.status, inv.match_status, inv.msme_status, inv.ebs_ap_status,
+                    inv.created_at.isoformat() if inv.created_at else "",
+                ])
+            yield output.getvalue()
+            output.seek(0)
+            output.truncate(0)
+        if output.tell():
+            # Header only — the table is empty
+            yield output.getvalue()
 
     ts = datetime.now().strftime("%Y%m%d_%H%M%S")
-    return _csv_response(output, f"invoices_export_{ts}.csv")
+    return StreamingResponse(
+        chunks(),
+        media_type="text/csv",
+        headers={"Content-Disposition": f"attachment; filename=invoices_export_{ts}.csv"},
+    )
 
 
 @router.get("/payments/csv")
 async def export_payments_csv(db: AsyncSession = Depends(get_db)):
-    result = await db.execute(select(Payment).order_by(Payment.payment_ref))
-    payments = list(result.scalars().all())
+    result = await db.stream(
+        select(Payment, Invoice.invoice_number, Supplier.legal_name)
+        .join(Invoice, Invoice.id == Payment.invoice_id)
+        .outerjoin(Supplier, Supplier.id == Payment.supplier_id)
+        .order_by(Payment.payment_number)
+        .execution_options(yield_per=_EXPORT_BATCH_SIZE)
+    )
 
-    output = io.StringIO()
-    writer = csv.writer(output)
-    writer.writerow([
-        "Payment Ref", "Invoice Number", "Supplier Name", "Amount",
-        "Payment Method", "Status", "Paid At", "Created At",
-    ])
-    for p in payments:
+    async def chunks() -> AsyncIterator[str]:
+        output = io.StringIO()
+        writer = csv.writer(output)
         writer.writerow([
-            p.payment_ref, p.invoice_number, p.supplier_name, p.amount,
-            p.payment_method, p.status,
-            p.paid_at.isoformat() if p.paid_at else "",
-            p.created_at.isoformat() if p.created_at else "",
+            "Payment Ref", "Invoice Number", "Supplier Name", "Amount",
+            "Payment Method", "Status", "Paid At", "Created At",
         ])
+        async for batch in result.partitions():
+            for p, inv_num, sup_name in batch:
+                writer.writerow([
+                    p.payment_number, inv_num, sup_name, p.amount,
+                    p.payment_method, p.status,
+                    p.payment_date.isoformat() if p.payment_date else "",
+                    p.created_at.isoformat() if p.created_at else "",
+                ])
+            yield output.getvalue()
+            output.seek(0)
+            output.truncate(0)
+        if output.tell():
+            # Header only — the table is empty
+            yield output.getvalue()
 
     ts = datetime.now().strftime("%Y%m%d_%H%M%S")
-    return _csv_response(output, f"payments_export_{ts}.csv")
+    return StreamingResponse(
+        chunks(),
+        media_type="text/csv",
+        headers={"Content-Disposition": f"attachment; filename=payments_export_{ts}.csv"},
+    )
 
 
 @router.get("/suppliers/csv")
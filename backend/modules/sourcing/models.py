@@ -5,11 +5,9 @@ Tables: rfq_events, rfq_responses
 RFQ lifecycle management for structured vendor selection.
 """
 
-import uuid
-
 from sqlalchemy import Column, String, Float, Integer, Text, DateTime, JSON, ForeignKey, func
 
-from backend.base_model import Base, TimestampMixin
+from backend.base_model import Base, TimestampMixin, new_id
 
 
 class RFQ(TimestampMixin, Base):
@@ -20,7 +18,7 @@ class RFQ(TimestampMixin, Base):
 
     __tablename__ = "rfq_events"
 
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()), nullable=False)
+    id = Column(String(36), primary_key=True, default=new_id, nullable=False)
     rfq_number = Column(String(30), nullable=False, unique=True, index=True)
     title = Column(String(255), nullable=False)
     status = Column(String(20), nullable=False, default="DRAFT")
@@ -37,7 +35,7 @@ class RFQResponse(TimestampMixin, Base):
 
     __tablename__ = "rfq_responses"
 
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()), nullable=False)
+    id = Column(String(36), primary_key=True, default=new_id, nullable=False)
     rfq_id = Column(String(36), ForeignKey("rfq_events.id"), nullable=False, index=True)
     supplier_name = Column(String(255), nullable=False)
     quoted_amount = Column(Float, nullable=True, default=0)
@@ -4,12 +4,12 @@ Sourcing Module — Business Logic
 
 from __future__ import annotations
 
-import uuid
 from typing import List, Optional
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from backend.base_model import new_id
 from backend.modules.sourcing.models import RFQ, RFQResponse
 
 
@@ -46,7 +46,7 @@ async def create_rfq(db: AsyncSession, data: dict) -> RFQ:
     count_result = await db.execute(select(RFQ))
     count = len(list(count_result.scalars().all()))
     rfq = RFQ(
-        id=str(uuid.uuid4()),
+        id=new_id(),
         rfq_number=_next_rfq_number(count),
         **data,
     )
@@ -74,7 +74,7 @@ async def add_response(db: AsyncSession, rfq_id: str, data: dict) -> Optional[RF
     comm = data.get("commercial_score") or 0
     total = round(tech * 0.6 + comm * 0.4, 1)  # 60/40 weighting
     resp = RFQResponse(
-        id=str(uuid.uuid4()),
+        id=new_id(),
         rfq_id=rfq.id,
         total_score=total,
         submitted_at=data.pop("submitted_at", None),
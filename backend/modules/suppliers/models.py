@@ -5,11 +5,9 @@ Table: suppliers
 Derived from the 15-record SUPPLIERS list in the prototype.
 """
 
-import uuid
-
 from sqlalchemy import Column, String, Boolean, Integer, Float, DateTime, func
 
-from backend.base_model import Base, TimestampMixin
+from backend.base_model import Base, TimestampMixin, new_id
 
 
 class Supplier(TimestampMixin, Base):
@@ -20,7 +18,7 @@ class Supplier(TimestampMixin, Base):
 
     __tablename__ = "suppliers"
 
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()), nullable=False)
+    id = Column(String(36), primary_key=True, default=new_id, nullable=False)
     code = Column(String(20), unique=True, nullable=False, index=True)
     legal_name = Column(String(500), nullable=False)
     gstin = Column(String(15), unique=True, nullable=False, index=True)
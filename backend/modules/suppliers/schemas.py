@@ -14,22 +14,22 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Any, Optional
 
-from pydantic import BaseModel, ConfigDict, Field, model_validator
+from pydantic import BaseModel, Field, model_validator
+
+from backend.base_schema import FastBase
 
 
 # ---------------------------------------------------------------------------
 # Response schemas
 # ---------------------------------------------------------------------------
 
-class SupplierResponse(BaseModel):
+class SupplierResponse(FastBase):
     """Flat supplier representation returned by list / detail endpoints.
 
     ``id`` is always equal to ``code`` (e.g. "SUP001") — the frontend
     expects this.
     """
 
-    model_config = ConfigDict(from_attributes=True)
-
     id: str = Field(
         ...,
         description="Same as code — the human-readable supplier identifier (e.g. SUP001).",
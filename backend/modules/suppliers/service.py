@@ -8,9 +8,10 @@ for the suppliers domain should go through these functions so that routes
 
 from __future__ import annotations
 
-from sqlalchemy import func, select
+from sqlalchemy import exists, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from backend.event_bus import Event, event_bus
 from backend.exceptions import ConflictError, NotFoundError
 from backend.modules.suppliers.models import Supplier
 from backend.modules.suppliers.schemas import SupplierCreate, SupplierUpdate
@@ -37,11 +38,8 @@ async def get_supplier_by_code(db: AsyncSession, code: str) -> Supplier | None:
 
 
 async def get_supplier_by_id(db: AsyncSession, id: str) -> Supplier | None:
-    """Look up a supplier by its UUID primary key."""
-    result = await db.execute(
-        select(Supplier).where(Supplier.id == id)
-    )
-    return result.scalar_one_or_none()
+    """Look up a supplier by its UUID primary key (identity map first)."""
+    return await db.get(Supplier, id)
 
 
 # ---------------------------------------------------------------------------
@@ -68,6 +66,15 @@ async def _generate_next_code(db: AsyncSession) -> str:
         next_num += 1
 
 
+async def _gstin_taken(db: AsyncSession, gstin: str) -> bool:
+    """True if any supplier already uses ``gstin``.
+
+    An EXISTS probe: the database stops at the first match and no Supplier
+    row is fetched or hydrated just to be discarded.
+    """
+    return bool(await db.scalar(select(exists().where(Supplier.gstin == gstin))))
+
+
 async def create_supplier(db: AsyncSession, data: SupplierCreate) -> Supplier:
     """Insert a new supplier.
 
@@ -75,10 +82,7 @@ async def create_supplier(db: AsyncSession, data: SupplierCreate) -> Supplier:
     * Raises ``ConflictError`` if the GSTIN already exists.
     """
     # Check GSTIN uniqueness
-    existing = await db.execute(
-        select(Supplier).where(Supplier.gstin == data.gstin)
-    )
-    if existing.scalar_one_or_none() is not None:
+    if await _gstin_taken(db, data.gstin):
         raise ConflictError(f"Supplier with GSTIN {data.gstin} already exists")
 
     code = await _generate_next_code(db)
@@ -112,10 +116,7 @@ async def update_supplier(
 
     # If GSTIN is changing, verify uniqueness
     if "gstin" in update_data and update_data["gstin"] != supplier.gstin:
-        dup = await db.execute(
-            select(Supplier).where(Supplier.gstin == update_data["gstin"])
-        )
-        if dup.scalar_one_or_none() is not None:
+        if await _gstin_taken(db, update_data["gstin"]):
             raise ConflictError(
                 f"Supplier with GSTIN {update_data['gstin']} already exists"
             )
@@ -123,6 +124,15 @@ async def update_supplier(
     for field, value in update_data.items():
         setattr(supplier, field, value)
 
-    await db.flush()
+    # Commit before announcing it, so subscribers that drop cached reads
+    # (e.g. the PO list's embedded supplier names) can't re-cache old rows
+    await db.commit()
     await db.refresh(supplier)
+
+    await event_bus.publish(Event(
+        name="supplier.updated",
+        data={"code": supplier.code, "fields": sorted(update_data)},
+        source="suppliers",
+    ))
+
     return supplier
@@ -6,11 +6,9 @@ Tracks TDS deduction records per invoice/supplier.
 Supports Form 16A generation and quarterly return filing.
 """
 
-import uuid
-
 from sqlalchemy import Column, String, Float, Text, DateTime, ForeignKey, func
 
-from backend.base_model import Base, TimestampMixin
+from backend.base_model import Base, TimestampMixin, new_id
 
 
 class TDSDeduction(TimestampMixin, Base):
@@ -24,7 +22,7 @@ class TDSDeduction(TimestampMixin, Base):
 
     __tablename__ = "tds_deductions"
 
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()), nullable=False)
+    id = Column(String(36), primary_key=True, default=new_id, nullable=False)
     invoice_id = Column(String(36), ForeignKey("invoices.id"), nullable=False, index=True)
     supplier_id = Column(String(36), ForeignKey("suppliers.id"), nullable=False, index=True)
     payment_id = Column(String(36), ForeignKey("payments.id"), nullable=True, index=True)
@@ -6,12 +6,12 @@ from __future__ import annotations
 
 from typing import Optional
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel
 
+from backend.base_schema import FastBase
 
-class TDSDeductionResponse(BaseModel):
-    model_config = ConfigDict(from_attributes=True)
 
+class TDSDeductionResponse(FastBase):
     id: str
     invoice_id: Optional[str] = None
     invoice_number: Optional[str] = None
@@ -6,6 +6,7 @@ TDS deduction computation, deposit tracking, Form 16A management.
 
 from __future__ import annotations
 
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
@@ -69,10 +70,7 @@ async def create_tds_deduction(
         raise ValueError(f"Invoice {invoice_number} not found")
 
     # Load supplier for PAN
-    sup_result = await db.execute(
-        select(Supplier).where(Supplier.id == inv.supplier_id)
-    )
-    supplier = sup_result.scalar_one_or_none()
+    supplier = await db.get(Supplier, inv.supplier_id)
 
     # Determine rate
     if tds_rate is None:
@@ -137,9 +135,10 @@ async def list_deductions(
     q = q.order_by(TDSDeduction.created_at.desc())
 
     result = await db.execute(q)
+    cache = _ResolverCache()
     out = []
     for d in result.scalars().all():
-        out.append(await _deduction_to_dict(db, d))
+        out.append(await _deduction_to_dict(db, d, cache))
     return out
 
 
@@ -194,10 +193,7 @@ async def deposit_tds(
     bsr_code: Optional[str] = None,
 ) -> Dict[str, Any]:
     """Record TDS deposit against a government challan."""
-    result = await db.execute(
-        select(TDSDeduction).where(TDSDeduction.id == deduction_id)
-    )
-    ded = result.scalar_one_or_none()
+    ded = await db.get(TDSDeduction, deduction_id)
     if not ded:
         raise ValueError(f"TDS deduction {deduction_id} not found")
     if ded.status != "PENDING":
@@ -224,10 +220,7 @@ async def generate_form16a(
     deduction_id: str,
 ) -> Dict[str, Any]:
     """Generate Form 16A certificate for a deposited TDS deduction."""
-    result = await db.execute(
-        select(TDSDeduction).where(TDSDeduction.id == deduction_id)
-    )
-    ded = result.scalar_one_or_none()
+    ded = await db.get(TDSDeduction, deduction_id)
     if not ded:
         raise ValueError(f"TDS deduction {deduction_id} not found")
     if ded.status not in ("DEPOSITED", "RETURN_FILED"):
@@ -246,17 +239,41 @@ async def generate_form16a(
 # Helpers
 # ---------------------------------------------------------------------------
 
-async def _deduction_to_dict(db: AsyncSession, d: TDSDeduction) -> Dict[str, Any]:
-    # Resolve invoice number and supplier name
-    inv_result = await db.execute(
-        select(Invoice.invoice_number).where(Invoice.id == d.invoice_id)
-    )
-    inv_num = inv_result.scalar()
+@dataclass
+class _ResolverCache:
+    """Per-call memo of UUID -> display value lookups.
 
-    sup_result = await db.execute(
-        select(Supplier.legal_name).where(Supplier.id == d.supplier_id)
-    )
-    sup_name = sup_result.scalar()
+    Deductions for the same supplier (and often the same invoice) repeat
+    across a listing, so each distinct id is queried once per call rather
+    than once per row.  Never shared across requests.
+    """
+
+    invoice_numbers: Dict[str, Optional[str]] = field(default_factory=dict)
+    supplier_names: Dict[str, Optional[str]] = field(default_factory=dict)
+
+
+async def _deduction_to_dict(
+    db: AsyncSession,
+    d: TDSDeduction,
+    cache: Optional[_ResolverCache] = None,
+) -> Dict[str, Any]:
+    if cache is None:
+        cache = _ResolverCache()
+
+    # Resolve invoice number and supplier name
+    if d.invoice_id not in cache.invoice_numbers:
+        inv_result = await db.execute(
+            select(Invoice.invoice_number).where(Invoice.id == d.invoice_id)
+        )
+        cache.invoice_numbers[d.invoice_id] = inv_result.scalar()
+    inv_num = cache.invoice_numbers[d.invoice_id]
+
+    if d.supplier_id not in cache.supplier_names:
+        sup_result = await db.execute(
+            select(Supplier.legal_name).where(Supplier.id == d.supplier_id)
+        )
+        cache.supplier_names[d.supplier_id] = sup_result.scalar()
+    sup_name = cache.supplier_names[d.supplier_id]
 
     return {
         "id": d.id,
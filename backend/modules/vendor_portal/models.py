@@ -9,11 +9,9 @@ system; this table captures its events for P2P processing.
 Derived from the 6-record VENDOR_PORTAL_EVENTS list in the prototype.
 """
 
-import uuid
-
 from sqlalchemy import Column, String, Boolean, Text, DateTime, JSON, func
 
-from backend.base_model import Base
+from backend.base_model import Base, new_id
 
 
 class VendorPortalEvent(Base):
@@ -27,7 +25,7 @@ class VendorPortalEvent(Base):
 
     __tablename__ = "vendor_portal_events"
 
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()), nullable=False)
+    id = Column(String(36), primary_key=True, default=new_id, nullable=False)
     event_code = Column(String(20), nullable=True, index=True)  # e.g. "VPE001"
     event_type = Column(String(50), nullable=False)
     timestamp = Column(DateTime, nullable=True)
@@ -14,22 +14,22 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Any, Dict, Optional
 
-from pydantic import BaseModel, ConfigDict, Field, model_validator
+from pydantic import Field, model_validator
+
+from backend.base_schema import FastBase
 
 
 # ---------------------------------------------------------------------------
 # Vendor Portal event response (list endpoint)
 # ---------------------------------------------------------------------------
 
-class VendorPortalEventResponse(BaseModel):
+class VendorPortalEventResponse(FastBase):
     """Single Vendor Portal integration event — uses legacy field names.
 
     ``id`` is always equal to ``event_code`` (e.g. "VPE001") — the
     frontend expects this.
     """
 
-    model_config = ConfigDict(from_attributes=True)
-
     id: str = Field(
         ...,
         description="Same as event_code — the human-readable event identifier.",
@@ -5,11 +5,9 @@ Tables: approval_matrices, approval_instances, approval_steps
 Defines the approval routing rules and tracks live approval requests.
 """
 
-import uuid
-
 from sqlalchemy import Column, String, Boolean, Integer, Float, Text, DateTime, ForeignKey, func
 
-from backend.base_model import Base, TimestampMixin
+from backend.base_model import Base, TimestampMixin, new_id
 
 
 class ApprovalMatrix(TimestampMixin, Base):
@@ -24,7 +22,7 @@ class ApprovalMatrix(TimestampMixin, Base):
 
     __tablename__ = "approval_matrices"
 
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()), nullable=False)
+    id = Column(String(36), primary_key=True, default=new_id, nullable=False)
     entity_type = Column(String(20), nullable=False)  # PR / PO / INVOICE
     department = Column(String(10), nullable=True)  # Optional department filter
     category = Column(String(100), nullable=True)  # Optional category filter
@@ -46,7 +44,7 @@ class ApprovalInstance(TimestampMixin, Base):
 
     __tablename__ = "approval_instances"
 
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()), nullable=False)
+    id = Column(String(36), primary_key=True, default=new_id, nullable=False)
     entity_type = Column(String(20), nullable=False, index=True)  # PR / PO / INVOICE
     entity_id = Column(String(100), nullable=False, index=True)  # e.g. "PR2024-001"
     entity_ref = Column(String(36), nullable=True)  # UUID FK to the actual table row
@@ -67,7 +65,7 @@ class ApprovalStep(Base):
 
     __tablename__ = "approval_steps"
 
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()), nullable=False)
+    id = Column(String(36), primary_key=True, default=new_id, nullable=False)
     instance_id = Column(String(36), ForeignKey("approval_instances.id"), nullable=False, index=True)
     level = Column(Integer, nullable=False)
     approver_role = Column(String(50), nullable=False)
@@ -8,16 +8,16 @@ from __future__ import annotations
 
 from typing import List, Optional
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel
+
+from backend.base_schema import FastBase
 
 
 # ---------------------------------------------------------------------------
 # Approval Matrix
 # ---------------------------------------------------------------------------
 
-class ApprovalMatrixResponse(BaseModel):
-    model_config = ConfigDict(from_attributes=True)
-
+class ApprovalMatrixResponse(FastBase):
     id: str
     entity_type: str
     department: Optional[str] = None
@@ -44,9 +44,7 @@ class ApprovalMatrixCreate(BaseModel):
 # Approval Step
 # ---------------------------------------------------------------------------
 
-class ApprovalStepResponse(BaseModel):
-    model_config = ConfigDict(from_attributes=True)
-
+class ApprovalStepResponse(FastBase):
     id: str
     level: int
     approver_role: str
@@ -60,9 +58,7 @@ class ApprovalStepResponse(BaseModel):
 # Approval Instance
 # ---------------------------------------------------------------------------
 
-class ApprovalInstanceResponse(BaseModel):
-    model_config = ConfigDict(from_attributes=True)
-
+class ApprovalInstanceResponse(FastBase):
     id: str
     entity_type: str
     entity_id: str
@@ -950,7 +950,6 @@ def build_invoices() -> list[Invoice]:
             rejection_reason=None,
             is_msme_supplier=False,
             msme_category=None,
-            msme_days_remaining=None,
             msme_due_date=None,
             msme_status=None,
             msme_penalty_amount=0,
@@ -1001,7 +1000,6 @@ def build_invoices() -> list[Invoice]:
             rejection_reason=None,
             is_msme_supplier=True,
             msme_category="MICRO",
-            msme_days_remaining=38,
             msme_due_date=future(38),
             msme_status="ON_TRACK",
             msme_penalty_amount=0,
@@ -1052,7 +1050,6 @@ def build_invoices() -> list[Invoice]:
             rejection_reason=None,
             is_msme_supplier=False,
             msme_category=None,
-            msme_days_remaining=None,
             msme_due_date=None,
             msme_status=None,
             msme_penalty_amount=0,
@@ -1103,7 +1100,6 @@ def build_invoices() -> list[Invoice]:
             rejection_reason=None,
             is_msme_supplier=True,
             msme_category="SMALL",
-            msme_days_remaining=28,
             msme_due_date=future(28),
             msme_status="ON_TRACK",
             msme_penalty_amount=0,
@@ -1154,7 +1150,6 @@ def build_invoices() -> list[Invoice]:
             rejection_reason=None,
             is_msme_supplier=True,
             msme_category="MICRO",
-            msme_days_remaining=-2,
             msme_due_date=past(2),
             msme_status="BREACHED",
             msme_penalty_amount=3326,
@@ -1210,7 +1205,6 @@ def build_invoices() -> list[Invoice]:
             rejection_reason=None,
             is_msme_supplier=True,
             msme_category="MICRO",
-            msme_days_remaining=8,
             msme_due_date=future(8),
             msme_status="AT_RISK",
             msme_penalty_amount=0,
@@ -1261,7 +1255,6 @@ def build_invoices() -> list[Invoice]:
             rejection_reason=None,
             is_msme_supplier=True,
             msme_category="SMALL",
-            msme_days_remaining=29,
             msme_due_date=future(29),
             msme_status="ON_TRACK",
             msme_penalty_amount=0,